@@ -6,25 +6,144 @@ Authentication tools are in tools/auth_tools.py.
 """
 
 import asyncio
+import io
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple
 
 from .auth import (
     get_script_service,
     get_drive_service,
 )
+from .auth.service_adapter import _resolve_default_user
+from .core.cache import TTLCache
+from .core.executor import run_api_call
 
 # Import directly to avoid circular imports through tools/__init__.py
 from .tools.error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of calls Google accepts in one batch HTTP request
+_BATCH_LIMIT = 100
+
+# Concurrent deployments in create_deployments_bulk, kept low for API quotas
+_BULK_DEPLOY_CONCURRENCY = 10
+
+
+class _CachedContent:
+    """A project's fetched files (with sources), also indexed by name."""
+
+    __slots__ = ("files", "files_by_name")
+
+    def __init__(self, content: Dict[str, Any]):
+        self.files: List[Dict[str, Any]] = content.get("files", [])
+        # Reversed so the first file with a given name wins, as in a scan
+        self.files_by_name = {file.get("name"): file for file in reversed(self.files)}
+
+
+# Project content fetches (all sources) reused by the project and content
+# tools, keyed by (user, script ID); writes to a project evict it for every
+# user, and storing new credentials clears the cache
+_project_cache: TTLCache[_CachedContent] = TTLCache(maxsize=256, ttl=60)
+
+
+def evict_script_project(script_id: str) -> None:
+    """Drop cached content of script_id, for every user."""
+    _project_cache.pop_where(lambda key, content: key[1] == script_id)
+
+
+def clear_project_cache() -> None:
+    """Forget all cached project content."""
+    _project_cache.clear()
+
+
+# Debounce window for update_script_content(flush_immediately=False)
+_COALESCE_DELAY = 0.1
+
+
+class _PendingUpdate:
+    """Files queued for one script's next updateContent call."""
+
+    __slots__ = ("files", "future")
+
+    def __init__(self, future: "asyncio.Future[Dict[str, Any]]"):
+        self.files: Dict[Optional[str], Dict[str, str]] = {}
+        self.future = future
+
+
+_pending_updates: Dict[str, _PendingUpdate] = {}
+
+# Keep flush tasks referenced until they finish
+_flush_tasks: Set[asyncio.Task] = set()
+
+# projects.get field mask: the project metadata get_script_project prints
+_PROJECT_FIELDS = "scriptId,title,creator,createTime,updateTime"
+
+# projects.getContent field masks: file names only, or sources too (dropping
+# per-file function sets and timestamps)
+_CONTENT_SUMMARY_FIELDS = "files(name,type)"
+_CONTENT_SOURCE_FIELDS = "files(name,type,source)"
+
+# List field masks limited to what the listings print; deployments would
+# otherwise carry their full deploymentConfig and entryPoints
+_DEPLOYMENT_LIST_FIELDS = (
+    "nextPageToken,deployments(deploymentId,updateTime,deploymentConfig/description)"
+)
+_VERSION_LIST_FIELDS = "nextPageToken,versions(versionNumber,description,createTime)"
+_PROCESS_LIST_FIELDS = (
+    "nextPageToken,processes(functionName,processStatus,startTime,duration)"
+)
+
 
 # ============================================================================
 # Apps Script Project Tools
 # ============================================================================
 
 
+async def _list_script_files(
+    page_size: int, page_token: Optional[str]
+) -> Dict[str, Any]:
+    """List Apps Script files via the Drive API."""
+    service = await run_api_call(get_drive_service)
+
+    query = "mimeType='application/vnd.google-apps.script' and trashed=false"
+    request_params = {
+        "q": query,
+        "pageSize": page_size,
+        "fields": "nextPageToken, files(id, name, createdTime, modifiedTime)",
+        "orderBy": "modifiedTime desc",
+    }
+    if page_token:
+        request_params["pageToken"] = page_token
+
+    return await run_api_call(service.files().list(**request_params).execute)
+
+
+def _describe_file(file: Dict[str, Any]) -> str:
+    """Format a project file as "name (TYPE)"."""
+    return f"{file.get('name', 'Untitled')} ({file.get('type', 'Unknown')})"
+
+
+def _script_session() -> Tuple[Any, Optional[str]]:
+    """Get the script service and the user whose cached content it may use."""
+    return get_script_service(), _resolve_default_user()
+
+
+async def _get_content(script_id: str) -> _CachedContent:
+    """Fetch a project's files with sources, served from cache when fresh."""
+    service, user = await run_api_call(_script_session)
+    cached = _project_cache.get((user, script_id))
+    if cached is None:
+        content = await run_api_call(
+            service.projects()
+            .getContent(scriptId=script_id, fields=_CONTENT_SOURCE_FIELDS)
+            .execute
+        )
+        cached = _CachedContent(content)
+        _project_cache.set((user, script_id), cached)
+    return cached
+
+
 @handle_errors
 async def list_script_projects(
     page_size: int = 50,
@@ -42,59 +161,134 @@ async def list_script_projects(
     Returns:
         str: Formatted list of script projects
     """
-    service = get_drive_service()
+    response = await _list_script_files(page_size, page_token)
 
-    query = "mimeType='application/vnd.google-apps.script' and trashed=false"
-    request_params = {
-        "q": query,
-        "pageSize": page_size,
-        "fields": "nextPageToken, files(id, name, createdTime, modifiedTime)",
-        "orderBy": "modifiedTime desc",
-    }
-    if page_token:
-        request_params["pageToken"] = page_token
+    files = response.get("files", [])
+
+    if not files:
+        return "No Apps Script projects found."
+
+    entries = "\n".join(
+        f"- {file.get('name', 'Untitled')} (ID: {file.get('id', 'Unknown ID')})"
+        f" Created: {file.get('createdTime', 'Unknown')}"
+        f" Modified: {file.get('modifiedTime', 'Unknown')}"
+        for file in files
+    )
+    result = f"Found {len(files)} Apps Script projects:\n{entries}"
+
+    if "nextPageToken" in response:
+        result += f"\n\nNext page token: {response['nextPageToken']}"
+
+    return result
+
+
+@handle_errors
+async def list_script_projects_with_details(
+    page_size: int = 50,
+    page_token: Optional[str] = None,
+) -> str:
+    """
+    List Apps Script projects together with their file listings.
+
+    File listings are fetched with batched projects.getContent requests
+    (up to 100 per HTTP call) instead of one request per project.
+
+    Args:
+        page_size: Number of results per page (default: 50)
+        page_token: Token for pagination (optional)
 
-    response = await asyncio.to_thread(service.files().list(**request_params).execute)
+    Returns:
+        str: Formatted list of script projects with their files
+    """
+    response = await _list_script_files(page_size, page_token)
 
     files = response.get("files", [])
 
     if not files:
         return "No Apps Script projects found."
 
-    output = [f"Found {len(files)} Apps Script projects:"]
-    for file in files:
-        title = file.get("name", "Untitled")
-        script_id = file.get("id", "Unknown ID")
-        create_time = file.get("createdTime", "Unknown")
-        update_time = file.get("modifiedTime", "Unknown")
+    service = await run_api_call(get_script_service)
 
-        output.append(
-            f"- {title} (ID: {script_id}) Created: {create_time} Modified: {update_time}"
+    contents: Dict[str, Dict[str, Any]] = {}
+
+    def collect(request_id, content, exception):
+        if exception is not None:
+            logger.warning(f"Could not fetch project {request_id}: {exception}")
+            return
+        contents[request_id] = content
+
+    for start in range(0, len(files), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=collect)
+        for file in files[start : start + _BATCH_LIMIT]:
+            batch.add(
+                service.projects().getContent(
+                    scriptId=file["id"], fields=_CONTENT_SUMMARY_FIELDS
+                ),
+                request_id=file["id"],
+            )
+        await run_api_call(batch.execute)
+
+    def describe(file: Dict[str, Any]) -> str:
+        script_id = file.get("id", "Unknown ID")
+        content = contents.get(script_id)
+        if content is None:
+            project_files = "(unavailable)"
+        else:
+            project_files = (
+                ", ".join(map(_describe_file, content.get("files", []))) or "(none)"
+            )
+        return (
+            f"- {file.get('name', 'Untitled')} (ID: {script_id})"
+            f" Modified: {file.get('modifiedTime', 'Unknown')}\n"
+            f"  Files: {project_files}"
         )
 
+    entries = "\n".join(map(describe, files))
+    result = f"Found {len(files)} Apps Script projects:\n{entries}"
+
     if "nextPageToken" in response:
-        output.append(f"\nNext page token: {response['nextPageToken']}")
+        result += f"\n\nNext page token: {response['nextPageToken']}"
 
-    return "\n".join(output)
+    return result
 
 
 @handle_errors
 async def get_script_project(script_id: str) -> str:
     """
-    Retrieve complete project details including all source files.
+    Retrieve project details and the list of files it contains.
+
+    Metadata and the file list are fetched concurrently; a cached content
+    fetch supplies the file list instead. File sources are not downloaded;
+    use get_script_content to read one.
 
     Args:
         script_id: The script project ID
 
     Returns:
-        str: Formatted project details with all file contents
+        str: Formatted project details with its file list
     """
-    service = get_script_service()
-
-    project = await asyncio.to_thread(
-        service.projects().get(scriptId=script_id).execute
+    service, user = await run_api_call(_script_session)
+    projects = service.projects()
+    get_metadata = run_api_call(
+        projects.get(scriptId=script_id, fields=_PROJECT_FIELDS).execute
     )
 
+    # Project resources carry no files; those come from the project content
+    cached = _project_cache.get((user, script_id))
+    if cached is not None:
+        project = await get_metadata
+        files = cached.files
+    else:
+        project, content = await asyncio.gather(
+            get_metadata,
+            run_api_call(
+                projects.getContent(
+                    scriptId=script_id, fields=_CONTENT_SUMMARY_FIELDS
+                ).execute
+            ),
+        )
+        files = content.get("files", [])
+
     title = project.get("title", "Untitled")
     project_script_id = project.get("scriptId", "Unknown")
     creator = project.get("creator", {}).get("email", "Unknown")
@@ -110,16 +304,11 @@ async def get_script_project(script_id: str) -> str:
         "Files:",
     ]
 
-    files = project.get("files", [])
-    for i, file in enumerate(files, 1):
-        file_name = file.get("name", "Untitled")
-        file_type = file.get("type", "Unknown")
-        source = file.get("source", "")
+    output.extend(f"{i}. {_describe_file(file)}" for i, file in enumerate(files, 1))
 
-        output.append(f"{i}. {file_name} ({file_type})")
-        if source:
-            output.append(f"   {source[:200]}{'...' if len(source) > 200 else ''}")
-            output.append("")
+    if files:
+        output.append("")
+        output.append("(source omitted - use get_script_content to read a file)")
 
     return "\n".join(output)
 
@@ -136,20 +325,9 @@ async def get_script_content(script_id: str, file_name: str) -> str:
     Returns:
         str: File content as string
     """
-    service = get_script_service()
-
-    project = await asyncio.to_thread(
-        service.projects().get(scriptId=script_id).execute
-    )
-
-    files = project.get("files", [])
-    target_file = None
-
-    for file in files:
-        if file.get("name") == file_name:
-            target_file = file
-            break
+    cached = await _get_content(script_id)
 
+    target_file = cached.files_by_name.get(file_name)
     if not target_file:
         return f"File '{file_name}' not found in project {script_id}"
 
@@ -161,6 +339,44 @@ async def get_script_content(script_id: str, file_name: str) -> str:
     return "\n".join(output)
 
 
+@handle_errors
+async def bulk_get_script_contents(script_id: str, file_names: List[str]) -> str:
+    """
+    Retrieve the content of several files within a project in one call.
+
+    The project's content is fetched once (or served from cache) and every
+    requested file is read from that single response.
+
+    Args:
+        script_id: The script project ID
+        file_names: Names of the files to retrieve
+
+    Returns:
+        str: Each file's content, followed by any names that were not found
+    """
+    if not file_names:
+        return "No file names provided."
+
+    files_by_name = (await _get_content(script_id)).files_by_name
+
+    sections = []
+    missing = []
+    for file_name in file_names:
+        file = files_by_name.get(file_name)
+        if file is None:
+            missing.append(file_name)
+            continue
+        sections.append(
+            f"File: {file_name} ({file.get('type', 'Unknown')})\n\n"
+            f"{file.get('source', '')}"
+        )
+
+    if missing:
+        sections.append(f"Not found in project {script_id}: {', '.join(missing)}")
+
+    return "\n\n".join(sections)
+
+
 @handle_errors
 async def create_script_project(
     title: str,
@@ -176,16 +392,14 @@ async def create_script_project(
     Returns:
         str: Formatted string with new project details
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
     request_body = {"title": title}
 
     if parent_id:
         request_body["parentId"] = parent_id
 
-    project = await asyncio.to_thread(
-        service.projects().create(body=request_body).execute
-    )
+    project = await run_api_call(service.projects().create(body=request_body).execute)
 
     script_id = project.get("scriptId", "Unknown")
     edit_url = f"https://script.google.com/d/{script_id}/edit"
@@ -212,44 +426,103 @@ async def delete_script_project(script_id: str) -> str:
     Returns:
         str: Confirmation message
     """
-    service = get_drive_service()
+    service = await run_api_call(get_drive_service)
 
     # Apps Script projects are stored as Drive files
-    await asyncio.to_thread(service.files().delete(fileId=script_id).execute)
+    await run_api_call(service.files().delete(fileId=script_id).execute)
+    evict_script_project(script_id)
 
     return f"Deleted Apps Script project: {script_id}"
 
 
+async def _send_content_update(
+    script_id: str, files: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """Replace a project's files with one updateContent call."""
+    service = await run_api_call(get_script_service)
+
+    request_body = {"files": files}
+
+    updated_content = await run_api_call(
+        service.projects().updateContent(scriptId=script_id, body=request_body).execute
+    )
+    evict_script_project(script_id)
+    return updated_content
+
+
+async def _flush_content_update(script_id: str) -> None:
+    """Send the merged files queued for script_id and wake every waiter."""
+    pending = _pending_updates.pop(script_id)
+    try:
+        result = await _send_content_update(script_id, list(pending.files.values()))
+    except asyncio.CancelledError:
+        pending.future.cancel()
+        raise
+    except Exception as e:
+        pending.future.set_exception(e)
+    else:
+        pending.future.set_result(result)
+
+
+def _start_flush(loop: asyncio.AbstractEventLoop, script_id: str) -> None:
+    """Start the flush for script_id, keeping its task alive until done."""
+    task = loop.create_task(_flush_content_update(script_id))
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+async def _queue_content_update(
+    script_id: str, files: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """Merge files into the pending update for script_id and await its flush."""
+    loop = asyncio.get_running_loop()
+    pending = _pending_updates.get(script_id)
+    if pending is None:
+        pending = _PendingUpdate(loop.create_future())
+        _pending_updates[script_id] = pending
+        loop.call_later(_COALESCE_DELAY, _start_flush, loop, script_id)
+
+    # Later calls win for files they share with earlier ones
+    for file in files:
+        pending.files[file.get("name")] = file
+
+    # Shielded so one cancelled caller does not cancel the shared update
+    return await asyncio.shield(pending.future)
+
+
 @handle_errors
 async def update_script_content(
     script_id: str,
     files: List[Dict[str, str]],
+    flush_immediately: bool = True,
 ) -> str:
     """
     Update or create files in a script project.
 
+    With flush_immediately=False, calls for the same script made within
+    100 ms are merged by file name and sent as one updateContent request;
+    every caller receives the result of that request.
+
     Args:
         script_id: The script project ID
         files: List of file objects with name, type, and source
                Example: [{"name": "Code", "type": "SERVER_JS", "source": "function main() {}"}]
+        flush_immediately: Send this update on its own right away (default).
+            Pass False to coalesce rapid successive edits.
 
     Returns:
         str: Formatted string confirming update with file list
     """
-    service = get_script_service()
-
-    request_body = {"files": files}
-
-    updated_content = await asyncio.to_thread(
-        service.projects().updateContent(scriptId=script_id, body=request_body).execute
-    )
+    if flush_immediately:
+        updated_content = await _send_content_update(script_id, files)
+    else:
+        updated_content = await _queue_content_update(script_id, files)
 
     output = [f"Updated script project: {script_id}", "", "Modified files:"]
 
-    for file in updated_content.get("files", []):
-        file_name = file.get("name", "Untitled")
-        file_type = file.get("type", "Unknown")
-        output.append(f"- {file_name} ({file_type})")
+    output.extend(
+        f"- {_describe_file(file)}" for file in updated_content.get("files", [])
+    )
 
     return "\n".join(output)
 
@@ -275,7 +548,7 @@ async def run_script_function(
     Returns:
         str: Formatted string with execution result or error
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
     request_body = {"function": function_name, "devMode": dev_mode}
 
@@ -283,25 +556,21 @@ async def run_script_function(
         request_body["parameters"] = parameters
 
     try:
-        response = await asyncio.to_thread(
+        response = await run_api_call(
             service.scripts().run(scriptId=script_id, body=request_body).execute
         )
 
-        if "error" in response:
-            error_details = response["error"]
-            error_message = error_details.get("message", "Unknown error")
+        error = response.get("error")
+        if error is not None:
+            error_message = error.get("message", "Unknown error")
             return (
                 f"Execution failed\nFunction: {function_name}\nError: {error_message}"
             )
 
-        result = response.get("response", {}).get("result")
-        output = [
-            "Execution successful",
-            f"Function: {function_name}",
-            f"Result: {result}",
-        ]
+        result_body = response.get("response")
+        result = result_body.get("result") if result_body else None
 
-        return "\n".join(output)
+        return f"Execution successful\nFunction: {function_name}\nResult: {result}"
 
     except Exception as e:
         return f"Execution failed\nFunction: {function_name}\nError: {str(e)}"
@@ -317,37 +586,43 @@ async def create_deployment(
     script_id: str,
     description: str,
     version_description: Optional[str] = None,
+    version_number: Optional[int] = None,
 ) -> str:
     """
     Create a new deployment of the script.
 
+    By default a new version is created first and then deployed. Passing an
+    existing version_number skips the version creation round trip.
+
     Args:
         script_id: The script project ID
         description: Deployment description
         version_description: Optional version description
+        version_number: Optional existing version to deploy instead of
+            creating a new one
 
     Returns:
         str: Formatted string with deployment details
     """
-    service = get_script_service()
-
-    # First, create a new version
-    version_body = {"description": version_description or description}
-    version = await asyncio.to_thread(
-        service.projects()
-        .versions()
-        .create(scriptId=script_id, body=version_body)
-        .execute
-    )
-    version_number = version.get("versionNumber")
+    service = await run_api_call(get_script_service)
+
+    if version_number is None:
+        # Create a new version; the deployment needs its number
+        version_body = {"description": version_description or description}
+        version = await run_api_call(
+            service.projects()
+            .versions()
+            .create(scriptId=script_id, body=version_body)
+            .execute
+        )
+        version_number = version.get("versionNumber")
 
-    # Now create the deployment with the version number
     deployment_body = {
         "versionNumber": version_number,
         "description": description,
     }
 
-    deployment = await asyncio.to_thread(
+    deployment = await run_api_call(
         service.projects()
         .deployments()
         .create(scriptId=script_id, body=deployment_body)
@@ -366,6 +641,48 @@ async def create_deployment(
     return "\n".join(output)
 
 
+@handle_errors
+async def create_deployments_bulk(
+    script_ids: List[str],
+    description: str,
+    version_description: Optional[str] = None,
+) -> str:
+    """
+    Create a deployment for each of several scripts concurrently.
+
+    Each script's version + deployment chain runs independently, so total
+    latency tracks the slowest script rather than the sum of all of them.
+
+    Args:
+        script_ids: Script project IDs to deploy
+        description: Deployment description used for every script
+        version_description: Optional version description
+
+    Returns:
+        str: Deployment results for each script, in input order
+    """
+    if not script_ids:
+        return "No script IDs provided."
+
+    semaphore = asyncio.Semaphore(_BULK_DEPLOY_CONCURRENCY)
+
+    async def deploy(script_id: str) -> str:
+        async with semaphore:
+            return await create_deployment(
+                script_id, description, version_description=version_description
+            )
+
+    results = await asyncio.gather(*(deploy(sid) for sid in script_ids))
+
+    output = [f"Deployment results for {len(script_ids)} scripts:"]
+    for script_id, result in zip(script_ids, results):
+        output.append("")
+        output.append(f"[{script_id}]")
+        output.append(result)
+
+    return "\n".join(output)
+
+
 @handle_errors
 async def list_deployments(script_id: str) -> str:
     """
@@ -377,10 +694,13 @@ async def list_deployments(script_id: str) -> str:
     Returns:
         str: Formatted string with deployment list
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
-    response = await asyncio.to_thread(
-        service.projects().deployments().list(scriptId=script_id).execute
+    response = await run_api_call(
+        service.projects()
+        .deployments()
+        .list(scriptId=script_id, fields=_DEPLOYMENT_LIST_FIELDS)
+        .execute
     )
 
     deployments = response.get("deployments", [])
@@ -388,18 +708,18 @@ async def list_deployments(script_id: str) -> str:
     if not deployments:
         return f"No deployments found for script: {script_id}"
 
-    output = [f"Deployments for script: {script_id}", ""]
+    def describe(i: int, deployment: Dict[str, Any]) -> str:
+        # The description lives in the deployment's config
+        config = deployment.get("deploymentConfig", {})
+        return (
+            f"{i}. {config.get('description', 'No description')}"
+            f" ({deployment.get('deploymentId', 'Unknown')})\n"
+            f"   Updated: {deployment.get('updateTime', 'Unknown')}\n"
+        )
 
-    for i, deployment in enumerate(deployments, 1):
-        deployment_id = deployment.get("deploymentId", "Unknown")
-        description = deployment.get("description", "No description")
-        update_time = deployment.get("updateTime", "Unknown")
+    entries = "\n".join(describe(i, d) for i, d in enumerate(deployments, 1))
 
-        output.append(f"{i}. {description} ({deployment_id})")
-        output.append(f"   Updated: {update_time}")
-        output.append("")
-
-    return "\n".join(output)
+    return f"Deployments for script: {script_id}\n\n{entries}"
 
 
 @handle_errors
@@ -419,13 +739,13 @@ async def update_deployment(
     Returns:
         str: Formatted string confirming update
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
     request_body = {}
     if description:
         request_body["description"] = description
 
-    deployment = await asyncio.to_thread(
+    deployment = await run_api_call(
         service.projects()
         .deployments()
         .update(scriptId=script_id, deploymentId=deployment_id, body=request_body)
@@ -453,9 +773,9 @@ async def delete_deployment(script_id: str, deployment_id: str) -> str:
     Returns:
         str: Confirmation message
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
-    await asyncio.to_thread(
+    await run_api_call(
         service.projects()
         .deployments()
         .delete(scriptId=script_id, deploymentId=deployment_id)
@@ -486,10 +806,13 @@ async def list_versions(script_id: str) -> str:
     Returns:
         str: Formatted string with version list
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
-    response = await asyncio.to_thread(
-        service.projects().versions().list(scriptId=script_id).execute
+    response = await run_api_call(
+        service.projects()
+        .versions()
+        .list(scriptId=script_id, fields=_VERSION_LIST_FIELDS)
+        .execute
     )
 
     versions = response.get("versions", [])
@@ -497,18 +820,14 @@ async def list_versions(script_id: str) -> str:
     if not versions:
         return f"No versions found for script: {script_id}"
 
-    output = [f"Versions for script: {script_id}", ""]
-
-    for version in versions:
-        version_number = version.get("versionNumber", "Unknown")
-        description = version.get("description", "No description")
-        create_time = version.get("createTime", "Unknown")
-
-        output.append(f"Version {version_number}: {description}")
-        output.append(f"   Created: {create_time}")
-        output.append("")
+    entries = "\n".join(
+        f"Version {version.get('versionNumber', 'Unknown')}:"
+        f" {version.get('description', 'No description')}\n"
+        f"   Created: {version.get('createTime', 'Unknown')}\n"
+        for version in versions
+    )
 
-    return "\n".join(output)
+    return f"Versions for script: {script_id}\n\n{entries}"
 
 
 @handle_errors
@@ -526,13 +845,13 @@ async def create_version(
     Returns:
         str: Formatted string with new version details
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
     request_body = {}
     if description:
         request_body["description"] = description
 
-    version = await asyncio.to_thread(
+    version = await run_api_call(
         service.projects()
         .versions()
         .create(scriptId=script_id, body=request_body)
@@ -563,9 +882,9 @@ async def get_version(script_id: str, version_number: int) -> str:
     Returns:
         str: Formatted string with version details
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
-    version = await asyncio.to_thread(
+    version = await run_api_call(
         service.projects()
         .versions()
         .get(scriptId=script_id, versionNumber=version_number)
@@ -605,36 +924,28 @@ async def list_script_processes(
     Returns:
         str: Formatted string with process list
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
-    request_params = {"pageSize": page_size}
+    request_params = {"pageSize": page_size, "fields": _PROCESS_LIST_FIELDS}
     if script_id:
         request_params["scriptId"] = script_id
 
-    response = await asyncio.to_thread(
-        service.processes().list(**request_params).execute
-    )
+    response = await run_api_call(service.processes().list(**request_params).execute)
 
     processes = response.get("processes", [])
 
     if not processes:
         return "No recent script executions found."
 
-    output = ["Recent script executions:", ""]
-
-    for i, process in enumerate(processes, 1):
-        function_name = process.get("functionName", "Unknown")
-        process_status = process.get("processStatus", "Unknown")
-        start_time = process.get("startTime", "Unknown")
-        duration = process.get("duration", "Unknown")
-
-        output.append(f"{i}. {function_name}")
-        output.append(f"   Status: {process_status}")
-        output.append(f"   Started: {start_time}")
-        output.append(f"   Duration: {duration}")
-        output.append("")
+    entries = "\n".join(
+        f"{i}. {process.get('functionName', 'Unknown')}\n"
+        f"   Status: {process.get('processStatus', 'Unknown')}\n"
+        f"   Started: {process.get('startTime', 'Unknown')}\n"
+        f"   Duration: {process.get('duration', 'Unknown')}\n"
+        for i, process in enumerate(processes, 1)
+    )
 
-    return "\n".join(output)
+    return f"Recent script executions:\n\n{entries}"
 
 
 # ============================================================================
@@ -642,6 +953,14 @@ async def list_script_processes(
 # ============================================================================
 
 
+# Response field, heading, and value unit for each get_script_metrics section
+_METRIC_SECTIONS = (
+    ("activeUsers", "Active Users", "users"),
+    ("totalExecutions", "Total Executions", "executions"),
+    ("failedExecutions", "Failed Executions", "failures"),
+)
+
+
 @handle_errors
 async def get_script_metrics(
     script_id: str,
@@ -657,7 +976,7 @@ async def get_script_metrics(
     Returns:
         str: Formatted string with metrics data
     """
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
 
     # Build the metrics filter
     request_params = {
@@ -665,53 +984,31 @@ async def get_script_metrics(
         "metricsGranularity": metrics_granularity,
     }
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.projects().getMetrics(**request_params).execute
     )
 
-    output = [
-        f"Metrics for script: {script_id}",
-        f"Granularity: {metrics_granularity}",
-        "",
-    ]
-
-    # Active users
-    active_users = response.get("activeUsers", [])
-    if active_users:
-        output.append("Active Users:")
-        for metric in active_users:
-            start_time = metric.get("startTime", "Unknown")
-            end_time = metric.get("endTime", "Unknown")
-            value = metric.get("value", "0")
-            output.append(f"  {start_time} to {end_time}: {value} users")
-        output.append("")
-
-    # Total executions
-    total_executions = response.get("totalExecutions", [])
-    if total_executions:
-        output.append("Total Executions:")
-        for metric in total_executions:
-            start_time = metric.get("startTime", "Unknown")
-            end_time = metric.get("endTime", "Unknown")
-            value = metric.get("value", "0")
-            output.append(f"  {start_time} to {end_time}: {value} executions")
-        output.append("")
-
-    # Failed executions
-    failed_executions = response.get("failedExecutions", [])
-    if failed_executions:
-        output.append("Failed Executions:")
-        for metric in failed_executions:
-            start_time = metric.get("startTime", "Unknown")
-            end_time = metric.get("endTime", "Unknown")
-            value = metric.get("value", "0")
-            output.append(f"  {start_time} to {end_time}: {value} failures")
-        output.append("")
+    out = io.StringIO()
+    out.write(f"Metrics for script: {script_id}\nGranularity: {metrics_granularity}\n")
+
+    has_metrics = False
+    for key, heading, unit in _METRIC_SECTIONS:
+        metrics = response.get(key, [])
+        if not metrics:
+            continue
+        has_metrics = True
+        out.write(f"\n{heading}:")
+        for metric in metrics:
+            out.write(
+                f"\n  {metric.get('startTime', 'Unknown')} to"
+                f" {metric.get('endTime', 'Unknown')}: {metric.get('value', '0')} {unit}"
+            )
+        out.write("\n")
 
-    if not active_users and not total_executions and not failed_executions:
-        output.append("No metrics data available for this script.")
+    if not has_metrics:
+        out.write("\nNo metrics data available for this script.")
 
-    return "\n".join(output)
+    return out.getvalue()
 
 
 # ============================================================================
@@ -719,6 +1016,91 @@ async def get_script_metrics(
 # ============================================================================
 
 
+_VALID_MINUTES = ["1", "5", "10", "15", "30"]
+_VALID_HOURS = ["1", "2", "4", "6", "8", "12"]
+_VALID_DAYS = [
+    "MONDAY",
+    "TUESDAY",
+    "WEDNESDAY",
+    "THURSDAY",
+    "FRIDAY",
+    "SATURDAY",
+    "SUNDAY",
+]
+_MINUTES_SET = frozenset(_VALID_MINUTES)
+_HOURS_SET = frozenset(_VALID_HOURS)
+_DAYS_SET = frozenset(_VALID_DAYS)
+
+
+def _parse_hour_of_day(value: str) -> Optional[str]:
+    try:
+        return value if 0 <= int(value) <= 23 else None
+    except ValueError:
+        return None
+
+
+# trigger_type -> (default schedule, schedule parser, error, builder chain).
+# Parsers return the schedule value to use, or None when it is invalid;
+# trigger types without a schedule have no parser.
+_TRIGGER_SPECS: Dict[
+    str, Tuple[Optional[str], Optional[Callable[[str], Optional[str]]], str, str]
+] = {
+    "time_minutes": (
+        "5",
+        lambda v: v if v in _MINUTES_SET else None,
+        f"Error: time_minutes schedule must be one of {_VALID_MINUTES}",
+        ".timeBased()\n      .everyMinutes({schedule})",
+    ),
+    "time_hours": (
+        "1",
+        lambda v: v if v in _HOURS_SET else None,
+        f"Error: time_hours schedule must be one of {_VALID_HOURS}",
+        ".timeBased()\n      .everyHours({schedule})",
+    ),
+    "time_daily": (
+        "9",
+        _parse_hour_of_day,
+        "Error: time_daily schedule must be hour 0-23",
+        ".timeBased()\n      .atHour({schedule})\n      .everyDays(1)",
+    ),
+    "time_weekly": (
+        "MONDAY",
+        lambda v: v.upper() if v.upper() in _DAYS_SET else None,
+        f"Error: time_weekly schedule must be one of {_VALID_DAYS}",
+        ".timeBased()\n      .onWeekDay(ScriptApp.WeekDay.{schedule})",
+    ),
+    "on_open": (
+        None,
+        None,
+        "",
+        ".forSpreadsheet(SpreadsheetApp.getActive())\n      .onOpen()",
+    ),
+    "on_edit": (
+        None,
+        None,
+        "",
+        ".forSpreadsheet(SpreadsheetApp.getActive())\n      .onEdit()",
+    ),
+    "on_form_submit": (
+        None,
+        None,
+        "",
+        ".forForm(FormApp.getActiveForm())\n      .onFormSubmit()",
+    ),
+    "on_change": (
+        None,
+        None,
+        "",
+        ".forSpreadsheet(SpreadsheetApp.getActive())\n      .onChange()",
+    ),
+}
+
+_UNKNOWN_TRIGGER_ERROR = (
+    "Error: Unknown trigger_type '{trigger_type}'. Valid types: "
+    + ", ".join(_TRIGGER_SPECS)
+)
+
+
 async def generate_trigger_code(
     trigger_type: str,
     function_name: str,
@@ -749,85 +1131,20 @@ async def generate_trigger_code(
     """
     trigger_type = trigger_type.lower()
 
-    # Build the trigger creation code based on type
-    if trigger_type == "time_minutes":
-        minutes = schedule or "5"
-        valid_minutes = ["1", "5", "10", "15", "30"]
-        if minutes not in valid_minutes:
-            return f"Error: time_minutes schedule must be one of {valid_minutes}"
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .timeBased()
-      .everyMinutes({minutes})
-      .create();"""
-
-    elif trigger_type == "time_hours":
-        hours = schedule or "1"
-        valid_hours = ["1", "2", "4", "6", "8", "12"]
-        if hours not in valid_hours:
-            return f"Error: time_hours schedule must be one of {valid_hours}"
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .timeBased()
-      .everyHours({hours})
-      .create();"""
-
-    elif trigger_type == "time_daily":
-        hour = schedule or "9"
-        try:
-            hour_int = int(hour)
-            if not 0 <= hour_int <= 23:
-                raise ValueError()
-        except ValueError:
-            return "Error: time_daily schedule must be hour 0-23"
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .timeBased()
-      .atHour({hour})
-      .everyDays(1)
-      .create();"""
-
-    elif trigger_type == "time_weekly":
-        day = (schedule or "MONDAY").upper()
-        valid_days = [
-            "MONDAY",
-            "TUESDAY",
-            "WEDNESDAY",
-            "THURSDAY",
-            "FRIDAY",
-            "SATURDAY",
-            "SUNDAY",
-        ]
-        if day not in valid_days:
-            return f"Error: time_weekly schedule must be one of {valid_days}"
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .timeBased()
-      .onWeekDay(ScriptApp.WeekDay.{day})
-      .create();"""
-
-    elif trigger_type == "on_open":
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .forSpreadsheet(SpreadsheetApp.getActive())
-      .onOpen()
-      .create();"""
-
-    elif trigger_type == "on_edit":
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .forSpreadsheet(SpreadsheetApp.getActive())
-      .onEdit()
-      .create();"""
-
-    elif trigger_type == "on_form_submit":
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .forForm(FormApp.getActiveForm())
-      .onFormSubmit()
-      .create();"""
-
-    elif trigger_type == "on_change":
-        trigger_code = f"""ScriptApp.newTrigger('{function_name}')
-      .forSpreadsheet(SpreadsheetApp.getActive())
-      .onChange()
-      .create();"""
+    spec = _TRIGGER_SPECS.get(trigger_type)
+    if spec is None:
+        return _UNKNOWN_TRIGGER_ERROR.format(trigger_type=trigger_type)
 
-    else:
-        return f"Error: Unknown trigger_type '{trigger_type}'. Valid types: time_minutes, time_hours, time_daily, time_weekly, on_open, on_edit, on_form_submit, on_change"
+    default, parse, error, chain = spec
+    if parse is not None:
+        value = parse(schedule or default)
+        if value is None:
+            return error
+        chain = chain.format(schedule=value)
+
+    trigger_code = (
+        f"ScriptApp.newTrigger('{function_name}')\n      {chain}\n      .create();"
+    )
 
     # Generate complete setup code
     setup_code = f"""/**
@@ -44,6 +44,8 @@ from .google_auth import (
     complete_auth_flow,
     auth_interactive,
     get_service,
+    build_service,
+    reload_services,
     get_script_service,
     get_drive_service,
     get_gmail_service,
@@ -88,6 +90,8 @@ __all__ = [
     "complete_auth_flow",
     "auth_interactive",
     "get_service",
+    "build_service",
+    "reload_services",
     "get_script_service",
     "get_drive_service",
     "get_gmail_service",
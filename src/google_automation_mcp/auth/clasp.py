@@ -122,33 +122,22 @@ def get_clasp_user_email() -> Optional[str]:
     """
     Get the email of the user authenticated with clasp.
 
-    Note: clasp doesn't store the email directly, so we need to
-    extract it from the tokens via the userinfo API.
+    Note: clasp doesn't store the email directly. It is decoded from the
+    ID token when present, else fetched from the userinfo API.
     """
     tokens = get_clasp_tokens()
     if not tokens:
         return None
 
-    # Try to get from ID token if present
-    # clasp tokens usually don't have id_token, so we'll need to make an API call
-    try:
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
-
-        creds = Credentials(
-            token=tokens.get("access_token"),
-            refresh_token=tokens.get("refresh_token"),
-            token_uri="https://oauth2.googleapis.com/token",
-            client_id=tokens.get("client_id"),
-            client_secret=tokens.get("client_secret"),
-        )
+    from .google_auth import (
+        clasp_tokens_to_credentials,
+        get_user_email_from_credentials,
+    )
 
-        service = build("oauth2", "v2", credentials=creds)
-        user_info = service.userinfo().get().execute()
-        return user_info.get("email")
-    except Exception as e:
-        logger.debug(f"Could not get clasp user email: {e}")
+    creds = clasp_tokens_to_credentials(tokens)
+    if creds is None:
         return None
+    return get_user_email_from_credentials(creds)
 
 
 def install_clasp_global() -> Tuple[bool, str]:
@@ -264,16 +253,21 @@ def detect_clasp_environment() -> Dict[str, Any]:
     Returns:
         Dict with environment detection results
     """
+    npx_installed = is_npx_installed()
+    # `clasp --version` goes through npx and can take seconds, so a single
+    # run answers both "is it installed" and "which version"
+    clasp_version = get_clasp_version() if npx_installed else None
+    tokens = get_clasp_tokens()
+    clasp_authenticated = tokens is not None and bool(tokens.get("access_token"))
+
     return {
         "node_installed": is_node_installed(),
         "npm_installed": is_npm_installed(),
-        "npx_installed": is_npx_installed(),
-        "clasp_installed": is_clasp_installed(),
-        "clasp_version": get_clasp_version(),
-        "clasp_authenticated": is_clasp_authenticated(),
-        "clasp_user_email": get_clasp_user_email()
-        if is_clasp_authenticated()
-        else None,
+        "npx_installed": npx_installed,
+        "clasp_installed": clasp_version is not None,
+        "clasp_version": clasp_version,
+        "clasp_authenticated": clasp_authenticated,
+        "clasp_user_email": get_clasp_user_email() if clasp_authenticated else None,
         "clasprc_path": str(CLASP_RC_PATH),
         "clasprc_exists": CLASP_RC_PATH.exists(),
     }
@@ -14,7 +14,7 @@ import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
@@ -189,7 +189,7 @@ class SecureCredentialStore(CredentialStore):
             "scopes": list(credentials.scopes) if credentials.scopes else None,
             "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
             "user_email": user_email,
-            "stored_at": datetime.utcnow().isoformat(),
+            "stored_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
         }
 
         try:
@@ -198,6 +198,7 @@ class SecureCredentialStore(CredentialStore):
 
             # Set secure permissions
             self._secure_file(creds_path)
+            mark_credentials_changed()
 
             logger.info(f"Stored credentials for {user_email}")
             return True
@@ -212,6 +213,7 @@ class SecureCredentialStore(CredentialStore):
         try:
             if creds_path.exists():
                 creds_path.unlink()
+                mark_credentials_changed()
                 logger.info(f"Deleted credentials for {user_email}")
             return True
         except IOError as e:
@@ -242,6 +244,21 @@ class SecureCredentialStore(CredentialStore):
 
 _credential_store: Optional[CredentialStore] = None
 
+# Bumped whenever stored credentials change, so callers caching anything
+# derived from the store (e.g. the default user) can tell it is stale
+_credentials_version = 0
+
+
+def mark_credentials_changed() -> None:
+    """Record that the set of stored credentials has changed."""
+    global _credentials_version
+    _credentials_version += 1
+
+
+def get_credentials_version() -> int:
+    """Get a counter that changes whenever stored credentials change."""
+    return _credentials_version
+
 
 def get_credential_store() -> CredentialStore:
     """
@@ -268,4 +285,5 @@ def set_credential_store(store: CredentialStore) -> None:
     """
     global _credential_store
     _credential_store = store
+    mark_credentials_changed()
     logger.info(f"Set credential store: {type(store).__name__}")
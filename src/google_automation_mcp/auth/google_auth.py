@@ -15,14 +15,17 @@ import json
 import jwt
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow, InstalledAppFlow
-from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
 
+from ..core.cache import TTLCache
+from ..core.http import auth_request, authorized_http
+from ..core.json_model import get_json_model, loads
 from .scopes import get_current_scopes
 from .credential_store import get_credential_store
 from .oauth_config import get_oauth_config
@@ -32,6 +35,12 @@ from .clasp import get_clasp_tokens
 
 logger = logging.getLogger(__name__)
 
+# Built API services per access token: token -> {(service, version): service}.
+# A user's Gmail, Drive, Sheets, ... clients share one entry, and refreshing
+# credentials changes the token, so a stale bundle ages out as a whole.
+_service_cache: TTLCache[Dict[Tuple[str, str], Any]] = TTLCache(maxsize=32, ttl=3600)
+_service_build_lock = threading.Lock()
+
 
 def clasp_tokens_to_credentials(token_data: Dict[str, Any]) -> Optional[Credentials]:
     """
@@ -65,6 +74,8 @@ def clasp_tokens_to_credentials(token_data: Dict[str, Any]) -> Optional[Credenti
             client_secret=token_data.get("client_secret"),
             scopes=scopes,
             expiry=expiry,
+            # Newer clasp releases keep the OpenID token, which names the user
+            id_token=token_data.get("id_token"),
         )
         return creds
     except Exception as e:
@@ -88,15 +99,15 @@ def get_user_email_from_credentials(credentials: Credentials) -> Optional[str]:
             decoded = jwt.decode(
                 credentials.id_token, options={"verify_signature": False}
             )
-            return decoded.get("email")
+            # Tokens issued without the email scope have no email claim
+            if decoded.get("email"):
+                return decoded["email"]
         except Exception:
             pass
 
     # Fall back to userinfo API
     try:
-        from googleapiclient.discovery import build
-
-        service = build("oauth2", "v2", credentials=credentials)
+        service = build_service("oauth2", "v2", credentials)
         user_info = service.userinfo().get().execute()
         return user_info.get("email")
     except Exception as e:
@@ -132,7 +143,7 @@ def get_credentials_for_user(user_email: str) -> Optional[Credentials]:
     # Try to refresh if expired
     if creds.expired and creds.refresh_token:
         try:
-            creds.refresh(Request())
+            creds.refresh(auth_request())
             store.store_credential(user_email, creds)
             logger.info(f"Refreshed credentials for {user_email}")
             return creds
@@ -215,7 +226,15 @@ def store_credentials(
         return False
 
     store = get_credential_store()
-    return store.store_credential(user_email, credentials)
+    stored = store.store_credential(user_email, credentials)
+    if stored:
+        # Credentials were rotated; don't keep services built for the old ones
+        # or project content read with them
+        from ..appscript_tools import clear_project_cache
+
+        reload_services()
+        clear_project_cache()
+    return stored
 
 
 # =============================================================================
@@ -384,15 +403,82 @@ def get_service(
     Raises:
         ValueError if no valid credentials available
     """
-    from googleapiclient.discovery import build
-
     if credentials is None:
         credentials = get_credentials()
 
     if credentials is None:
         raise ValueError("No valid credentials. Run: google-automation-mcp setup")
 
-    return build(service_name, version, credentials=credentials)
+    return build_service(service_name, version, credentials)
+
+
+def build_service(service_name: str, version: str, credentials: Credentials):
+    """
+    Build an API service for credentials, reusing a cached one when possible.
+
+    Building a service parses the API's discovery document, which costs far
+    more than the tool calls that use it. Services are cached per access
+    token, so every service for the same credentials shares one cache
+    entry; concurrent first calls wait for a single build.
+
+    Args:
+        service_name: API service name (e.g., "script", "drive", "gmail")
+        version: API version (e.g., "v1", "v3")
+        credentials: Credentials the service authorizes requests with
+
+    Returns:
+        Google API service object
+    """
+    from googleapiclient.discovery import build, build_from_document
+    from googleapiclient.discovery_cache import get_static_doc
+
+    token = credentials.token
+    key = (service_name, version)
+    if token:
+        bundle = _service_cache.get(token)
+        if bundle is not None:
+            service = bundle.get(key)
+            if service is not None:
+                return service
+
+    with _service_build_lock:
+        bundle = None
+        if token:
+            bundle = _service_cache.get(token)
+            if bundle is None:
+                bundle = {}
+                _service_cache.set(token, bundle)
+            service = bundle.get(key)
+            if service is not None:
+                return service
+        http = authorized_http(credentials)
+        # Bundled discovery documents; never fetch or cache them remotely.
+        # Parsing the document is most of a build, so it goes through orjson
+        # when installed. build_from_document modifies the parsed document,
+        # so it is not shared between builds.
+        document = get_static_doc(service_name, version)
+        if document is not None:
+            service = build_from_document(
+                loads(document), http=http, model=get_json_model()
+            )
+        else:
+            # Not bundled with this googleapiclient release
+            service = build(
+                service_name,
+                version,
+                http=http,
+                model=get_json_model(),
+                cache_discovery=False,
+                static_discovery=False,
+            )
+        if bundle is not None:
+            bundle[key] = service
+    return service
+
+
+def reload_services() -> None:
+    """Drop every cached API service so the next call builds a fresh one."""
+    _service_cache.clear()
 
 
 def get_script_service(credentials: Optional[Credentials] = None):
@@ -7,8 +7,9 @@ Supports OAuth 2.0, OAuth 2.1 with PKCE, and clasp authentication.
 Forked from google_workspace_mcp/auth/oauth_config.py
 """
 
+import functools
 import os
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from typing import List, Optional, Dict, Any
 
 
@@ -19,23 +20,56 @@ class OAuthConfig:
     Provides a single source of truth for all OAuth-related configuration values.
     """
 
+    __slots__ = (
+        "base_uri",
+        "port",
+        "base_url",
+        "external_url",
+        "client_id",
+        "client_secret",
+        "oauth21_enabled",
+        "pkce_required",
+        "supported_code_challenge_methods",
+        "clasp_enabled",
+        "_transport_mode",
+        "redirect_uri",
+        "redirect_path",
+        "_redirect_uris",
+        "_server_metadata",
+        "_configured",
+        "_oauth_base_url",
+    )
+
     def __init__(self):
+        # Transport mode (will be set at runtime)
+        self._transport_mode = "stdio"  # Default
+        self._load()
+
+    def _load(self) -> None:
+        """Read every setting from the environment in one pass."""
+        # Read os.environ directly: copying it decodes every variable (about
+        # 8x the cost of the dozen lookups made here)
+        env = os.environ
+
         # Base server configuration
-        self.base_uri = os.getenv("APPSCRIPT_MCP_BASE_URI", "http://localhost")
-        self.port = int(os.getenv("PORT", os.getenv("APPSCRIPT_MCP_PORT", "8000")))
+        self.base_uri = env.get("APPSCRIPT_MCP_BASE_URI", "http://localhost")
+        port = env.get("PORT")
+        if port is None:
+            port = env.get("APPSCRIPT_MCP_PORT", "8000")
+        self.port = int(port)
         self.base_url = f"{self.base_uri}:{self.port}"
 
         # External URL for reverse proxy scenarios
-        self.external_url = os.getenv("APPSCRIPT_MCP_EXTERNAL_URL")
+        self.external_url = env.get("APPSCRIPT_MCP_EXTERNAL_URL")
 
         # OAuth client configuration
-        self.client_id = os.getenv("GOOGLE_OAUTH_CLIENT_ID")
-        self.client_secret = os.getenv("GOOGLE_OAUTH_CLIENT_SECRET")
+        self.client_id = env.get("GOOGLE_OAUTH_CLIENT_ID")
+        self.client_secret = env.get("GOOGLE_OAUTH_CLIENT_SECRET")
+        self._configured = bool(self.client_id and self.client_secret)
+        self._oauth_base_url = self.external_url or self.base_url
 
         # OAuth 2.1 configuration
-        self.oauth21_enabled = (
-            os.getenv("MCP_ENABLE_OAUTH21", "false").lower() == "true"
-        )
+        self.oauth21_enabled = env.get("MCP_ENABLE_OAUTH21", "false").lower() == "true"
         self.pkce_required = self.oauth21_enabled  # PKCE is mandatory in OAuth 2.1
         self.supported_code_challenge_methods = (
             ["S256", "plain"] if not self.oauth21_enabled else ["S256"]
@@ -43,27 +77,33 @@ class OAuthConfig:
 
         # clasp configuration
         self.clasp_enabled = (
-            os.getenv("APPSCRIPT_MCP_CLASP_ENABLED", "true").lower() == "true"
+            env.get("APPSCRIPT_MCP_CLASP_ENABLED", "true").lower() == "true"
         )
 
-        # Transport mode (will be set at runtime)
-        self._transport_mode = "stdio"  # Default
-
         # Redirect URI configuration
-        self.redirect_uri = self._get_redirect_uri()
+        self.redirect_uri = env.get("GOOGLE_OAUTH_REDIRECT_URI") or (
+            f"{self.base_url}/oauth2callback"
+        )
         self.redirect_path = self._get_redirect_path(self.redirect_uri)
 
-    def _get_redirect_uri(self) -> str:
-        """Get the OAuth redirect URI."""
-        explicit_uri = os.getenv("GOOGLE_OAUTH_REDIRECT_URI")
-        if explicit_uri:
-            return explicit_uri
-        return f"{self.base_url}/oauth2callback"
+        uris = [self.redirect_uri]
+        # Custom redirect URIs from environment
+        custom_uris = env.get("OAUTH_CUSTOM_REDIRECT_URIS")
+        if custom_uris:
+            uris.extend([uri.strip() for uri in custom_uris.split(",")])
+        # Remove duplicates while preserving order
+        self._redirect_uris = list(dict.fromkeys(uris))
+
+        self._server_metadata = self._build_server_metadata()
+
+    def reload(self) -> None:
+        """Re-read the configuration from environment variables."""
+        self._load()
 
     @staticmethod
     def _get_redirect_path(uri: str) -> str:
         """Extract the redirect path from a full redirect URI."""
-        parsed = urlparse(uri)
+        parsed = urlsplit(uri)
         if parsed.scheme or parsed.netloc:
             path = parsed.path or "/oauth2callback"
         else:
@@ -72,25 +112,15 @@ class OAuthConfig:
 
     def get_redirect_uris(self) -> List[str]:
         """Get all valid OAuth redirect URIs."""
-        uris = [self.redirect_uri]
-
-        # Custom redirect URIs from environment
-        custom_uris = os.getenv("OAUTH_CUSTOM_REDIRECT_URIS")
-        if custom_uris:
-            uris.extend([uri.strip() for uri in custom_uris.split(",")])
-
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(uris))
+        return list(self._redirect_uris)
 
     def is_configured(self) -> bool:
         """Check if OAuth is properly configured with GCP credentials."""
-        return bool(self.client_id and self.client_secret)
+        return self._configured
 
     def get_oauth_base_url(self) -> str:
         """Get OAuth base URL for constructing OAuth endpoints."""
-        if self.external_url:
-            return self.external_url
-        return self.base_url
+        return self._oauth_base_url
 
     def set_transport_mode(self, mode: str) -> None:
         """Set the current transport mode."""
@@ -122,10 +152,8 @@ class OAuthConfig:
             "transport_mode": self._transport_mode,
         }
 
-    def get_authorization_server_metadata(
-        self, scopes: Optional[List[str]] = None
-    ) -> Dict[str, Any]:
-        """Get OAuth authorization server metadata per RFC 8414."""
+    def _build_server_metadata(self) -> Dict[str, Any]:
+        """Build the scope-independent part of the server metadata."""
         oauth_base = self.get_oauth_base_url()
         metadata = {
             "issuer": "https://accounts.google.com",
@@ -142,9 +170,6 @@ class OAuthConfig:
             "code_challenge_methods_supported": self.supported_code_challenge_methods,
         }
 
-        if scopes is not None:
-            metadata["scopes_supported"] = scopes
-
         if self.oauth21_enabled:
             metadata["pkce_required"] = True
             metadata["response_types_supported"] = ["code"]
@@ -152,37 +177,49 @@ class OAuthConfig:
 
         return metadata
 
+    def get_authorization_server_metadata(
+        self, scopes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get OAuth authorization server metadata per RFC 8414.
+
+        The metadata is built when the config is loaded; each call returns a
+        shallow copy, so callers must not mutate the nested lists.
+        """
+        metadata = self._server_metadata.copy()
+        if scopes is not None:
+            metadata["scopes_supported"] = scopes
+        return metadata
+
 
 # =============================================================================
 # Global Configuration Instance
 # =============================================================================
 
-_oauth_config: Optional[OAuthConfig] = None
-
 
+@functools.cache
 def get_oauth_config() -> OAuthConfig:
     """Get the global OAuth configuration instance."""
-    global _oauth_config
-    if _oauth_config is None:
-        _oauth_config = OAuthConfig()
-    return _oauth_config
+    return OAuthConfig()
 
 
 def reload_oauth_config() -> OAuthConfig:
     """Reload the OAuth configuration from environment variables."""
-    global _oauth_config
-    _oauth_config = OAuthConfig()
-    return _oauth_config
+    get_oauth_config.cache_clear()
+    return get_oauth_config()
 
 
 # =============================================================================
 # Convenience Functions
 # =============================================================================
+# These read the precomputed attributes directly. The flags are deliberately
+# not exported as module constants: a `from ... import FLAG` copy would go
+# stale after reload_oauth_config().
 
 
 def get_oauth_base_url() -> str:
     """Get OAuth base URL."""
-    return get_oauth_config().get_oauth_base_url()
+    return get_oauth_config()._oauth_base_url
 
 
 def get_oauth_redirect_uri() -> str:
@@ -192,17 +229,17 @@ def get_oauth_redirect_uri() -> str:
 
 def is_oauth_configured() -> bool:
     """Check if OAuth is properly configured with GCP credentials."""
-    return get_oauth_config().is_configured()
+    return get_oauth_config()._configured
 
 
 def is_oauth21_enabled() -> bool:
     """Check if OAuth 2.1 is enabled."""
-    return get_oauth_config().is_oauth21_enabled()
+    return get_oauth_config().oauth21_enabled
 
 
 def is_clasp_enabled() -> bool:
     """Check if clasp authentication is enabled."""
-    return get_oauth_config().is_clasp_enabled()
+    return get_oauth_config().clasp_enabled
 
 
 def set_transport_mode(mode: str) -> None:
@@ -212,4 +249,4 @@ def set_transport_mode(mode: str) -> None:
 
 def get_transport_mode() -> str:
     """Get the current transport mode."""
-    return get_oauth_config().get_transport_mode()
+    return get_oauth_config()._transport_mode
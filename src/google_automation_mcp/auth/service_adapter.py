@@ -15,17 +15,54 @@ Usage:
         return service.files().list().execute()
 """
 
+import asyncio
 import logging
-from functools import wraps
-from typing import Optional, Callable, Any
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Callable, Any, Tuple
 
-from googleapiclient.discovery import build
+from google.oauth2.credentials import Credentials
 
-from .credential_store import get_credential_store
-from .google_auth import get_credentials, get_credentials_for_user
+from ..core.executor import run_api_call
+from .credential_store import get_credential_store, get_credentials_version
+from .google_auth import build_service, get_credentials, get_credentials_for_user
 
 logger = logging.getLogger(__name__)
 
+# How long the fallback user for calls without user_google_email is reused
+_DEFAULT_USER_TTL = 60.0
+
+# (expires_at, credentials version, user email) of the last lookup
+_default_user: Optional[Tuple[float, int, Optional[str]]] = None
+
+
+# Credentials are reused until this many seconds before their token expires
+_CREDENTIALS_EXPIRY_MARGIN = 60.0
+
+# user email (None for the default user) -> (reuse until, credentials
+# version, credentials)
+_credentials_cache: Dict[Optional[str], Tuple[float, int, Credentials]] = {}
+
+
+def _resolve_default_user() -> Optional[str]:
+    """
+    Get the user assumed when a call names no user_google_email.
+
+    Listing the credential store hits the filesystem, so the answer is
+    reused for a minute unless stored credentials change in the meantime.
+    """
+    global _default_user
+    now = time.monotonic()
+    version = get_credentials_version()
+    cached = _default_user
+    if cached is not None and cached[0] > now and cached[1] == version:
+        return cached[2]
+
+    users = get_credential_store().list_users()
+    user_email = users[0] if users else None
+    _default_user = (now + _DEFAULT_USER_TTL, version, user_email)
+    return user_email
+
 
 def get_service_for_user(
     service_name: str, version: str, user_email: Optional[str] = None
@@ -44,18 +81,119 @@ def get_service_for_user(
     Raises:
         ValueError if no valid credentials available
     """
-    credentials = None
+    credentials = _get_cached_credentials(user_email)
+
+    if credentials is None:
+        if user_email:
+            credentials = get_credentials_for_user(user_email)
+            if credentials is None:
+                raise ValueError(f"No credentials found for user: {user_email}")
+        else:
+            credentials = get_credentials()
+            if credentials is None:
+                raise ValueError(
+                    "No valid credentials. Run: google-automation-mcp setup"
+                )
+        _cache_credentials(user_email, credentials)
+
+    return build_service(service_name, version, credentials)
+
+
+def _get_cached_credentials(user_email: Optional[str]) -> Optional[Credentials]:
+    """Get credentials cached for user_email if their token is still fresh."""
+    cached = _credentials_cache.get(user_email)
+    if cached is None:
+        return None
+    reuse_until, version, credentials = cached
+    if reuse_until <= time.monotonic() or version != get_credentials_version():
+        _credentials_cache.pop(user_email, None)
+        return None
+    return credentials
+
+
+def _cache_credentials(user_email: Optional[str], credentials: Credentials) -> None:
+    """
+    Remember credentials so later calls skip the credential store.
 
-    if user_email:
-        credentials = get_credentials_for_user(user_email)
-        if credentials is None:
-            raise ValueError(f"No credentials found for user: {user_email}")
-    else:
-        credentials = get_credentials()
-        if credentials is None:
-            raise ValueError("No valid credentials. Run: google-automation-mcp setup")
+    Loading from the store reads and parses a file, so credentials are
+    reused until shortly before their token expires. Credentials without a
+    known expiry are not cached.
+    """
+    expiry = getattr(credentials, "expiry", None)
+    if not isinstance(expiry, datetime):
+        return
+    # google.auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    remaining = (expiry - now).total_seconds()
+    remaining -= _CREDENTIALS_EXPIRY_MARGIN
+    if remaining <= 0:
+        return
+    _credentials_cache[user_email] = (
+        time.monotonic() + remaining,
+        get_credentials_version(),
+        credentials,
+    )
+
+
+def clear_credentials_cache() -> None:
+    """Forget credentials cached by get_service_for_user."""
+    _credentials_cache.clear()
+
+
+class _ServiceInjector:
+    # Async callable that resolves a Google service and passes it to func.
+    # Used instead of nested closures so the service name and version are
+    # plain slot reads on each call. The wrapper attributes handle_errors
+    # and inspect read are slots as well, so instances carry no __dict__
+    # (and this note is a comment because __doc__ is one of those slots);
+    # __module__ cannot be a slot, so it is delegated to func instead
+    __slots__ = (
+        "service_name",
+        "version",
+        "func",
+        "__name__",
+        "__qualname__",
+        "__doc__",
+        "__wrapped__",
+    )
+
+    def __init__(self, service_name: str, version: str, func: Callable):
+        self.service_name = service_name
+        self.version = version
+        self.func = func
+        self.__name__ = func.__name__
+        self.__qualname__ = func.__qualname__
+        self.__doc__ = func.__doc__
+        self.__wrapped__ = func
+
+    @property
+    def __module__(self):
+        return self.func.__module__
+
+    async def __call__(self, *args, **kwargs):
+        # Extract user_google_email from kwargs
+        user_email = kwargs.get("user_google_email")
+
+        # Loading credentials reads the store and may refresh the token over
+        # HTTP, so resolve the service (and the fallback user, when none was
+        # given) off the event loop, concurrently
+        lookup = run_api_call(
+            get_service_for_user, self.service_name, self.version, user_email
+        )
+        try:
+            if user_email:
+                service = await lookup
+            else:
+                service, user_email = await asyncio.gather(
+                    lookup, run_api_call(_resolve_default_user)
+                )
+                if user_email:
+                    kwargs["user_google_email"] = user_email
+        except ValueError as e:
+            return f"Authentication error: {e}"
 
-    return build(service_name, version, credentials=credentials)
+        # Call the wrapped function with injected service
+        return await self.func(service, *args, **kwargs)
 
 
 def with_service(service_name: str, version: str):
@@ -73,29 +211,7 @@ def with_service(service_name: str, version: str):
     """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Extract user_google_email from kwargs
-            user_email = kwargs.get("user_google_email")
-
-            # Get authenticated service
-            try:
-                service = get_service_for_user(service_name, version, user_email)
-            except ValueError as e:
-                return f"Authentication error: {e}"
-
-            # If no user_email provided, try to determine it
-            if not user_email:
-                store = get_credential_store()
-                users = store.list_users()
-                if users:
-                    user_email = users[0]
-                    kwargs["user_google_email"] = user_email
-
-            # Call the wrapped function with injected service
-            return await func(service, *args, **kwargs)
-
-        return wrapper
+        return _ServiceInjector(service_name, version, func)
 
     return decorator
 
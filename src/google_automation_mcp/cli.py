@@ -11,6 +11,31 @@ import sys
 
 APPS_SCRIPT_API_URL = "https://script.google.com/home/usersettings"
 
+_HELP_TEXT = """
+google-automation-mcp - Google Workspace MCP for AI
+
+Commands:
+  setup      Interactive setup with environment detection (recommended)
+  auth       Quick authentication
+  status     Show authentication status
+  version    Show version
+  help       Show this help message
+
+Auth options:
+  auth                  Use clasp (easiest, no GCP project needed)
+  auth --headless       clasp info for headless environments
+  auth --legacy         Use GCP OAuth (requires project setup)
+  auth --legacy --headless  GCP OAuth for headless environments
+  auth --oauth21        Use OAuth 2.1 (multi-user, production)
+
+Examples:
+  google-automation-mcp setup           # Interactive setup
+  google-automation-mcp auth            # Quick clasp authentication
+  google-automation-mcp                 # Run MCP server
+
+For more info: https://github.com/sam-ent/google-automation-mcp
+"""
+
 
 def main():
     """Main CLI entry point."""
@@ -23,19 +48,13 @@ def main():
 
     command = args[0]
 
-    if command == "setup":
-        _run_setup()
-    elif command == "auth":
+    if command == "auth":
         _run_auth(args[1:])
-    elif command == "status":
-        _run_status()
-    elif command in ("--help", "-h", "help"):
-        _print_help()
-    elif command in ("--version", "-v", "version"):
-        _print_version()
-    else:
-        # Unknown command, might be server args
-        _run_server()
+        return
+
+    # Unknown commands might be server args
+    handler = _COMMANDS.get(command, _run_server)
+    handler()
 
 
 def _run_server():
@@ -69,6 +88,13 @@ def _run_auth(args: list):
         _auth_clasp(headless=headless)
 
 
+def _refresh_environment():
+    """Drop the cached environment detection after credentials change."""
+    from .setup import detect_environment
+
+    detect_environment.cache_clear()
+
+
 def _run_status():
     """Show authentication status."""
     from .setup import detect_environment
@@ -130,41 +156,21 @@ def _run_status():
 
 def _print_help():
     """Print help message."""
-    print("""
-google-automation-mcp - Google Workspace MCP for AI
-
-Commands:
-  setup      Interactive setup with environment detection (recommended)
-  auth       Quick authentication
-  status     Show authentication status
-  version    Show version
-  help       Show this help message
-
-Auth options:
-  auth                  Use clasp (easiest, no GCP project needed)
-  auth --headless       clasp info for headless environments
-  auth --legacy         Use GCP OAuth (requires project setup)
-  auth --legacy --headless  GCP OAuth for headless environments
-  auth --oauth21        Use OAuth 2.1 (multi-user, production)
-
-Examples:
-  google-automation-mcp setup           # Interactive setup
-  google-automation-mcp auth            # Quick clasp authentication
-  google-automation-mcp                 # Run MCP server
-
-For more info: https://github.com/sam-ent/google-automation-mcp
-""")
+    print(_HELP_TEXT)
 
 
 def _print_version():
     """Print version."""
-    try:
-        from importlib.metadata import version
+    # The package version is already loaded; importlib.metadata would scan
+    # every installed distribution to find it
+    from . import __version__
+
+    print(f"google-automation-mcp {__version__}")
 
-        v = version("google-automation-mcp")
-    except Exception:
-        v = "unknown"
-    print(f"google-automation-mcp {v}")
+
+def _confirm(prompt: str) -> bool:
+    """Ask a yes/no question that defaults to no."""
+    return input(prompt).strip().lower() in ("y", "yes")
 
 
 def _check_apps_script_api() -> bool:
@@ -211,8 +217,7 @@ def _auth_clasp(headless: bool = False):
         if users:
             print(f"Already authenticated: {', '.join(users)}")
             print()
-            response = input("Re-authenticate? [y/N]: ").strip().lower()
-            if response != "y":
+            if not _confirm("Re-authenticate? [y/N]: "):
                 print("Keeping existing credentials.")
                 return
             print()
@@ -277,8 +282,6 @@ def _auth_clasp(headless: bool = False):
         try:
             import asyncio
             from .router.deployer import deploy_router
-            from .auth import get_credentials
-            from .auth.credential_store import get_credential_store
 
             store = get_credential_store()
             users = store.list_users()
@@ -323,6 +326,7 @@ def _auth_local_legacy():
 
     try:
         auth_interactive()
+        _refresh_environment()
         print()
         print("✓ Authentication successful!")
     except ValueError as e:
@@ -351,8 +355,7 @@ def _auth_headless_legacy():
     if existing:
         print(f"Already authenticated: {', '.join(existing)}")
         print()
-        response = input("Re-authenticate? [y/N]: ").strip().lower()
-        if response != "y":
+        if not _confirm("Re-authenticate? [y/N]: "):
             print("Keeping existing credentials.")
             return
 
@@ -394,5 +397,18 @@ def _auth_headless_legacy():
         sys.exit(1)
 
 
+# Commands that take no arguments; "auth" is dispatched separately
+_COMMANDS = {
+    "setup": _run_setup,
+    "status": _run_status,
+    "--help": _print_help,
+    "-h": _print_help,
+    "help": _print_help,
+    "--version": _print_version,
+    "-v": _print_version,
+    "version": _print_version,
+}
+
+
 if __name__ == "__main__":
     main()
@@ -10,10 +10,26 @@ from .context import (
     get_fastmcp_session_id,
     set_fastmcp_session_id,
 )
+from .batching import BatchCoalescer, Coalescer
+from .cache import TTLCache
+from .executor import get_api_executor, run_api_call
+from .http import auth_request, authorized_http
+from .json_model import get_json_model
+from .query import is_structured_query, quote_literal
 
 __all__ = [
     "get_injected_oauth_credentials",
     "set_injected_oauth_credentials",
     "get_fastmcp_session_id",
     "set_fastmcp_session_id",
+    "BatchCoalescer",
+    "Coalescer",
+    "TTLCache",
+    "get_api_executor",
+    "run_api_call",
+    "auth_request",
+    "authorized_http",
+    "get_json_model",
+    "is_structured_query",
+    "quote_literal",
 ]
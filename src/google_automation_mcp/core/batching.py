@@ -0,0 +1,155 @@
+"""
+Coalescing of independent Google API requests into HTTP batches.
+
+Agents often fire the same kind of small mutation many times in a row
+(share a folder with 20 people, trash a list of files). Each request costs a
+full round trip, so a BatchCoalescer holds requests for a short window and
+sends everything that arrived for the same service as one batch request.
+A request that arrives alone is executed directly.
+
+Coalescer holds the windowing logic on its own, for APIs that fuse work
+through a dedicated multi-item method instead (Sheets values.batchGet).
+"""
+
+import abc
+import asyncio
+import logging
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+from .executor import run_api_call
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingBatch:
+    """Requests collected for one key during the current window."""
+
+    __slots__ = ("key", "loop", "items", "handle")
+
+    def __init__(self, key: Hashable, loop: asyncio.AbstractEventLoop):
+        self.key = key
+        self.loop = loop
+        self.items: List[Tuple[Any, asyncio.Future]] = []
+        self.handle = None
+
+
+class Coalescer(abc.ABC):
+    """
+    Collect items submitted under the same key within a short window.
+
+    Subclasses implement _send(key, items), which receives every
+    (item, future) pair collected for key and must resolve each future.
+
+    Args:
+        delay: Seconds to wait for more items before sending
+        max_size: Send immediately once this many items are waiting
+    """
+
+    def __init__(self, delay: float = 0.02, max_size: int = 100):
+        self.delay = delay
+        self.max_size = max_size
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        # Keep flush tasks referenced until they finish
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def _submit(self, key: Hashable, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(key)
+        if pending is None or pending.loop is not loop:
+            pending = _PendingBatch(key, loop)
+            self._pending[key] = pending
+            pending.handle = loop.call_later(self.delay, self._flush, pending)
+
+        future = loop.create_future()
+        pending.items.append((item, future))
+        if len(pending.items) >= self.max_size:
+            pending.handle.cancel()
+            self._flush(pending)
+        return await future
+
+    def _flush(self, pending: _PendingBatch) -> None:
+        if self._pending.get(pending.key) is pending:
+            del self._pending[pending.key]
+        task = pending.loop.create_task(self._send_all(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_all(self, pending: _PendingBatch) -> None:
+        try:
+            await self._send(pending.key, pending.items)
+        except Exception as e:
+            for _, future in pending.items:
+                resolve_future(future, None, e)
+
+    @abc.abstractmethod
+    async def _send(
+        self, key: Hashable, items: List[Tuple[Any, asyncio.Future]]
+    ) -> None:
+        raise NotImplementedError
+
+
+class BatchCoalescer(Coalescer):
+    """
+    Send requests issued within a short window as one HTTP batch.
+
+    Args:
+        delay: Seconds to wait for more requests before sending
+        max_size: Send immediately once this many requests are waiting
+    """
+
+    async def submit(self, service, request) -> Any:
+        """
+        Execute request, batched with others submitted for the same service.
+
+        Args:
+            service: Service the request was built from; it creates the batch
+            request: HttpRequest to execute (not yet executed)
+
+        Returns:
+            The request's response, as request.execute() would return it
+        """
+        return await self._submit(service, request)
+
+    async def _send(self, service, items: List[Tuple[Any, asyncio.Future]]) -> None:
+        if len(items) == 1:
+            request, future = items[0]
+            try:
+                result = await run_api_call(request.execute)
+            except Exception as e:
+                resolve_future(future, None, e)
+            else:
+                resolve_future(future, result, None)
+            return
+
+        responses: Dict[str, Tuple[Any, Any]] = {}
+
+        def collect(request_id, response, exception):
+            responses[request_id] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=collect)
+        for index, (request, _) in enumerate(items):
+            batch.add(request, request_id=str(index))
+
+        try:
+            await run_api_call(batch.execute)
+        except Exception as e:
+            logger.warning(f"Batch of {len(items)} requests failed: {e}")
+            for _, future in items:
+                resolve_future(future, None, e)
+            return
+
+        for index, (_, future) in enumerate(items):
+            response, exception = responses.get(
+                str(index), (None, RuntimeError("No response in batch"))
+            )
+            resolve_future(future, response, exception)
+
+
+def resolve_future(future: asyncio.Future, result: Any, exception: Any) -> None:
+    """Settle future with result or exception unless its caller gave up."""
+    if future.done():  # caller was cancelled
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
@@ -0,0 +1,94 @@
+"""
+Thread pool for blocking Google API calls.
+
+googleapiclient is synchronous, so every tool runs its .execute() calls in a
+worker thread. These calls are I/O bound and arrive in bursts, so they get a
+dedicated pool instead of sharing the event loop's default executor
+(min(32, cpu_count + 4) workers) with other blocking work.
+
+The pool size defaults to 16 and can be set with APPSCRIPT_MCP_POOL. Calls
+beyond that wait on an asyncio semaphore rather than in the executor's
+queue, so a cancelled tool call never reaches Google.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_DEFAULT_WORKERS = 16
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# asyncio.Semaphore binds to the loop that first waits on it, so each event
+# loop gets its own admission semaphore
+_admission: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_pool_size() -> int:
+    """Get the configured number of API worker threads."""
+    try:
+        size = int(os.getenv("APPSCRIPT_MCP_POOL", _DEFAULT_WORKERS))
+    except ValueError:
+        return _DEFAULT_WORKERS
+    return max(1, size)
+
+
+def get_api_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for Google API calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_pool_size(), thread_name_prefix="gapi"
+                )
+                atexit.register(shutdown_api_executor)
+    return _executor
+
+
+def shutdown_api_executor() -> None:
+    """Shut the API thread pool down, dropping calls that have not started."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_admission(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    semaphore = _admission.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_pool_size())
+        _admission[loop] = semaphore
+    return semaphore
+
+
+async def run_api_call(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking Google API call in the API thread pool.
+
+    Drop-in replacement for asyncio.to_thread: the current context is
+    propagated so request-scoped context variables stay visible.
+
+    Args:
+        func: Blocking callable, typically a request's .execute method
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    async with _get_admission(loop):
+        return await loop.run_in_executor(get_api_executor(), call)
@@ -0,0 +1,80 @@
+"""
+Persistent HTTP transport for Google API clients.
+
+By default googleapiclient.discovery.build() creates a fresh httplib2.Http
+for every service object, so each tool call opens a new TLS connection.
+httplib2.Http is not thread-safe, so instead of one shared instance each API
+worker thread keeps its own, and its keep-alive connections are reused by
+every service built afterwards, whichever user's credentials they carry.
+Token refreshes go through the same pool rather than a new requests.Session.
+"""
+
+import threading
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp, Request
+from googleapiclient.http import build_http
+
+_local = threading.local()
+
+
+def get_thread_http() -> httplib2.Http:
+    """Get the calling thread's pooled httplib2.Http, creating it on first use."""
+    http = getattr(_local, "http", None)
+    if http is None:
+        http = build_http()
+        _local.http = http
+    return http
+
+
+class _ThreadPooledHttp:
+    """httplib2.Http stand-in that delegates to the calling thread's instance."""
+
+    def request(self, *args, **kwargs):
+        return get_thread_http().request(*args, **kwargs)
+
+    def close(self):
+        http = getattr(_local, "http", None)
+        if http is not None:
+            http.close()
+
+    def add_certificate(self, *args, **kwargs):
+        get_thread_http().add_certificate(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # connections, timeout, follow_redirects, redirect_codes, ...
+        return getattr(get_thread_http(), name)
+
+
+_pooled_http = _ThreadPooledHttp()
+
+
+def authorized_http(credentials) -> AuthorizedHttp:
+    """
+    Wrap credentials in an AuthorizedHttp backed by the per-thread pool.
+
+    Pass the result to build(..., http=...) instead of credentials=.
+
+    Args:
+        credentials: google.auth credentials to authorize requests with
+
+    Returns:
+        AuthorizedHttp that reuses connections across service objects
+    """
+    return AuthorizedHttp(credentials, http=_pooled_http)
+
+
+_auth_request = Request(_pooled_http)
+
+
+def auth_request() -> Request:
+    """
+    Get the transport for credentials.refresh(), backed by the per-thread pool.
+
+    google.auth.transport.requests.Request() opens a new session, and with it
+    a new TLS connection to the token endpoint, every time it is created.
+
+    Returns:
+        google.auth transport Request that reuses pooled connections
+    """
+    return _auth_request
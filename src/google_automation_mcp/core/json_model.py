@@ -0,0 +1,69 @@
+"""
+Faster JSON response parsing for Google API clients.
+
+googleapiclient decodes every response body with the stdlib json module.
+When orjson is installed (the "fast" extra), services are built with a
+JsonModel that parses with orjson instead; otherwise googleapiclient's
+default model is used unchanged. Set APPSCRIPT_MCP_ORJSON=false to keep the
+stdlib parser even when orjson is installed.
+
+Request bodies are still serialized by the stdlib: batch requests embed them
+as text and count their length in characters, which is only correct for the
+ASCII-only output of json.dumps. dumps_bytes/loads serve callers that send
+raw bytes themselves, such as the Apps Script router client.
+"""
+
+import json
+import os
+from typing import Any, Optional
+
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+if os.getenv("APPSCRIPT_MCP_ORJSON", "true").lower() == "false":
+    orjson = None
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that deserializes response bodies with orjson."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Non-JSON bodies keep the stdlib model's behavior
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+_model = OrjsonModel() if orjson is not None else None
+
+
+def get_json_model() -> Optional[JsonModel]:
+    """
+    Get the model to pass to build(), or None to use googleapiclient's default.
+
+    Returns:
+        Shared OrjsonModel when orjson is installed, else None
+    """
+    return _model
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize value to UTF-8 JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+def loads(content) -> Any:
+    """Parse JSON from bytes or str, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -0,0 +1,42 @@
+"""
+Helpers for building Drive search queries.
+
+Drive queries quote string values in single quotes, and both the quote and
+the backslash must be escaped inside them. Tools that embed user text in a
+query share these helpers instead of each doing their own partial escaping.
+"""
+
+import re
+
+# Backslashes first, so the ones added for quotes are not doubled again
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", "'": "\\'"})
+
+# Operators that mark text as a Drive query rather than plain search terms;
+# word boundaries keep words like "containsKey" in plain text
+_STRUCTURED_QUERY = re.compile(r"\b(?:contains|in parents)\b|[=<>]", re.IGNORECASE)
+
+
+def quote_literal(value: str) -> str:
+    """
+    Quote a value for use as a string literal in a Drive query.
+
+    Args:
+        value: Raw user text
+
+    Returns:
+        The value escaped and wrapped in single quotes
+    """
+    return f"'{value.translate(_LITERAL_ESCAPES)}'"
+
+
+def is_structured_query(query: str) -> bool:
+    """
+    Check whether query already uses Drive query operators.
+
+    Args:
+        query: Search text from the caller
+
+    Returns:
+        True if query should be passed to Drive unchanged
+    """
+    return _STRUCTURED_QUERY.search(query) is not None
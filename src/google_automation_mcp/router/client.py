@@ -2,21 +2,43 @@
 Router Client
 
 Makes HTTP POST calls to the deployed Apps Script Web App router.
+
+Each call goes to script.google.com and is redirected to
+script.googleusercontent.com for the result. urlopen opened (and TLS
+handshook) both connections on every call; instead each API worker thread
+keeps an httplib2.Http whose keep-alive connections later calls reuse.
+httplib2 only follows redirects of GET and HEAD by default, so the pools
+are set to follow the POST's 302 as well (with a GET, as urlopen did).
 """
 
-import asyncio
-import json
 import logging
+import threading
 from typing import Any, Dict, Optional
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
 
+import httplib2
+
+from ..core.executor import run_api_call
+from ..core.json_model import dumps_bytes, loads
 from .deployer import ensure_router_deployed
 
 logger = logging.getLogger(__name__)
 
 _TIMEOUT = 30  # Apps Script max execution time
 
+# httplib2.Http is not thread-safe, so each worker thread has its own
+_local = threading.local()
+
+
+def _get_http() -> httplib2.Http:
+    """Get the calling thread's router connection pool."""
+    http = getattr(_local, "http", None)
+    if http is None:
+        http = httplib2.Http(timeout=_TIMEOUT)
+        # The router answers every POST with a 302 to the result
+        http.follow_all_redirects = True
+        _local.http = http
+    return http
+
 
 class RouterError(Exception):
     """Raised when the router returns an error."""
@@ -53,30 +75,29 @@ async def call_router(
     url = state["web_app_url"]
     secret = state["secret"]
 
-    payload = json.dumps({
+    payload = dumps_bytes({
         "secret": secret,
         "action": action,
         "params": params or {},
-    }).encode("utf-8")
+    })
 
     def _do_request():
-        req = Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
         try:
-            with urlopen(req, timeout=_TIMEOUT) as resp:
-                body = resp.read().decode("utf-8")
-                return json.loads(body)
-        except HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise RouterError(f"HTTP {e.code}: {body}", e.code)
-        except URLError as e:
-            raise RouterError(f"Connection error: {e.reason}")
-
-    result = await asyncio.to_thread(_do_request)
+            resp, content = _get_http().request(
+                url,
+                method="POST",
+                body=payload,
+                headers={"Content-Type": "application/json"},
+            )
+        except (httplib2.HttpLib2Error, OSError) as e:
+            raise RouterError(f"Connection error: {e}")
+        # Errors, and any redirect left unfollowed, carry no router result
+        if not 200 <= resp.status < 300:
+            body = content.decode("utf-8", errors="replace")
+            raise RouterError(f"HTTP {resp.status}: {body}", resp.status)
+        return loads(content)
+
+    result = await run_api_call(_do_request)
 
     if "error" in result:
         raise RouterError(
@@ -5,7 +5,6 @@ Creates and deploys the Apps Script Web App router per user.
 Uses the Apps Script API (via clasp auth) — no GCP project needed.
 """
 
-import asyncio
 import json
 import logging
 import os
@@ -15,7 +14,9 @@ from typing import Optional, Dict, Any
 
 from googleapiclient.errors import HttpError
 
+from ..appscript_tools import evict_script_project
 from ..auth import get_script_service
+from ..core.executor import run_api_call
 
 logger = logging.getLogger(__name__)
 
@@ -52,10 +53,10 @@ def _get_manifest() -> str:
 
 
 async def _create_script_project(title: str) -> str:
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
     body = {"title": title}
     try:
-        project = await asyncio.to_thread(
+        project = await run_api_call(
             service.projects().create(body=body).execute
         )
     except HttpError as e:
@@ -70,7 +71,7 @@ async def _create_script_project(title: str) -> str:
 
 
 async def _upload_script_content(script_id: str, secret: str) -> None:
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
     body = {
         "files": [
             {
@@ -85,17 +86,18 @@ async def _upload_script_content(script_id: str, secret: str) -> None:
             },
         ]
     }
-    await asyncio.to_thread(
+    await run_api_call(
         service.projects().updateContent(
             scriptId=script_id, body=body
         ).execute
     )
+    evict_script_project(script_id)
 
 
 async def _create_version(script_id: str, description: str) -> int:
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
     body = {"description": description}
-    version = await asyncio.to_thread(
+    version = await run_api_call(
         service.projects().versions().create(
             scriptId=script_id, body=body
         ).execute
@@ -104,13 +106,13 @@ async def _create_version(script_id: str, description: str) -> int:
 
 
 async def _create_web_app_deployment(script_id: str, version_number: int) -> str:
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
     body = {
         "versionNumber": version_number,
         "description": "MCP Router",
         "manifestFileName": "appsscript",
     }
-    deployment = await asyncio.to_thread(
+    deployment = await run_api_call(
         service.projects().deployments().create(
             scriptId=script_id, body=body
         ).execute
@@ -123,7 +125,7 @@ async def _create_web_app_deployment(script_id: str, version_number: int) -> str
 async def _update_deployment(
     script_id: str, deployment_id: str, version_number: int
 ) -> str:
-    service = get_script_service()
+    service = await run_api_call(get_script_service)
     body = {
         "deploymentConfig": {
             "versionNumber": version_number,
@@ -131,7 +133,7 @@ async def _update_deployment(
             "manifestFileName": "appsscript",
         }
     }
-    await asyncio.to_thread(
+    await run_api_call(
         service.projects().deployments().update(
             scriptId=script_id, deploymentId=deployment_id, body=body
         ).execute
@@ -190,8 +192,8 @@ async def update_router(user_email: str) -> Dict[str, Any]:
     version = await _create_version(script_id, "MCP Router update")
 
     # Find existing deployment to update
-    service = get_script_service()
-    deployments = await asyncio.to_thread(
+    service = await run_api_call(get_script_service)
+    deployments = await run_api_call(
         service.projects().deployments().list(scriptId=script_id).execute
     )
     deployment_list = deployments.get("deployments", [])
@@ -485,7 +485,10 @@ function createEvent(p) {
   }
   if (p.attendees) {
     var emails = p.attendees.split(',');
-    for (var i = 0; i < emails.length; i++) ev.addGuest(emails[i].trim());
+    for (var i = 0; i < emails.length; i++) {
+      var email = emails[i].trim();
+      if (email) ev.addGuest(email);
+    }
   }
   return {
     id: ev.getId(), summary: ev.getTitle(),
@@ -8,22 +8,19 @@ Tool registrations are split into modules:
 - server_auth.py: Authentication tools
 - server_appscript.py: Apps Script project, deployment, version, process, and metrics tools
 - server_workspace.py: Gmail, Drive, Sheets, Calendar, and Docs tools
+
+Each registration imports its tool implementation on first call, so the
+Google client libraries are not loaded until a tool is actually used.
 """
 
 import logging
 
 from fastmcp import FastMCP
 
-from . import __version__
 from .server_auth import register_auth_tools
 from .server_appscript import register_appscript_tools
 from .server_workspace import register_workspace_tools
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # Create MCP server
@@ -35,8 +32,19 @@ register_appscript_tools(mcp)
 register_workspace_tools(mcp)
 
 
+def _configure_logging():
+    """Install the server's root log handler (only when actually serving)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
 def main():
     """Run the MCP server."""
+    from . import __version__
+
+    _configure_logging()
     logger.info(f"Starting Apps Script MCP Server v{__version__}")
     logger.info("Authentication: clasp (recommended) or OAuth 2.0/2.1")
     logger.info("Run 'google-automation-mcp setup' to configure authentication")
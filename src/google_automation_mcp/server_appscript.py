@@ -5,24 +5,7 @@ Registers Apps Script project, deployment, version, process, and metrics tools
 with the MCP server.
 """
 
-from .tools import (
-    list_script_projects,
-    get_script_project,
-    get_script_content,
-    create_script_project,
-    delete_script_project,
-    update_script_content,
-    run_script_function,
-    create_deployment,
-    list_deployments,
-    update_deployment,
-    delete_deployment,
-    list_versions,
-    create_version,
-    get_version,
-    list_script_processes,
-    get_script_metrics,
-)
+from typing import Optional
 
 
 def register_appscript_tools(mcp):
@@ -32,7 +15,7 @@ def register_appscript_tools(mcp):
     # Project Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_script_projects_tool(
         page_size: int = 50,
         page_token: str = "",
@@ -44,22 +27,50 @@ def register_appscript_tools(mcp):
             page_size: Number of results per page (default: 50)
             page_token: Token for pagination (optional)
         """
+        from .tools import list_script_projects
+
         return await list_script_projects(
             page_size=page_size,
             page_token=page_token if page_token else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
+    async def list_script_projects_with_details_tool(
+        page_size: int = 50,
+        page_token: str = "",
+    ) -> str:
+        """
+        List Google Apps Script projects with the files in each project.
+
+        Fetches all project details in batched requests, so prefer this over
+        calling get_script_project for every project in a listing.
+
+        Args:
+            page_size: Number of results per page (default: 50)
+            page_token: Token for pagination (optional)
+        """
+        from .tools import list_script_projects_with_details
+
+        return await list_script_projects_with_details(
+            page_size=page_size,
+            page_token=page_token if page_token else None,
+        )
+
+    @mcp.tool(output_schema=None)
     async def get_script_project_tool(script_id: str) -> str:
         """
-        Retrieve complete project details including all source files.
+        Retrieve project details and the list of files it contains.
+
+        File sources are omitted; use get_script_content to read a file.
 
         Args:
             script_id: The script project ID
         """
+        from .tools import get_script_project
+
         return await get_script_project(script_id)
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_script_content_tool(script_id: str, file_name: str) -> str:
         """
         Retrieve content of a specific file within a project.
@@ -68,9 +79,26 @@ def register_appscript_tools(mcp):
             script_id: The script project ID
             file_name: Name of the file to retrieve (e.g., "Code", "appsscript")
         """
+        from .tools import get_script_content
+
         return await get_script_content(script_id, file_name)
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
+    async def bulk_get_script_contents_tool(script_id: str, file_names: list) -> str:
+        """
+        Retrieve the content of several files within a project in one call.
+
+        Prefer this over calling get_script_content once per file.
+
+        Args:
+            script_id: The script project ID
+            file_names: Names of the files to retrieve (e.g., ["Code", "appsscript"])
+        """
+        from .tools import bulk_get_script_contents
+
+        return await bulk_get_script_contents(script_id, file_names)
+
+    @mcp.tool(output_schema=None)
     async def create_script_project_tool(
         title: str,
         parent_id: str = "",
@@ -92,12 +120,14 @@ def register_appscript_tools(mcp):
                        Bound scripts can use document-specific features like custom menus,
                        onOpen triggers, and getActiveSpreadsheet().
         """
+        from .tools import create_script_project
+
         return await create_script_project(
             title=title,
             parent_id=parent_id if parent_id else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def delete_script_project_tool(script_id: str) -> str:
         """
         Delete an Apps Script project.
@@ -107,12 +137,15 @@ def register_appscript_tools(mcp):
         Args:
             script_id: The script project ID to delete
         """
+        from .tools import delete_script_project
+
         return await delete_script_project(script_id)
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def update_script_content_tool(
         script_id: str,
         files: list,
+        flush_immediately: bool = True,
     ) -> str:
         """
         Update or create files in a script project.
@@ -123,17 +156,24 @@ def register_appscript_tools(mcp):
                    - name: File name (e.g., "Code", "Utils")
                    - type: File type ("SERVER_JS", "HTML", or "JSON")
                    - source: File content as string
+            flush_immediately: Send right away (default). Pass false when making
+                               many rapid edits to merge updates to the same
+                               script sent within 100 ms into one request.
 
         Example files parameter:
             [{"name": "Code", "type": "SERVER_JS", "source": "function main() { Logger.log('Hello'); }"}]
         """
-        return await update_script_content(script_id, files)
+        from .tools import update_script_content
+
+        return await update_script_content(
+            script_id, files, flush_immediately=flush_immediately
+        )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def run_script_function_tool(
         script_id: str,
         function_name: str,
-        parameters: list = None,
+        parameters: Optional[list] = None,
         dev_mode: bool = False,
     ) -> str:
         """
@@ -148,17 +188,20 @@ def register_appscript_tools(mcp):
             parameters: Optional list of parameters to pass to the function
             dev_mode: If True, run latest code; if False, run deployed version
         """
+        from .tools import run_script_function
+
         return await run_script_function(script_id, function_name, parameters, dev_mode)
 
     # ========================================================================
     # Deployment Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_deployment_tool(
         script_id: str,
         description: str,
         version_description: str = "",
+        version_number: int = 0,
     ) -> str:
         """
         Create a new deployment of the script.
@@ -167,14 +210,41 @@ def register_appscript_tools(mcp):
             script_id: The script project ID
             description: Deployment description
             version_description: Optional version description (defaults to deployment description)
+            version_number: Optional existing version to deploy. If omitted, a new
+                            version is created from the current code first.
         """
+        from .tools import create_deployment
+
         return await create_deployment(
             script_id=script_id,
             description=description,
             version_description=version_description if version_description else None,
+            version_number=version_number if version_number else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
+    async def create_deployments_bulk_tool(
+        script_ids: list,
+        description: str,
+        version_description: str = "",
+    ) -> str:
+        """
+        Create a deployment for each of several scripts concurrently.
+
+        Args:
+            script_ids: List of script project IDs to deploy
+            description: Deployment description used for every script
+            version_description: Optional version description (defaults to deployment description)
+        """
+        from .tools import create_deployments_bulk
+
+        return await create_deployments_bulk(
+            script_ids=script_ids,
+            description=description,
+            version_description=version_description if version_description else None,
+        )
+
+    @mcp.tool(output_schema=None)
     async def list_deployments_tool(script_id: str) -> str:
         """
         List all deployments for a script project.
@@ -182,9 +252,11 @@ def register_appscript_tools(mcp):
         Args:
             script_id: The script project ID
         """
+        from .tools import list_deployments
+
         return await list_deployments(script_id)
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def update_deployment_tool(
         script_id: str,
         deployment_id: str,
@@ -198,13 +270,15 @@ def register_appscript_tools(mcp):
             deployment_id: The deployment ID to update
             description: New description for the deployment
         """
+        from .tools import update_deployment
+
         return await update_deployment(
             script_id=script_id,
             deployment_id=deployment_id,
             description=description if description else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def delete_deployment_tool(script_id: str, deployment_id: str) -> str:
         """
         Delete a deployment.
@@ -213,13 +287,15 @@ def register_appscript_tools(mcp):
             script_id: The script project ID
             deployment_id: The deployment ID to delete
         """
+        from .tools import delete_deployment
+
         return await delete_deployment(script_id, deployment_id)
 
     # ========================================================================
     # Version Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_versions_tool(script_id: str) -> str:
         """
         List all versions of a script project.
@@ -230,9 +306,11 @@ def register_appscript_tools(mcp):
         Args:
             script_id: The script project ID
         """
+        from .tools import list_versions
+
         return await list_versions(script_id)
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_version_tool(
         script_id: str,
         description: str = "",
@@ -247,12 +325,14 @@ def register_appscript_tools(mcp):
             script_id: The script project ID
             description: Optional description for this version
         """
+        from .tools import create_version
+
         return await create_version(
             script_id=script_id,
             description=description if description else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_version_tool(script_id: str, version_number: int) -> str:
         """
         Get details of a specific version.
@@ -261,13 +341,15 @@ def register_appscript_tools(mcp):
             script_id: The script project ID
             version_number: The version number to retrieve (1, 2, 3, etc.)
         """
+        from .tools import get_version
+
         return await get_version(script_id, version_number)
 
     # ========================================================================
     # Process Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_script_processes_tool(
         page_size: int = 50,
         script_id: str = "",
@@ -279,6 +361,8 @@ def register_appscript_tools(mcp):
             page_size: Number of results (default: 50)
             script_id: Optional filter by script ID
         """
+        from .tools import list_script_processes
+
         return await list_script_processes(
             page_size=page_size,
             script_id=script_id if script_id else None,
@@ -288,7 +372,7 @@ def register_appscript_tools(mcp):
     # Metrics Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_script_metrics_tool(
         script_id: str,
         metrics_granularity: str = "DAILY",
@@ -303,6 +387,8 @@ def register_appscript_tools(mcp):
             script_id: The script project ID
             metrics_granularity: Granularity of metrics - "DAILY" or "WEEKLY"
         """
+        from .tools import get_script_metrics
+
         return await get_script_metrics(
             script_id=script_id,
             metrics_granularity=metrics_granularity,
@@ -312,7 +398,7 @@ def register_appscript_tools(mcp):
     # Trigger Helper Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def generate_trigger_code(
         trigger_type: str,
         function_name: str,
@@ -4,56 +4,7 @@ Google Workspace Tool Registrations
 Registers Gmail, Drive, Sheets, Calendar, and Docs tools with the MCP server.
 """
 
-from .tools import (
-    # Gmail
-    search_gmail_messages,
-    get_gmail_message,
-    send_gmail_message,
-    list_gmail_labels,
-    modify_gmail_labels,
-    # Drive
-    search_drive_files,
-    list_drive_items,
-    get_drive_file_content,
-    create_drive_file,
-    create_drive_folder,
-    delete_drive_file,
-    trash_drive_file,
-    share_drive_file,
-    list_drive_permissions,
-    remove_drive_permission,
-    # Sheets
-    list_spreadsheets,
-    get_sheet_values,
-    update_sheet_values,
-    create_spreadsheet,
-    append_sheet_values,
-    get_spreadsheet_metadata,
-    # Calendar
-    list_calendars,
-    get_events,
-    create_event,
-    delete_event,
-    update_event,
-    # Docs
-    search_docs,
-    get_doc_content,
-    create_doc,
-    modify_doc_text,
-    append_doc_text,
-    # Tasks
-    list_task_lists,
-    get_tasks,
-    create_task,
-    update_task as update_task_impl,
-    delete_task,
-    complete_task,
-    # Forms
-    get_form,
-    get_form_responses,
-    create_form,
-    add_form_question,
-)
+from typing import Optional
 
 
 def register_workspace_tools(mcp):
@@ -63,7 +14,7 @@ def register_workspace_tools(mcp):
     # Gmail Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def search_gmail_messages_tool(
         user_google_email: str,
         query: str = "",
@@ -77,13 +28,15 @@ def register_workspace_tools(mcp):
             query: Gmail search query (e.g., "from:user@example.com subject:hello")
             max_results: Maximum number of messages to return (default: 10)
         """
+        from .tools import search_gmail_messages
+
         return await search_gmail_messages(
             user_google_email=user_google_email,
             query=query,
             max_results=max_results,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_gmail_message_tool(
         user_google_email: str,
         message_id: str,
@@ -97,13 +50,15 @@ def register_workspace_tools(mcp):
             message_id: The message ID to retrieve
             format: Message format - "full", "metadata", or "minimal"
         """
+        from .tools import get_gmail_message
+
         return await get_gmail_message(
             user_google_email=user_google_email,
             message_id=message_id,
             format=format,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def send_gmail_message_tool(
         user_google_email: str,
         to: str,
@@ -125,6 +80,8 @@ def register_workspace_tools(mcp):
             bcc: Optional BCC recipients, comma-separated
             html: If True, body is treated as HTML
         """
+        from .tools import send_gmail_message
+
         return await send_gmail_message(
             user_google_email=user_google_email,
             to=to,
@@ -135,7 +92,7 @@ def register_workspace_tools(mcp):
             html=html,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_gmail_labels_tool(user_google_email: str) -> str:
         """
         List all Gmail labels for the user.
@@ -143,14 +100,16 @@ def register_workspace_tools(mcp):
         Args:
             user_google_email: The user's Google email address
         """
+        from .tools import list_gmail_labels
+
         return await list_gmail_labels(user_google_email=user_google_email)
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def modify_gmail_labels_tool(
         user_google_email: str,
         message_id: str,
-        add_labels: list = None,
-        remove_labels: list = None,
+        add_labels: Optional[list] = None,
+        remove_labels: Optional[list] = None,
     ) -> str:
         """
         Modify labels on a Gmail message.
@@ -176,6 +135,8 @@ def register_workspace_tools(mcp):
             - Star: add_labels=["STARRED"]
             - Move to trash: add_labels=["TRASH"]
         """
+        from .tools import modify_gmail_labels
+
         return await modify_gmail_labels(
             user_google_email=user_google_email,
             message_id=message_id,
@@ -183,11 +144,38 @@ def register_workspace_tools(mcp):
             remove_labels=remove_labels,
         )
 
+    @mcp.tool(output_schema=None)
+    async def modify_gmail_labels_bulk_tool(
+        user_google_email: str,
+        message_ids: list,
+        add_labels: Optional[list] = None,
+        remove_labels: Optional[list] = None,
+    ) -> str:
+        """
+        Apply the same label changes to many Gmail messages in one call.
+
+        Prefer this over calling modify_gmail_labels once per message.
+
+        Args:
+            user_google_email: The user's Google email address
+            message_ids: IDs of the messages to modify
+            add_labels: List of label IDs to add (e.g., ["STARRED", "IMPORTANT"])
+            remove_labels: List of label IDs to remove (e.g., ["UNREAD", "INBOX"])
+        """
+        from .tools import modify_gmail_labels_bulk
+
+        return await modify_gmail_labels_bulk(
+            user_google_email=user_google_email,
+            message_ids=message_ids,
+            add_labels=add_labels,
+            remove_labels=remove_labels,
+        )
+
     # ========================================================================
     # Drive Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def search_drive_files_tool(
         user_google_email: str,
         query: str,
@@ -205,13 +193,15 @@ def register_workspace_tools(mcp):
                    - modifiedTime > '2024-01-01'
             page_size: Maximum number of files to return (default: 10)
         """
+        from .tools import search_drive_files
+
         return await search_drive_files(
             user_google_email=user_google_email,
             query=query,
             page_size=page_size,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_drive_items_tool(
         user_google_email: str,
         folder_id: str = "root",
@@ -225,13 +215,15 @@ def register_workspace_tools(mcp):
             folder_id: The folder ID to list (default: 'root' for My Drive root)
             page_size: Maximum number of items to return (default: 50)
         """
+        from .tools import list_drive_items
+
         return await list_drive_items(
             user_google_email=user_google_email,
             folder_id=folder_id,
             page_size=page_size,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_drive_file_content_tool(
         user_google_email: str,
         file_id: str,
@@ -245,12 +237,14 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             file_id: The Drive file ID
         """
+        from .tools import get_drive_file_content
+
         return await get_drive_file_content(
             user_google_email=user_google_email,
             file_id=file_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_drive_file_tool(
         user_google_email: str,
         file_name: str,
@@ -268,6 +262,8 @@ def register_workspace_tools(mcp):
             folder_id: Parent folder ID (default: 'root')
             mime_type: MIME type of the file (default: 'text/plain')
         """
+        from .tools import create_drive_file
+
         return await create_drive_file(
             user_google_email=user_google_email,
             file_name=file_name,
@@ -276,7 +272,7 @@ def register_workspace_tools(mcp):
             mime_type=mime_type,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_drive_folder_tool(
         user_google_email: str,
         folder_name: str,
@@ -290,13 +286,15 @@ def register_workspace_tools(mcp):
             folder_name: Name for the new folder
             parent_id: Parent folder ID (default: 'root' for My Drive root)
         """
+        from .tools import create_drive_folder
+
         return await create_drive_folder(
             user_google_email=user_google_email,
             folder_name=folder_name,
             parent_id=parent_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def delete_drive_file_tool(
         user_google_email: str,
         file_id: str,
@@ -310,12 +308,14 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             file_id: The file ID to delete
         """
+        from .tools import delete_drive_file
+
         return await delete_drive_file(
             user_google_email=user_google_email,
             file_id=file_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def trash_drive_file_tool(
         user_google_email: str,
         file_id: str,
@@ -327,12 +327,14 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             file_id: The file ID to trash
         """
+        from .tools import trash_drive_file
+
         return await trash_drive_file(
             user_google_email=user_google_email,
             file_id=file_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def share_drive_file_tool(
         user_google_email: str,
         file_id: str,
@@ -350,6 +352,8 @@ def register_workspace_tools(mcp):
             role: Permission role - "reader", "writer", "commenter", or "owner"
             send_notification: Whether to send an email notification (default: True)
         """
+        from .tools import share_drive_file
+
         return await share_drive_file(
             user_google_email=user_google_email,
             file_id=file_id,
@@ -358,7 +362,7 @@ def register_workspace_tools(mcp):
             send_notification=send_notification,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_drive_permissions_tool(
         user_google_email: str,
         file_id: str,
@@ -370,12 +374,14 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             file_id: The file or folder ID
         """
+        from .tools import list_drive_permissions
+
         return await list_drive_permissions(
             user_google_email=user_google_email,
             file_id=file_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def remove_drive_permission_tool(
         user_google_email: str,
         file_id: str,
@@ -389,6 +395,8 @@ def register_workspace_tools(mcp):
             file_id: The file or folder ID
             permission_id: The permission ID to remove (from list_drive_permissions)
         """
+        from .tools import remove_drive_permission
+
         return await remove_drive_permission(
             user_google_email=user_google_email,
             file_id=file_id,
@@ -399,7 +407,7 @@ def register_workspace_tools(mcp):
     # Sheets Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_spreadsheets_tool(
         user_google_email: str,
         query: str = "",
@@ -413,13 +421,15 @@ def register_workspace_tools(mcp):
             query: Optional search query to filter spreadsheets
             page_size: Maximum number of spreadsheets to return (default: 20)
         """
+        from .tools import list_spreadsheets
+
         return await list_spreadsheets(
             user_google_email=user_google_email,
             query=query,
             page_size=page_size,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_sheet_values_tool(
         user_google_email: str,
         spreadsheet_id: str,
@@ -435,6 +445,8 @@ def register_workspace_tools(mcp):
             range: A1 notation range (e.g., "Sheet1!A1:D10" or just "Sheet1")
             value_render: How values should be rendered - "FORMATTED_VALUE", "UNFORMATTED_VALUE", or "FORMULA"
         """
+        from .tools import get_sheet_values
+
         return await get_sheet_values(
             user_google_email=user_google_email,
             spreadsheet_id=spreadsheet_id,
@@ -442,7 +454,7 @@ def register_workspace_tools(mcp):
             value_render=value_render,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def update_sheet_values_tool(
         user_google_email: str,
         spreadsheet_id: str,
@@ -460,6 +472,8 @@ def register_workspace_tools(mcp):
             values: 2D array of values to write. Example: [["Header1", "Header2"], ["Value1", "Value2"]]
             value_input: How input values should be interpreted - "USER_ENTERED" or "RAW"
         """
+        from .tools import update_sheet_values
+
         return await update_sheet_values(
             user_google_email=user_google_email,
             spreadsheet_id=spreadsheet_id,
@@ -468,11 +482,11 @@ def register_workspace_tools(mcp):
             value_input=value_input,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_spreadsheet_tool(
         user_google_email: str,
         title: str,
-        sheet_names: list = None,
+        sheet_names: Optional[list] = None,
     ) -> str:
         """
         Create a new Google Spreadsheet.
@@ -482,13 +496,15 @@ def register_workspace_tools(mcp):
             title: Title for the new spreadsheet
             sheet_names: Optional list of sheet names to create (default: ["Sheet1"])
         """
+        from .tools import create_spreadsheet
+
         return await create_spreadsheet(
             user_google_email=user_google_email,
             title=title,
             sheet_names=sheet_names,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def append_sheet_values_tool(
         user_google_email: str,
         spreadsheet_id: str,
@@ -506,6 +522,8 @@ def register_workspace_tools(mcp):
             values: 2D array of values to append. Example: [["Value1", "Value2"], ["Value3", "Value4"]]
             value_input: How input values should be interpreted - "USER_ENTERED" or "RAW"
         """
+        from .tools import append_sheet_values
+
         return await append_sheet_values(
             user_google_email=user_google_email,
             spreadsheet_id=spreadsheet_id,
@@ -514,7 +532,7 @@ def register_workspace_tools(mcp):
             value_input=value_input,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_spreadsheet_metadata_tool(
         user_google_email: str,
         spreadsheet_id: str,
@@ -526,6 +544,8 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             spreadsheet_id: The spreadsheet ID
         """
+        from .tools import get_spreadsheet_metadata
+
         return await get_spreadsheet_metadata(
             user_google_email=user_google_email,
             spreadsheet_id=spreadsheet_id,
@@ -535,7 +555,7 @@ def register_workspace_tools(mcp):
     # Calendar Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_calendars_tool(user_google_email: str) -> str:
         """
         List all calendars accessible to the user.
@@ -543,9 +563,11 @@ def register_workspace_tools(mcp):
         Args:
             user_google_email: The user's Google email address
         """
+        from .tools import list_calendars
+
         return await list_calendars(user_google_email=user_google_email)
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_events_tool(
         user_google_email: str,
         calendar_id: str = "primary",
@@ -565,6 +587,8 @@ def register_workspace_tools(mcp):
             time_max: End time in ISO format (default: 7 days from now)
             query: Optional search query string
         """
+        from .tools import get_events
+
         return await get_events(
             user_google_email=user_google_email,
             calendar_id=calendar_id,
@@ -574,7 +598,40 @@ def register_workspace_tools(mcp):
             query=query if query else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
+    async def get_events_multi_tool(
+        user_google_email: str,
+        calendar_ids: Optional[list] = None,
+        max_results: int = 10,
+        time_min: str = "",
+        time_max: str = "",
+        query: str = "",
+    ) -> str:
+        """
+        Get events from several calendars in one call.
+
+        Prefer this over calling get_events once per calendar.
+
+        Args:
+            user_google_email: The user's Google email address
+            calendar_ids: Calendar IDs to read (default: all of the user's calendars)
+            max_results: Maximum number of events to return per calendar (default: 10)
+            time_min: Start time in ISO format (default: now)
+            time_max: End time in ISO format (default: 7 days from now)
+            query: Optional search query string
+        """
+        from .tools import get_events_multi
+
+        return await get_events_multi(
+            user_google_email=user_google_email,
+            calendar_ids=calendar_ids,
+            max_results=max_results,
+            time_min=time_min if time_min else None,
+            time_max=time_max if time_max else None,
+            query=query if query else None,
+        )
+
+    @mcp.tool(output_schema=None)
     async def create_event_tool(
         user_google_email: str,
         summary: str,
@@ -600,6 +657,8 @@ def register_workspace_tools(mcp):
             attendees: Optional comma-separated list of attendee emails
             all_day: If True, create an all-day event (use date format for start/end)
         """
+        from .tools import create_event
+
         return await create_event(
             user_google_email=user_google_email,
             summary=summary,
@@ -612,7 +671,7 @@ def register_workspace_tools(mcp):
             all_day=all_day,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def delete_event_tool(
         user_google_email: str,
         event_id: str,
@@ -626,13 +685,15 @@ def register_workspace_tools(mcp):
             event_id: The event ID to delete
             calendar_id: Calendar ID (default: 'primary')
         """
+        from .tools import delete_event
+
         return await delete_event(
             user_google_email=user_google_email,
             event_id=event_id,
             calendar_id=calendar_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def update_event_tool(
         user_google_email: str,
         event_id: str,
@@ -660,6 +721,8 @@ def register_workspace_tools(mcp):
             attendees: New comma-separated list of attendee emails (optional)
             all_day: If True and updating times, use date format
         """
+        from .tools import update_event
+
         return await update_event(
             user_google_email=user_google_email,
             event_id=event_id,
@@ -677,7 +740,7 @@ def register_workspace_tools(mcp):
     # Docs Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def search_docs_tool(
         user_google_email: str,
         query: str,
@@ -691,13 +754,15 @@ def register_workspace_tools(mcp):
             query: Search query string
             page_size: Maximum number of docs to return (default: 10)
         """
+        from .tools import search_docs
+
         return await search_docs(
             user_google_email=user_google_email,
             query=query,
             page_size=page_size,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_doc_content_tool(
         user_google_email: str,
         document_id: str,
@@ -709,12 +774,14 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             document_id: The document ID
         """
+        from .tools import get_doc_content
+
         return await get_doc_content(
             user_google_email=user_google_email,
             document_id=document_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_doc_tool(
         user_google_email: str,
         title: str,
@@ -728,13 +795,15 @@ def register_workspace_tools(mcp):
             title: Document title
             content: Optional initial content
         """
+        from .tools import create_doc
+
         return await create_doc(
             user_google_email=user_google_email,
             title=title,
             content=content,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def modify_doc_text_tool(
         user_google_email: str,
         document_id: str,
@@ -752,6 +821,8 @@ def register_workspace_tools(mcp):
             index: Position to insert text (default: 1, start of document)
             replace_text: If provided, find and replace this text with 'text'
         """
+        from .tools import modify_doc_text
+
         return await modify_doc_text(
             user_google_email=user_google_email,
             document_id=document_id,
@@ -760,7 +831,7 @@ def register_workspace_tools(mcp):
             replace_text=replace_text if replace_text else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def append_doc_text_tool(
         user_google_email: str,
         document_id: str,
@@ -774,6 +845,8 @@ def register_workspace_tools(mcp):
             document_id: The document ID
             text: Text to append to the end of the document
         """
+        from .tools import append_doc_text
+
         return await append_doc_text(
             user_google_email=user_google_email,
             document_id=document_id,
@@ -784,7 +857,7 @@ def register_workspace_tools(mcp):
     # Tasks Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def list_task_lists_tool(
         user_google_email: str,
         max_results: int = 20,
@@ -796,12 +869,14 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             max_results: Maximum number of task lists to return (default: 20)
         """
+        from .tools import list_task_lists
+
         return await list_task_lists(
             user_google_email=user_google_email,
             max_results=max_results,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_tasks_tool(
         user_google_email: str,
         tasklist_id: str = "@default",
@@ -819,6 +894,8 @@ def register_workspace_tools(mcp):
             show_completed: Whether to include completed tasks (default: True)
             show_hidden: Whether to include hidden tasks (default: False)
         """
+        from .tools import get_tasks
+
         return await get_tasks(
             user_google_email=user_google_email,
             tasklist_id=tasklist_id,
@@ -827,7 +904,7 @@ def register_workspace_tools(mcp):
             show_hidden=show_hidden,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_task_tool(
         user_google_email: str,
         title: str,
@@ -845,6 +922,8 @@ def register_workspace_tools(mcp):
             notes: Optional task notes/description
             due: Optional due date in RFC 3339 format (e.g., "2024-01-15T00:00:00.000Z")
         """
+        from .tools import create_task
+
         return await create_task(
             user_google_email=user_google_email,
             title=title,
@@ -853,7 +932,7 @@ def register_workspace_tools(mcp):
             due=due if due else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def update_task_tool(
         user_google_email: str,
         task_id: str,
@@ -875,6 +954,8 @@ def register_workspace_tools(mcp):
             due: New due date in RFC 3339 format (optional)
             status: New status - "needsAction" or "completed" (optional)
         """
+        from .tools import update_task as update_task_impl
+
         return await update_task_impl(
             user_google_email=user_google_email,
             task_id=task_id,
@@ -885,7 +966,7 @@ def register_workspace_tools(mcp):
             status=status if status else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def delete_task_tool(
         user_google_email: str,
         task_id: str,
@@ -899,13 +980,15 @@ def register_workspace_tools(mcp):
             task_id: The task ID to delete
             tasklist_id: Task list ID (default: '@default')
         """
+        from .tools import delete_task
+
         return await delete_task(
             user_google_email=user_google_email,
             task_id=task_id,
             tasklist_id=tasklist_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def complete_task_tool(
         user_google_email: str,
         task_id: str,
@@ -919,6 +1002,8 @@ def register_workspace_tools(mcp):
             task_id: The task ID to complete
             tasklist_id: Task list ID (default: '@default')
         """
+        from .tools import complete_task
+
         return await complete_task(
             user_google_email=user_google_email,
             task_id=task_id,
@@ -929,7 +1014,7 @@ def register_workspace_tools(mcp):
     # Forms Tools
     # ========================================================================
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_form_tool(
         user_google_email: str,
         form_id: str,
@@ -941,12 +1026,14 @@ def register_workspace_tools(mcp):
             user_google_email: The user's Google email address
             form_id: The form ID
         """
+        from .tools import get_form
+
         return await get_form(
             user_google_email=user_google_email,
             form_id=form_id,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def get_form_responses_tool(
         user_google_email: str,
         form_id: str,
@@ -960,13 +1047,15 @@ def register_workspace_tools(mcp):
             form_id: The form ID
             max_results: Maximum number of responses to return (default: 50)
         """
+        from .tools import get_form_responses
+
         return await get_form_responses(
             user_google_email=user_google_email,
             form_id=form_id,
             max_results=max_results,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def create_form_tool(
         user_google_email: str,
         title: str,
@@ -980,13 +1069,15 @@ def register_workspace_tools(mcp):
             title: Form title
             description: Optional form description
         """
+        from .tools import create_form
+
         return await create_form(
             user_google_email=user_google_email,
             title=title,
             description=description if description else None,
         )
 
-    @mcp.tool()
+    @mcp.tool(output_schema=None)
     async def add_form_question_tool(
         user_google_email: str,
         form_id: str,
@@ -1007,6 +1098,8 @@ def register_workspace_tools(mcp):
             required: Whether the question is required (default: False)
             choices: Comma-separated choices (for MULTIPLE_CHOICE, CHECKBOX, DROP_DOWN)
         """
+        from .tools import add_form_question
+
         return await add_form_question(
             user_google_email=user_google_email,
             form_id=form_id,
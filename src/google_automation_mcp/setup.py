@@ -5,24 +5,46 @@ Guides users through authentication setup with environment detection
 and sensible defaults.
 """
 
+import functools
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .auth.clasp import (
     install_clasp_global,
     run_clasp_login,
     detect_clasp_environment,
+    get_clasp_tokens,
+)
+from .auth.oauth_config import (
+    is_oauth_configured,
+    get_oauth_config,
+    reload_oauth_config,
 )
-from .auth.oauth_config import is_oauth_configured, get_oauth_config
 from .auth.credential_store import get_credential_store
-from .auth.google_auth import store_credentials, get_user_email_from_credentials
+from .auth.google_auth import (
+    store_credentials,
+    get_user_email_from_credentials,
+    clasp_tokens_to_credentials,
+)
+
+_RULE = "=" * 50
 
 
+def _print_header(title: str, gap: bool = False) -> None:
+    """Print title between two rules, with a blank line after if gap."""
+    print(f"\n{_RULE}\n{title}\n{_RULE}" + ("\n" if gap else ""))
+
+
+@functools.cache
 def detect_environment() -> Dict[str, Any]:
     """
     Detect the current environment and available authentication options.
 
+    Probing clasp spawns subprocesses, so the result is cached for the life
+    of the process. Call detect_environment.cache_clear() after anything that
+    changes it (new credentials, OAuth settings).
+
     Returns:
         Dict with environment detection results
     """
@@ -62,41 +84,27 @@ def detect_environment() -> Dict[str, Any]:
     }
 
 
+# (env key, message when true, message when false)
+_DETECTION_CHECKS = (
+    ("is_interactive", "Interactive terminal", "Non-interactive terminal"),
+    ("has_browser", "Browser available", "No browser (DISPLAY not set)"),
+    ("node_installed", "Node.js installed", "Node.js not installed"),
+    ("clasp_installed", "clasp installed", "clasp not installed"),
+)
+
+
 def print_detection_results(env: Dict[str, Any]) -> None:
     """Print environment detection results."""
     print("\nDetecting environment...")
 
-    # Terminal
-    if env["is_interactive"]:
-        print("✓ Interactive terminal")
-    else:
-        print("✗ Non-interactive terminal")
-
-    # Browser
-    if env["has_browser"]:
-        print("✓ Browser available")
-    else:
-        print("✗ No browser (DISPLAY not set)")
-
-    # Node.js / clasp
-    if env["node_installed"]:
-        print("✓ Node.js installed")
-    else:
-        print("✗ Node.js not installed")
-
-    if env["clasp_installed"]:
-        print("✓ clasp installed")
-    else:
-        print("✗ clasp not installed")
+    for key, present, missing in _DETECTION_CHECKS:
+        print(f"✓ {present}" if env[key] else f"✗ {missing}")
 
+    # Only reported when present
     if env["clasp_authenticated"]:
         print(f"✓ clasp authenticated ({env['clasp_user']})")
-
-    # OAuth
     if env["oauth_configured"]:
         print("✓ GCP OAuth credentials configured")
-
-    # Existing credentials
     if env["has_credentials"]:
         print(f"✓ Existing credentials found ({len(env['existing_users'])} user(s))")
 
@@ -207,17 +215,16 @@ def setup_clasp(env: Dict[str, Any]) -> bool:
     Returns:
         True if successful
     """
-    print("\n" + "=" * 50)
-    print("clasp Setup (Local/CLI)")
-    print("=" * 50 + "\n")
+    _print_header("clasp Setup (Local/CLI)", gap=True)
 
     # Already authenticated?
     if env["clasp_authenticated"]:
         print(f"Already authenticated as: {env['clasp_user']}")
         response = input("Re-authenticate? [y/N]: ").strip().lower()
         if response != "y":
-            # Import existing clasp credentials
-            _import_clasp_credentials()
+            # Import existing clasp credentials; detection already found
+            # the account, so no second userinfo request is needed
+            _import_clasp_credentials(env["clasp_user"])
             return True
         print()
 
@@ -251,11 +258,14 @@ def setup_clasp(env: Dict[str, Any]) -> bool:
     return success
 
 
-def _import_clasp_credentials() -> bool:
-    """Import clasp credentials into our credential store."""
-    from .auth.clasp import get_clasp_tokens
-    from .auth.google_auth import clasp_tokens_to_credentials
+def _import_clasp_credentials(user_email: Optional[str] = None) -> bool:
+    """
+    Import clasp credentials into our credential store.
 
+    Args:
+        user_email: The clasp account's email when already known (environment
+            detection looks it up); otherwise it is fetched from userinfo
+    """
     tokens = get_clasp_tokens()
     if not tokens:
         return False
@@ -264,9 +274,11 @@ def _import_clasp_credentials() -> bool:
     if not creds:
         return False
 
-    user_email = get_user_email_from_credentials(creds)
+    if not user_email:
+        user_email = get_user_email_from_credentials(creds)
     if user_email:
         store_credentials(creds, user_email)
+        detect_environment.cache_clear()
         print(f"\n✓ Credentials stored for {user_email}")
         return True
 
@@ -280,9 +292,7 @@ def setup_oauth(env: Dict[str, Any]) -> bool:
     Returns:
         True if successful
     """
-    print("\n" + "=" * 50)
-    print("OAuth 2.1 Setup (Server/Multi-user)")
-    print("=" * 50 + "\n")
+    _print_header("OAuth 2.1 Setup (Server/Multi-user)", gap=True)
 
     if env["oauth_configured"]:
         print("OAuth credentials already configured via environment variables.")
@@ -317,6 +327,8 @@ def setup_oauth(env: Dict[str, Any]) -> bool:
     # Save to environment (for this session)
     os.environ["GOOGLE_OAUTH_CLIENT_ID"] = client_id
     os.environ["GOOGLE_OAUTH_CLIENT_SECRET"] = client_secret
+    reload_oauth_config()
+    detect_environment.cache_clear()
 
     print("\n✓ OAuth credentials configured for this session")
     print()
@@ -336,9 +348,7 @@ def run_setup() -> bool:
     Returns:
         True if setup completed successfully
     """
-    print("\n" + "=" * 50)
-    print("Google Workspace MCP Setup")
-    print("=" * 50)
+    _print_header("Google Workspace MCP Setup")
 
     # Detect environment
     env = detect_environment()
@@ -372,18 +382,14 @@ def run_setup() -> bool:
         success = clasp_ok or oauth_ok
 
     if success:
-        print("\n" + "=" * 50)
-        print("Setup Complete!")
-        print("=" * 50)
+        _print_header("Setup Complete!")
         print("\nYou can now use google-automation-mcp with your MCP client.")
         print("Example prompts:")
         print('  "List my Apps Script projects"')
         print('  "Show my recent Gmail messages"')
         print('  "List files in my Google Drive"')
     else:
-        print("\n" + "=" * 50)
-        print("Setup Incomplete")
-        print("=" * 50)
+        _print_header("Setup Incomplete")
         print("\nRun 'google-automation-mcp setup' again to complete setup.")
 
     return success
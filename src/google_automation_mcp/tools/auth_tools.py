@@ -65,10 +65,11 @@ async def complete_google_auth(redirect_url: str) -> str:
         # Get user email to confirm
         try:
             from google.oauth2 import id_token
-            from google.auth.transport import requests
+            from ..core.http import auth_request
 
+            # Fetching Google's signing certificates reuses pooled connections
             info = id_token.verify_oauth2_token(
-                creds.id_token, requests.Request(), creds.client_id
+                creds.id_token, auth_request(), creds.client_id
             )
             email = info.get("email", "unknown")
         except Exception:
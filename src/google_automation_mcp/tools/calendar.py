@@ -11,14 +11,125 @@ Licensed under MIT License.
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
 
 from ..auth.service_adapter import with_calendar_service
+from ..core.cache import TTLCache
+from ..core.executor import run_api_call
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Calendar subscriptions change rarely, and agents list them to find IDs
+_calendars_cache: TTLCache[List[dict]] = TTLCache(maxsize=1024, ttl=300)
+
+
+def _parse_attendees(attendees: str) -> List[dict]:
+    """Turn a comma-separated address list into attendee resources."""
+    # Blank entries (from "a@x.com, " or ",,") would be rejected by the API
+    return [{"email": email} for email in map(str.strip, attendees.split(",")) if email]
+
+
+# Calendar accepts up to 1000 calls per batch; smaller batches keep a slow
+# calendar from holding back the whole response
+_BATCH_LIMIT = 50
+_BATCH_CONCURRENCY = 5
+
+# Partial responses: only the fields the tools format
+_CALENDAR_LIST_FIELDS = "items(id, summary, primary, accessRole)"
+_EVENTS_FIELDS = "items(id, summary, start, end, location, htmlLink)"
+_SAVED_EVENT_FIELDS = "id, summary, start, htmlLink"
+
+# RFC 3339 in UTC, as events.list expects for timeMin/timeMax
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+_DEFAULT_WINDOW = timedelta(days=7)
+
+
+def _events_params(
+    calendar_id: str,
+    max_results: int,
+    time_min: Optional[str],
+    time_max: Optional[str],
+    query: Optional[str],
+) -> dict:
+    """Build events.list parameters, defaulting to the next 7 days."""
+    if not time_min or not time_max:
+        now = datetime.now(timezone.utc)
+        if not time_min:
+            time_min = now.strftime(_TIME_FORMAT)
+        if not time_max:
+            time_max = (now + _DEFAULT_WINDOW).strftime(_TIME_FORMAT)
+
+    request_params = {
+        "calendarId": calendar_id,
+        "timeMin": time_min,
+        "timeMax": time_max,
+        "maxResults": max_results,
+        "singleEvents": True,
+        "orderBy": "startTime",
+        "fields": _EVENTS_FIELDS,
+    }
+
+    if query:
+        request_params["q"] = query
+
+    return request_params
+
+
+async def _get_calendars(service, user_google_email: str) -> List[dict]:
+    """Get the user's calendar list, from the cache when fresh."""
+    calendars = _calendars_cache.get(user_google_email)
+    if calendars is None:
+        response = await run_api_call(
+            service.calendarList().list(fields=_CALENDAR_LIST_FIELDS).execute
+        )
+        calendars = response.get("items", [])
+        _calendars_cache.set(user_google_email, calendars)
+    return calendars
+
+
+def _format_events(calendar_id: str, events: List[dict]) -> str:
+    """Format events.list items for one calendar."""
+    if not events:
+        return (
+            f"No events found in calendar '{calendar_id}' for the specified time range."
+        )
+
+    output = [f"Found {len(events)} events in '{calendar_id}':"]
+    append = output.append
+
+    # One string per event: whole quarters can run to hundreds of events
+    for event in events:
+        get = event.get
+        start = get("start", {})
+        end = get("end", {})
+
+        # Handle all-day vs timed events
+        if "date" in start:
+            start_str = start["date"]
+            end_str = end.get("date", "")
+            if end_str and end_str != start_str:
+                time_str = f"All-day: {start_str} to {end_str}"
+            else:
+                time_str = f"All-day: {start_str}"
+        else:
+            start_str = start.get("dateTime", "Unknown")
+            end_str = end.get("dateTime", "")
+            time_str = f"{start_str} - {end_str}" if end_str else start_str
+
+        location = get("location")
+        link = get("htmlLink")
+        append(
+            f"\n- {get('summary', '(No title)')}\n"
+            f"  ID: {get('id', 'Unknown')}\n"
+            f"  Time: {time_str}"
+            + (f"\n  Location: {location}" if location else "")
+            + (f"\n  Link: {link}" if link else "")
+        )
+
+    return "\n".join(output)
+
 
 @handle_errors
 @with_calendar_service
@@ -37,9 +148,8 @@ async def list_calendars(
     """
     logger.info(f"[list_calendars] User: {user_google_email}")
 
-    response = await asyncio.to_thread(service.calendarList().list().execute)
+    calendars = await _get_calendars(service, user_google_email)
 
-    calendars = response.get("items", [])
     if not calendars:
         return "No calendars found."
 
@@ -84,65 +194,84 @@ async def get_events(
     """
     logger.info(f"[get_events] User: {user_google_email}, Calendar: {calendar_id}")
 
-    # Default time range: now to 7 days from now
-    if not time_min:
-        time_min = datetime.utcnow().isoformat() + "Z"
-    if not time_max:
-        time_max = (datetime.utcnow() + timedelta(days=7)).isoformat() + "Z"
-
-    request_params = {
-        "calendarId": calendar_id,
-        "timeMin": time_min,
-        "timeMax": time_max,
-        "maxResults": max_results,
-        "singleEvents": True,
-        "orderBy": "startTime",
-    }
+    request_params = _events_params(calendar_id, max_results, time_min, time_max, query)
+    response = await run_api_call(service.events().list(**request_params).execute)
 
-    if query:
-        request_params["q"] = query
+    return _format_events(calendar_id, response.get("items", []))
 
-    response = await asyncio.to_thread(service.events().list(**request_params).execute)
 
-    events = response.get("items", [])
-    if not events:
-        return (
-            f"No events found in calendar '{calendar_id}' for the specified time range."
-        )
+@handle_errors
+@with_calendar_service
+async def get_events_multi(
+    service,
+    user_google_email: str,
+    calendar_ids: Optional[List[str]] = None,
+    max_results: int = 10,
+    time_min: Optional[str] = None,
+    time_max: Optional[str] = None,
+    query: Optional[str] = None,
+) -> str:
+    """
+    Get events from several calendars in one batched request.
 
-    output = [f"Found {len(events)} events in '{calendar_id}':"]
+    Args:
+        user_google_email: The user's Google email address
+        calendar_ids: Calendar IDs to read (default: every calendar in the user's list)
+        max_results: Maximum number of events to return per calendar (default: 10)
+        time_min: Start time in ISO format (default: now)
+        time_max: End time in ISO format (default: 7 days from now)
+        query: Optional search query string
 
-    for event in events:
-        start = event.get("start", {})
-        end = event.get("end", {})
+    Returns:
+        str: Formatted list of events, grouped by calendar
+    """
+    logger.info(
+        f"[get_events_multi] User: {user_google_email}, "
+        f"Calendars: {len(calendar_ids) if calendar_ids else 'all'}"
+    )
 
-        # Handle all-day vs timed events
-        if "date" in start:
-            start_str = start["date"]
-            end_str = end.get("date", "")
-            time_str = f"All-day: {start_str}"
-            if end_str and end_str != start_str:
-                time_str = f"All-day: {start_str} to {end_str}"
+    if not calendar_ids:
+        calendars = await _get_calendars(service, user_google_email)
+        calendar_ids = [cal["id"] for cal in calendars if cal.get("id")]
+        if not calendar_ids:
+            return "No calendars found."
+
+    calendar_ids = list(dict.fromkeys(calendar_ids))
+    responses = {}
+
+    def collect(request_id, response, exception):
+        responses[request_id] = (response, exception)
+
+    # Resolve the default time range once so every calendar shares it
+    params = _events_params("", max_results, time_min, time_max, query)
+    events = service.events()
+    batches = []
+    for start in range(0, len(calendar_ids), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=collect)
+        for index in range(start, min(start + _BATCH_LIMIT, len(calendar_ids))):
+            request = events.list(**dict(params, calendarId=calendar_ids[index]))
+            batch.add(request, request_id=str(index))
+        batches.append(batch)
+
+    # More calendars than one batch holds send their batches concurrently;
+    # the semaphore keeps them within the per-user quota
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def execute(batch) -> None:
+        async with semaphore:
+            await run_api_call(batch.execute)
+
+    await asyncio.gather(*map(execute, batches))
+
+    output = []
+    for index, calendar_id in enumerate(calendar_ids):
+        response, exception = responses.get(str(index), (None, "No response in batch"))
+        if exception is not None:
+            output.append(f"Could not read calendar '{calendar_id}': {exception}")
         else:
-            start_str = start.get("dateTime", "Unknown")
-            end_str = end.get("dateTime", "")
-            time_str = f"{start_str}"
-            if end_str:
-                time_str = f"{start_str} - {end_str}"
-
-        summary = event.get("summary", "(No title)")
-        location = event.get("location", "")
-        event_id = event.get("id", "Unknown")
-
-        entry = [f"\n- {summary}", f"  ID: {event_id}", f"  Time: {time_str}"]
-        if location:
-            entry.append(f"  Location: {location}")
-        if event.get("htmlLink"):
-            entry.append(f"  Link: {event.get('htmlLink')}")
+            output.append(_format_events(calendar_id, response.get("items", [])))
 
-        output.extend(entry)
-
-    return "\n".join(output)
+    return "\n\n".join(output)
 
 
 @handle_errors
@@ -195,11 +324,12 @@ async def create_event(
         event_body["location"] = location
 
     if attendees:
-        attendee_list = [email.strip() for email in attendees.split(",")]
-        event_body["attendees"] = [{"email": email} for email in attendee_list]
+        event_body["attendees"] = _parse_attendees(attendees)
 
-    created_event = await asyncio.to_thread(
-        service.events().insert(calendarId=calendar_id, body=event_body).execute
+    created_event = await run_api_call(
+        service.events()
+        .insert(calendarId=calendar_id, body=event_body, fields=_SAVED_EVENT_FIELDS)
+        .execute
     )
 
     output = [
@@ -241,7 +371,7 @@ async def delete_event(
     """
     logger.info(f"[delete_event] User: {user_google_email}, Event: {event_id}")
 
-    await asyncio.to_thread(
+    await run_api_call(
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute
     )
 
@@ -283,6 +413,11 @@ async def update_event(
     """
     logger.info(f"[update_event] User: {user_google_email}, Event: {event_id}")
 
+    changes = (summary, start_time, end_time, description, location, attendees)
+    # None means "leave unchanged"; an empty string still clears the field
+    if all(change is None for change in changes):
+        return "No fields to update. Provide at least one field to modify."
+
     # Build patch body with only provided fields
     patch_body = {}
 
@@ -306,15 +441,16 @@ async def update_event(
             patch_body["end"] = {"dateTime": end_time}
 
     if attendees is not None:
-        attendee_list = [email.strip() for email in attendees.split(",")]
-        patch_body["attendees"] = [{"email": email} for email in attendee_list]
+        patch_body["attendees"] = _parse_attendees(attendees)
 
-    if not patch_body:
-        return "No fields to update. Provide at least one field to modify."
-
-    updated_event = await asyncio.to_thread(
+    updated_event = await run_api_call(
         service.events()
-        .patch(calendarId=calendar_id, eventId=event_id, body=patch_body)
+        .patch(
+            calendarId=calendar_id,
+            eventId=event_id,
+            body=patch_body,
+            fields=_SAVED_EVENT_FIELDS,
+        )
         .execute
     )
 
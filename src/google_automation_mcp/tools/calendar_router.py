@@ -1,13 +1,16 @@
 """Calendar tools — Apps Script Router backend."""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from ..router.client import call_router
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+_MULTI_CALENDAR_CONCURRENCY = 10
+
 
 @handle_errors
 async def list_calendars(user_google_email: str) -> str:
@@ -36,18 +39,51 @@ async def get_events(
     if not results:
         return f"No events found in calendar '{calendar_id}' for the specified time range."
     output = [f"Found {len(results)} events in '{calendar_id}':"]
+    append = output.append
     for ev in results:
-        entry = [f"\n- {ev.get('summary', '(No title)')}", f"  ID: {ev['id']}"]
         if ev.get("all_day"):
-            entry.append(f"  Time: All-day: {ev['start']}")
+            time_str = f"All-day: {ev['start']}"
         else:
-            entry.append(f"  Time: {ev['start']} - {ev.get('end', '')}")
-        if ev.get("location"):
-            entry.append(f"  Location: {ev['location']}")
-        output.extend(entry)
+            time_str = f"{ev['start']} - {ev.get('end', '')}"
+        location = ev.get("location")
+        append(
+            f"\n- {ev.get('summary', '(No title)')}\n  ID: {ev['id']}\n  Time: {time_str}"
+            + (f"\n  Location: {location}" if location else "")
+        )
     return "\n".join(output)
 
 
+@handle_errors
+async def get_events_multi(
+    user_google_email: str, calendar_ids: Optional[List[str]] = None,
+    max_results: int = 10, time_min: Optional[str] = None,
+    time_max: Optional[str] = None, query: Optional[str] = None,
+) -> str:
+    logger.info(
+        f"[get_events_multi] User: {user_google_email}, "
+        f"Calendars: {len(calendar_ids) if calendar_ids else 'all'}"
+    )
+    if not calendar_ids:
+        calendars = await call_router(user_google_email, "list_calendars", {})
+        calendar_ids = [cal["id"] for cal in calendars or [] if cal.get("id")]
+        if not calendar_ids:
+            return "No calendars found."
+    calendar_ids = list(dict.fromkeys(calendar_ids))
+
+    # The router has no multi-calendar action, so fan out get_events
+    semaphore = asyncio.Semaphore(_MULTI_CALENDAR_CONCURRENCY)
+
+    async def fetch(calendar_id: str) -> str:
+        async with semaphore:
+            return await get_events(
+                user_google_email, calendar_id=calendar_id,
+                max_results=max_results, time_min=time_min,
+                time_max=time_max, query=query,
+            )
+
+    return "\n\n".join(await asyncio.gather(*map(fetch, calendar_ids)))
+
+
 @handle_errors
 async def create_event(
     user_google_email: str, summary: str, start_time: str, end_time: str,
@@ -11,14 +11,170 @@ Licensed under MIT License.
 
 import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from ..auth.service_adapter import with_docs_service, with_drive_service
+from ..core.batching import Coalescer, resolve_future
+from ..core.executor import run_api_call
+from ..core.query import quote_literal
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
 
+class _DocEdits(Coalescer):
+    """
+    Fuse document edits issued within a short window.
+
+    Each submitted item is the request list of one tool call. Lists queued for
+    the same document are concatenated into a single documents.batchUpdate,
+    applied in submission order, and each caller gets back its own slice of
+    the replies (Docs returns one reply per request). Edits to different
+    documents in the same window travel together as one HTTP batch, with
+    one batchUpdate per document. batchUpdate is atomic, so if a fused call
+    fails each edit is retried alone and only the edit at fault reports an
+    error.
+    """
+
+    async def edit(self, service, document_id: str, requests: List[dict]) -> dict:
+        return await self._submit(service, (document_id, requests))
+
+    @staticmethod
+    def _update(documents, document_id: str, edits):
+        combined = [request for requests, _ in edits for request in requests]
+        return documents.batchUpdate(
+            documentId=document_id, body={"requests": combined}
+        )
+
+    @staticmethod
+    def _resolve(result: dict, edits) -> None:
+        replies = result.get("replies", [])
+        start = 0
+        for requests, future in edits:
+            end = start + len(requests)
+            resolve_future(future, {**result, "replies": replies[start:end]}, None)
+            start = end
+
+    async def _send_one(self, documents, document_id, requests, future) -> None:
+        try:
+            result = await run_api_call(
+                documents.batchUpdate(
+                    documentId=document_id, body={"requests": requests}
+                ).execute
+            )
+        except Exception as e:
+            resolve_future(future, None, e)
+        else:
+            resolve_future(future, result, None)
+
+    async def _send_separately(self, documents, document_id, edits) -> None:
+        await asyncio.gather(
+            *(
+                self._send_one(documents, document_id, requests, future)
+                for requests, future in edits
+            )
+        )
+
+    async def _send_document(self, documents, document_id, edits) -> None:
+        if len(edits) > 1:
+            try:
+                result = await run_api_call(
+                    self._update(documents, document_id, edits).execute
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Fused update of {len(edits)} edits to {document_id} "
+                    f"failed, retrying separately: {e}"
+                )
+            else:
+                self._resolve(result, edits)
+                return
+        await self._send_separately(documents, document_id, edits)
+
+    async def _send(self, service, items) -> None:
+        documents = service.documents()
+        by_document = {}
+        for (document_id, requests), future in items:
+            by_document.setdefault(document_id, []).append((requests, future))
+        if len(by_document) == 1:
+            [(document_id, edits)] = by_document.items()
+            await self._send_document(documents, document_id, edits)
+            return
+
+        responses = {}
+
+        def collect(request_id, response, exception):
+            responses[request_id] = (response, exception)
+
+        groups = list(by_document.items())
+        batch = service.new_batch_http_request(callback=collect)
+        for index, (document_id, edits) in enumerate(groups):
+            batch.add(
+                self._update(documents, document_id, edits), request_id=str(index)
+            )
+        try:
+            await run_api_call(batch.execute)
+        except Exception as e:
+            logger.warning(f"Batch of edits to {len(groups)} documents failed: {e}")
+            await asyncio.gather(
+                *(
+                    self._send_document(documents, document_id, edits)
+                    for document_id, edits in groups
+                )
+            )
+            return
+
+        retries = []
+        for index, (document_id, edits) in enumerate(groups):
+            result, exception = responses.get(
+                str(index), (None, RuntimeError("No response in batch"))
+            )
+            if exception is None:
+                self._resolve(result, edits)
+            elif len(edits) == 1:
+                resolve_future(edits[0][1], None, exception)
+            else:
+                retries.append(self._send_separately(documents, document_id, edits))
+        await asyncio.gather(*retries)
+
+
+# Edits within 30 ms go out together, in HTTP batches of at most 50 calls
+_edits = _DocEdits(delay=0.03, max_size=50)
+
+
+def _iter_text(content):
+    """
+    Yield the text runs of document body content in document order.
+
+    Table cells are walked with an explicit stack of iterators instead of
+    recursion, so nested tables cost no extra call frames.
+    """
+    stack = [iter(content)]
+    while stack:
+        for element in stack[-1]:
+            paragraph = element.get("paragraph")
+            if paragraph is not None:
+                for elem in paragraph.get("elements", ()):
+                    text_run = elem.get("textRun")
+                    if text_run:
+                        text = text_run.get("content")
+                        if text:
+                            yield text
+                continue
+            table = element.get("table")
+            if table is not None:
+                # Finish the table's cells before resuming this level
+                stack.append(
+                    inner
+                    for row in table.get("tableRows", ())
+                    for cell in row.get("tableCells", ())
+                    for inner in cell.get("content", ())
+                )
+                break
+        else:
+            stack.pop()
+
+
 @handle_errors
 @with_drive_service
 async def search_docs(
@@ -40,15 +196,14 @@ async def search_docs(
     """
     logger.info(f"[search_docs] User: {user_google_email}, Query: '{query}'")
 
-    escaped_query = query.replace("'", "\\'")
-    final_query = f"name contains '{escaped_query}' and mimeType='application/vnd.google-apps.document' and trashed=false"
+    final_query = f"name contains {quote_literal(query)} and mimeType='application/vnd.google-apps.document' and trashed=false"
 
-    results = await asyncio.to_thread(
+    results = await run_api_call(
         service.files()
         .list(
             q=final_query,
             pageSize=page_size,
-            fields="files(id, name, createdTime, modifiedTime, webViewLink)",
+            fields="files(id, name, modifiedTime, webViewLink)",
             supportsAllDrives=True,
             includeItemsFromAllDrives=True,
         )
@@ -60,12 +215,12 @@ async def search_docs(
         return f"No Google Docs found matching '{query}'."
 
     output = [f"Found {len(files)} Google Docs matching '{query}':"]
-    for doc in files:
-        output.append(
-            f"- {doc['name']} (ID: {doc['id']})\n"
-            f"  Modified: {doc.get('modifiedTime', 'N/A')}\n"
-            f"  Link: {doc.get('webViewLink', '#')}"
-        )
+    output += [
+        f"- {doc['name']} (ID: {doc['id']})\n"
+        f"  Modified: {doc.get('modifiedTime', 'N/A')}\n"
+        f"  Link: {doc.get('webViewLink', '#')}"
+        for doc in files
+    ]
 
     return "\n".join(output)
 
@@ -89,9 +244,7 @@ async def get_doc_content(
     """
     logger.info(f"[get_doc_content] User: {user_google_email}, Doc: {document_id}")
 
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await run_api_call(service.documents().get(documentId=document_id).execute)
 
     title = doc.get("title", "Untitled")
 
@@ -99,26 +252,7 @@ async def get_doc_content(
     body = doc.get("body", {})
     content = body.get("content", [])
 
-    text_parts = []
-
-    def extract_text(elements):
-        """Recursively extract text from document elements."""
-        for element in elements:
-            if "paragraph" in element:
-                paragraph = element["paragraph"]
-                for elem in paragraph.get("elements", []):
-                    text_run = elem.get("textRun", {})
-                    if text_run and "content" in text_run:
-                        text_parts.append(text_run["content"])
-            elif "table" in element:
-                table = element["table"]
-                for row in table.get("tableRows", []):
-                    for cell in row.get("tableCells", []):
-                        extract_text(cell.get("content", []))
-
-    extract_text(content)
-
-    body_text = "".join(text_parts)
+    body_text = "".join(_iter_text(content))
 
     link = f"https://docs.google.com/document/d/{document_id}/edit"
     header = f"Document: {title}\nID: {document_id}\nLink: {link}\n\n--- CONTENT ---\n"
@@ -147,9 +281,7 @@ async def create_doc(
     """
     logger.info(f"[create_doc] User: {user_google_email}, Title: {title}")
 
-    doc = await asyncio.to_thread(
-        service.documents().create(body={"title": title}).execute
-    )
+    doc = await run_api_call(service.documents().create(body={"title": title}).execute)
 
     document_id = doc.get("documentId")
 
@@ -163,7 +295,7 @@ async def create_doc(
                 }
             }
         ]
-        await asyncio.to_thread(
+        await run_api_call(
             service.documents()
             .batchUpdate(documentId=document_id, body={"requests": requests})
             .execute
@@ -226,11 +358,7 @@ async def modify_doc_text(
             }
         )
 
-    result = await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
-    )
+    result = await _edits.edit(service, document_id, requests)
 
     link = f"https://docs.google.com/document/d/{document_id}/edit"
 
@@ -272,38 +400,18 @@ async def append_doc_text(
     """
     logger.info(f"[append_doc_text] User: {user_google_email}, Doc: {document_id}")
 
-    # First get the document to find the end index
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
-
-    # Get the end index of the document body
-    body = doc.get("body", {})
-    content = body.get("content", [])
-
-    # Find the last content element's end index
-    end_index = 1
-    if content:
-        last_element = content[-1]
-        end_index = (
-            last_element.get("endIndex", 1) - 1
-        )  # -1 to insert before final newline
-
-    # Insert at the end
+    # Insert before the body's final newline. endOfSegmentLocation lets Docs
+    # resolve the end itself, so the whole document is never downloaded
     requests = [
         {
             "insertText": {
-                "location": {"index": end_index},
+                "endOfSegmentLocation": {},
                 "text": text,
             }
         }
     ]
 
-    await asyncio.to_thread(
-        service.documents()
-        .batchUpdate(documentId=document_id, body={"requests": requests})
-        .execute
-    )
+    await _edits.edit(service, document_id, requests)
 
     link = f"https://docs.google.com/document/d/{document_id}/edit"
 
@@ -12,14 +12,122 @@ Licensed under MIT License.
 import asyncio
 import io
 import logging
+from typing import List, Optional, Tuple
 
 from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
 
 from ..auth.service_adapter import with_drive_service
+from ..core.batching import BatchCoalescer
+from ..core.cache import TTLCache
+from ..core.executor import run_api_call
+from ..core.query import is_structured_query, quote_literal
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Trash, delete and permission changes issued together go out as one batch
+_mutations = BatchCoalescer()
+
+# Permissions by (user, file_id); dropped when this server changes them
+_permissions_cache: TTLCache[List[dict]] = TTLCache(maxsize=1024, ttl=60)
+
+# Folder listings by (user, folder_id, page_size, include_shared_drives).
+# Before one is reused, the user's Drive changes feed is read from the saved
+# page token and listings touched by any change are dropped, so a cache hit
+# costs one small changes.list call instead of a full folder listing.
+_listings_cache: TTLCache[List[dict]] = TTLCache(maxsize=512, ttl=600)
+
+# Per user: (changes page token, root folder ID) the listings are current to
+_change_state: TTLCache[Tuple[str, str]] = TTLCache(maxsize=1024, ttl=86400)
+
+_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# Uploads above this size use resumable sessions, as Google recommends
+_RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+_CHANGE_FIELDS = "nextPageToken, newStartPageToken, changes(fileId, file(parents))"
+
+
+async def _start_change_tracking(service, user_google_email: str) -> bool:
+    """Save the user's current changes page token; False if unavailable."""
+    try:
+        # Changes report the root folder by ID, listings may use the alias
+        token, root = await asyncio.gather(
+            run_api_call(
+                service.changes().getStartPageToken(supportsAllDrives=True).execute
+            ),
+            run_api_call(service.files().get(fileId="root", fields="id").execute),
+        )
+        state = (token["startPageToken"], root["id"])
+    except Exception as e:
+        logger.warning(f"Drive change tracking unavailable: {e}")
+        return False
+    _change_state.set(user_google_email, state)
+    return True
+
+
+def _forget_listings(user_google_email: str) -> None:
+    _change_state.pop(user_google_email)
+    _listings_cache.pop_where(lambda key, files: key[0] == user_google_email)
+
+
+async def _apply_changes(service, user_google_email: str) -> None:
+    """Drop the user's cached listings that changes since the last sync touch."""
+    token, root_id = _change_state.get(user_google_email)
+    changed_ids = set()
+    changed_parents = set()
+    while True:
+        response = await run_api_call(
+            service.changes()
+            .list(
+                pageToken=token,
+                pageSize=1000,
+                fields=_CHANGE_FIELDS,
+                includeItemsFromAllDrives=True,
+                supportsAllDrives=True,
+            )
+            .execute
+        )
+        for change in response.get("changes", []):
+            changed_ids.add(change.get("fileId"))
+            changed_parents.update(change.get("file", {}).get("parents", []))
+        if "newStartPageToken" in response:
+            token = response["newStartPageToken"]
+            break
+        token = response["nextPageToken"]
+
+    _change_state.set(user_google_email, (token, root_id))
+    if not changed_ids:
+        return
+    if root_id in changed_parents:
+        changed_parents.add("root")
+    # New or moved-in files name the folder as a parent; renamed, trashed or
+    # moved-out files are found by ID in the listing that holds them
+    _listings_cache.pop_where(
+        lambda key, files: (
+            key[0] == user_google_email
+            and (
+                key[1] in changed_parents
+                or any(item["id"] in changed_ids for item in files)
+            )
+        )
+    )
+
+
+async def _get_cached_listing(service, key: tuple) -> Optional[List[dict]]:
+    """Get a cached folder listing if Drive reports no changes affecting it."""
+    user_google_email = key[0]
+    if _listings_cache.get(key) is None or user_google_email not in _change_state:
+        return None
+    try:
+        await _apply_changes(service, user_google_email)
+    except Exception as e:
+        # An expired page token or a failed call: start over from a full listing
+        logger.warning(f"Drive changes sync failed, dropping cached listings: {e}")
+        _forget_listings(user_google_email)
+        return None
+    return _listings_cache.get(key)
+
 
 @handle_errors
 @with_drive_service
@@ -48,18 +156,13 @@ async def search_drive_files(
     """
     logger.info(f"[search_drive_files] User: {user_google_email}, Query: '{query}'")
 
-    # Check if query looks like a structured Drive query
-    is_structured = any(
-        op in query.lower() for op in ["contains", "=", ">", "<", "in parents"]
-    )
-
-    if is_structured:
+    # Structured Drive queries pass through; plain text becomes a full-text search
+    if is_structured_query(query):
         final_query = query
     else:
-        escaped_query = query.replace("'", "\\'")
-        final_query = f"fullText contains '{escaped_query}'"
+        final_query = f"fullText contains {quote_literal(query)}"
 
-    results = await asyncio.to_thread(
+    results = await run_api_call(
         service.files()
         .list(
             q=final_query,
@@ -76,9 +179,10 @@ async def search_drive_files(
         return f"No files found for query: '{query}'"
 
     output = [f"Found {len(files)} files matching '{query}':"]
+    append = output.append
     for item in files:
-        size_str = f", Size: {item.get('size', 'N/A')}" if "size" in item else ""
-        output.append(
+        size_str = f", Size: {item['size']}" if "size" in item else ""
+        append(
             f"- {item['name']} (ID: {item['id']})\n"
             f"  Type: {item['mimeType']}{size_str}\n"
             f"  Modified: {item.get('modifiedTime', 'N/A')}\n"
@@ -111,49 +215,71 @@ async def list_drive_items(
     """
     logger.info(f"[list_drive_items] User: {user_google_email}, Folder: {folder_id}")
 
-    query = f"'{folder_id}' in parents and trashed=false"
-
-    results = await asyncio.to_thread(
-        service.files()
-        .list(
-            q=query,
-            pageSize=page_size,
-            fields="files(id, name, mimeType, size, modifiedTime, webViewLink)",
-            supportsAllDrives=include_shared_drives,
-            includeItemsFromAllDrives=include_shared_drives,
-            orderBy="folder,name",
+    cache_key = (user_google_email, folder_id, page_size, include_shared_drives)
+    files = await _get_cached_listing(service, cache_key)
+    if files is None:
+        # Take the page token before listing so no later change is missed
+        tracked = user_google_email in _change_state or await _start_change_tracking(
+            service, user_google_email
         )
-        .execute
-    )
+        query = f"'{folder_id}' in parents and trashed=false"
+        results = await run_api_call(
+            service.files()
+            .list(
+                q=query,
+                pageSize=page_size,
+                fields="files(id, name, mimeType, size)",
+                supportsAllDrives=include_shared_drives,
+                includeItemsFromAllDrives=include_shared_drives,
+                orderBy="folder,name",
+            )
+            .execute
+        )
+        files = results.get("files", [])
+        if tracked:
+            _listings_cache.set(cache_key, files)
 
-    files = results.get("files", [])
     if not files:
         return f"No items found in folder '{folder_id}'"
 
     output = [f"Found {len(files)} items in folder '{folder_id}':"]
 
-    # Separate folders and files
-    folders = [
-        f for f in files if f.get("mimeType") == "application/vnd.google-apps.folder"
-    ]
-    non_folders = [
-        f for f in files if f.get("mimeType") != "application/vnd.google-apps.folder"
-    ]
+    # Separate folders and files in one pass
+    folders: List[dict] = []
+    non_folders: List[dict] = []
+    for item in files:
+        if item.get("mimeType") == _FOLDER_MIME_TYPE:
+            folders.append(item)
+        else:
+            non_folders.append(item)
 
     if folders:
         output.append("\nFolders:")
-        for item in folders:
-            output.append(f"  📁 {item['name']} (ID: {item['id']})")
+        output += [f"  📁 {item['name']} (ID: {item['id']})" for item in folders]
 
     if non_folders:
         output.append("\nFiles:")
+        append = output.append
         for item in non_folders:
-            size_str = f" [{item.get('size', 'N/A')} bytes]" if "size" in item else ""
-            output.append(f"  📄 {item['name']}{size_str} (ID: {item['id']})")
+            size_str = f" [{item['size']} bytes]" if "size" in item else ""
+            append(f"  📄 {item['name']}{size_str} (ID: {item['id']})")
 
     return "\n".join(output)
 
 
+def _download(request, fh: io.BytesIO) -> None:
+    """
+    Stream a media request into fh, chunk by chunk, on the calling thread.
+
+    Runs as one worker-thread job rather than one per chunk. httplib2 already
+    asks for gzip transfer encoding and decompresses transparently.
+    """
+    downloader = MediaIoBaseDownload(fh, request)
+    done = False
+    while not done:
+        _, done = downloader.next_chunk()
+
+
 @handle_errors
 @with_drive_service
 async def get_drive_file_content(
@@ -180,11 +306,11 @@ async def get_drive_file_content(
     logger.info(f"[get_drive_file_content] User: {user_google_email}, File: {file_id}")
 
     # Get file metadata
-    file_metadata = await asyncio.to_thread(
+    file_metadata = await run_api_call(
         service.files()
         .get(
             fileId=file_id,
-            fields="id, name, mimeType, webViewLink",
+            fields="name, mimeType, webViewLink",
             supportsAllDrives=True,
         )
         .execute
@@ -208,11 +334,7 @@ async def get_drive_file_content(
         request_obj = service.files().get_media(fileId=file_id)
 
     fh = io.BytesIO()
-    downloader = MediaIoBaseDownload(fh, request_obj)
-
-    done = False
-    while not done:
-        _, done = await asyncio.to_thread(downloader.next_chunk)
+    await run_api_call(_download, request_obj, fh)
 
     content_bytes = fh.getvalue()
 
@@ -263,13 +385,16 @@ async def create_drive_file(
     }
 
     if content:
+        data = content.encode("utf-8")
+        # Small content goes up in the same multipart request as the metadata;
+        # a resumable upload first spends a round trip opening a session
         media = MediaIoBaseUpload(
-            io.BytesIO(content.encode("utf-8")),
+            io.BytesIO(data),
             mimetype=mime_type,
-            resumable=True,
+            resumable=len(data) > _RESUMABLE_THRESHOLD,
         )
 
-        created_file = await asyncio.to_thread(
+        created_file = await run_api_call(
             service.files()
             .create(
                 body=file_metadata,
@@ -280,7 +405,7 @@ async def create_drive_file(
             .execute
         )
     else:
-        created_file = await asyncio.to_thread(
+        created_file = await run_api_call(
             service.files()
             .create(
                 body=file_metadata,
@@ -320,11 +445,11 @@ async def create_drive_folder(
 
     file_metadata = {
         "name": folder_name,
-        "mimeType": "application/vnd.google-apps.folder",
+        "mimeType": _FOLDER_MIME_TYPE,
         "parents": [parent_id],
     }
 
-    created_folder = await asyncio.to_thread(
+    created_folder = await run_api_call(
         service.files()
         .create(
             body=file_metadata,
@@ -362,8 +487,8 @@ async def delete_drive_file(
     """
     logger.info(f"[delete_drive_file] User: {user_google_email}, File: {file_id}")
 
-    await asyncio.to_thread(
-        service.files().delete(fileId=file_id, supportsAllDrives=True).execute
+    await _mutations.submit(
+        service, service.files().delete(fileId=file_id, supportsAllDrives=True)
     )
 
     return f"Permanently deleted file: {file_id}"
@@ -388,10 +513,11 @@ async def trash_drive_file(
     """
     logger.info(f"[trash_drive_file] User: {user_google_email}, File: {file_id}")
 
-    await asyncio.to_thread(
-        service.files()
-        .update(fileId=file_id, body={"trashed": True}, supportsAllDrives=True)
-        .execute
+    await _mutations.submit(
+        service,
+        service.files().update(
+            fileId=file_id, body={"trashed": True}, supportsAllDrives=True
+        ),
     )
 
     return f"Moved to trash: {file_id}"
@@ -430,16 +556,16 @@ async def share_drive_file(
         "emailAddress": email,
     }
 
-    result = await asyncio.to_thread(
-        service.permissions()
-        .create(
+    result = await _mutations.submit(
+        service,
+        service.permissions().create(
             fileId=file_id,
             body=permission,
             sendNotificationEmail=send_notification,
             supportsAllDrives=True,
-        )
-        .execute
+        ),
     )
+    _permissions_cache.pop((user_google_email, file_id))
 
     return (
         f"Shared file: {file_id}\n"
@@ -468,17 +594,21 @@ async def list_drive_permissions(
     """
     logger.info(f"[list_drive_permissions] User: {user_google_email}, File: {file_id}")
 
-    result = await asyncio.to_thread(
-        service.permissions()
-        .list(
-            fileId=file_id,
-            fields="permissions(id, type, role, emailAddress, displayName)",
-            supportsAllDrives=True,
+    cache_key = (user_google_email, file_id)
+    permissions = _permissions_cache.get(cache_key)
+    if permissions is None:
+        result = await run_api_call(
+            service.permissions()
+            .list(
+                fileId=file_id,
+                fields="permissions(id, type, role, emailAddress, displayName)",
+                supportsAllDrives=True,
+            )
+            .execute
         )
-        .execute
-    )
+        permissions = result.get("permissions", [])
+        _permissions_cache.set(cache_key, permissions)
 
-    permissions = result.get("permissions", [])
     if not permissions:
         return f"No permissions found for file: {file_id}"
 
@@ -524,10 +654,12 @@ async def remove_drive_permission(
         f"[remove_drive_permission] User: {user_google_email}, File: {file_id}, Permission: {permission_id}"
     )
 
-    await asyncio.to_thread(
-        service.permissions()
-        .delete(fileId=file_id, permissionId=permission_id, supportsAllDrives=True)
-        .execute
+    await _mutations.submit(
+        service,
+        service.permissions().delete(
+            fileId=file_id, permissionId=permission_id, supportsAllDrives=True
+        ),
     )
+    _permissions_cache.pop((user_google_email, file_id))
 
     return f"Removed permission {permission_id} from file {file_id}"
@@ -14,6 +14,17 @@ logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Message templates by HTTP status; anything else is a generic API error
+_STATUS_MESSAGES = {
+    401: "Authentication error: {}\n\nPlease run start_google_auth to authenticate.",
+    403: "Permission denied: {}",
+    404: "Not found: {}",
+}
+_API_NOT_ENABLED = (
+    "API not enabled: {}\n\n"
+    "Please enable the required API in your Google Cloud Console."
+)
+
 
 def handle_errors(func: F) -> F:
     """
@@ -29,19 +40,10 @@ def handle_errors(func: F) -> F:
             return await func(*args, **kwargs)
         except HttpError as e:
             error_msg = str(e)
-            if e.resp.status == 401:
-                return f"Authentication error: {error_msg}\n\nPlease run start_google_auth to authenticate."
-            elif e.resp.status == 403:
-                if "accessNotConfigured" in error_msg:
-                    return (
-                        f"API not enabled: {error_msg}\n\n"
-                        "Please enable the required API in your Google Cloud Console."
-                    )
-                return f"Permission denied: {error_msg}"
-            elif e.resp.status == 404:
-                return f"Not found: {error_msg}"
-            else:
-                return f"API error: {error_msg}"
+            status = e.resp.status
+            if status == 403 and "accessNotConfigured" in error_msg:
+                return _API_NOT_ENABLED.format(error_msg)
+            return _STATUS_MESSAGES.get(status, "API error: {}").format(error_msg)
         except Exception as e:
             if "No valid credentials" in str(e):
                 return str(e)
@@ -4,11 +4,11 @@ Google Forms MCP Tools
 Provides tools for creating forms, managing questions, and retrieving responses.
 """
 
-import asyncio
 import logging
 from typing import Optional
 
 from ..auth.service_adapter import with_forms_service
+from ..core.executor import run_api_call
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
@@ -33,7 +33,7 @@ async def get_form(
     """
     logger.info(f"[get_form] User: {user_google_email}, Form: {form_id}")
 
-    form = await asyncio.to_thread(service.forms().get(formId=form_id).execute)
+    form = await run_api_call(service.forms().get(formId=form_id).execute)
 
     info = form.get("info", {})
     output = [
@@ -79,7 +79,7 @@ async def get_form_responses(
     """
     logger.info(f"[get_form_responses] User: {user_google_email}, Form: {form_id}")
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.forms().responses().list(formId=form_id, pageSize=max_results).execute
     )
 
@@ -127,7 +127,7 @@ async def create_form(
     if description:
         body["info"]["description"] = description
 
-    form = await asyncio.to_thread(service.forms().create(body=body).execute)
+    form = await run_api_call(service.forms().create(body=body).execute)
 
     output = [
         f"Created form: {form.get('info', {}).get('title')}",
@@ -207,7 +207,7 @@ async def add_form_question(
         ]
     }
 
-    await asyncio.to_thread(
+    await run_api_call(
         service.forms().batchUpdate(formId=form_id, body=request_body).execute
     )
 
@@ -12,16 +12,77 @@ Licensed under MIT License.
 import asyncio
 import base64
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional, List
+from email import policy
+from email.generator import BytesGenerator
+from email.message import EmailMessage
+from io import BytesIO
+from typing import Dict, Optional, List
 
 from ..auth.service_adapter import with_gmail_service
+from ..core.cache import TTLCache
+from ..core.executor import run_api_call
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
 
+# Gmail accepts up to 100 calls per batch but rate-limits batches above 50
+_BATCH_LIMIT = 50
+_BATCH_CONCURRENCY = 5
+
+# Most message IDs users.messages.batchModify accepts per call
+_BATCH_MODIFY_LIMIT = 1000
+
+
+async def _get_message_metadata(service, message_ids: List[str]) -> Dict[str, dict]:
+    """
+    Fetch Subject/From/Date metadata for messages with batched requests.
+
+    Searches larger than one batch send their batches concurrently.
+
+    Args:
+        service: Authenticated Gmail service
+        message_ids: IDs of the messages to fetch
+
+    Returns:
+        Dict of message ID to message resource; failed lookups are omitted
+    """
+    details: Dict[str, dict] = {}
+
+    def collect(request_id, response, exception):
+        if exception is not None:
+            logger.warning(f"Could not fetch message {request_id}: {exception}")
+            return
+        details[request_id] = response
+
+    messages = service.users().messages()
+    batches = []
+    for start in range(0, len(message_ids), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=collect)
+        for message_id in message_ids[start : start + _BATCH_LIMIT]:
+            batch.add(
+                messages.get(
+                    userId="me",
+                    id=message_id,
+                    format="metadata",
+                    metadataHeaders=["Subject", "From", "Date"],
+                ),
+                request_id=message_id,
+            )
+        batches.append(batch)
+
+    # Each batch runs on its own worker thread (and HTTP connection); the
+    # semaphore keeps large searches within Gmail's per-user quota
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def execute(batch) -> None:
+        async with semaphore:
+            await run_api_call(batch.execute)
+
+    await asyncio.gather(*map(execute, batches))
+    return details
+
+
 @handle_errors
 @with_gmail_service
 async def search_gmail_messages(
@@ -54,7 +115,7 @@ async def search_gmail_messages(
     if label_ids:
         request_params["labelIds"] = label_ids
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.users().messages().list(**request_params).execute
     )
 
@@ -62,21 +123,17 @@ async def search_gmail_messages(
     if not messages:
         return f"No messages found for query: '{query}'"
 
+    messages = messages[:max_results]
+    details = await _get_message_metadata(service, [msg["id"] for msg in messages])
+
     output = [f"Found {len(messages)} messages for '{query}':"]
 
-    # Get details for each message
-    for msg in messages[:max_results]:
-        msg_detail = await asyncio.to_thread(
-            service.users()
-            .messages()
-            .get(
-                userId="me",
-                id=msg["id"],
-                format="metadata",
-                metadataHeaders=["Subject", "From", "Date"],
-            )
-            .execute
-        )
+    for msg in messages:
+        output.append(f"\n- ID: {msg['id']}")
+        msg_detail = details.get(msg["id"])
+        if msg_detail is None:
+            output.append("  (details unavailable)")
+            continue
 
         headers = {
             h["name"]: h["value"]
@@ -87,7 +144,6 @@ async def search_gmail_messages(
         date = headers.get("Date", "Unknown")
         snippet = msg_detail.get("snippet", "")[:100]
 
-        output.append(f"\n- ID: {msg['id']}")
         output.append(f"  From: {sender}")
         output.append(f"  Subject: {subject}")
         output.append(f"  Date: {date}")
@@ -119,7 +175,7 @@ async def get_gmail_message(
         f"[get_gmail_message] User: {user_google_email}, Message ID: {message_id}"
     )
 
-    msg = await asyncio.to_thread(
+    msg = await run_api_call(
         service.users()
         .messages()
         .get(userId="me", id=message_id, format=format)
@@ -201,28 +257,76 @@ async def send_gmail_message(
         f"[send_gmail_message] User: {user_google_email}, To: {to}, Subject: {subject}"
     )
 
-    if html:
-        message = MIMEMultipart("alternative")
-        message.attach(MIMEText(body, "html"))
-    else:
-        message = MIMEText(body)
-
+    message = EmailMessage()
     message["to"] = to
     message["subject"] = subject
     if cc:
         message["cc"] = cc
     if bcc:
         message["bcc"] = bcc
+    # set_content picks 8bit when the body allows it, so non-ASCII text is
+    # not base64-encoded once here and again for the raw field
+    message.set_content(body, subtype="html" if html else "plain")
 
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    buf = BytesIO()
+    BytesGenerator(buf, policy=policy.SMTP).flatten(message)
+    raw = base64.urlsafe_b64encode(buf.getbuffer()).decode("ascii")
 
-    sent_message = await asyncio.to_thread(
+    sent_message = await run_api_call(
         service.users().messages().send(userId="me", body={"raw": raw}).execute
     )
 
     return f"Message sent successfully!\nMessage ID: {sent_message.get('id')}\nTo: {to}\nSubject: {subject}"
 
 
+# Label definitions change rarely and agents list them often to resolve IDs
+_labels_cache: TTLCache[List[dict]] = TTLCache(maxsize=1024, ttl=300)
+
+# In-flight label lookups by user, so concurrent misses share one request
+_labels_pending: Dict[str, "asyncio.Future[List[dict]]"] = {}
+
+
+async def _get_labels(service, user_google_email: str) -> List[dict]:
+    """
+    Get the user's label definitions, cached for five minutes.
+
+    Args:
+        service: Authenticated Gmail service
+        user_google_email: The user's Google email address
+
+    Returns:
+        List of label resources
+    """
+    labels = _labels_cache.get(user_google_email)
+    if labels is not None:
+        return labels
+
+    pending = _labels_pending.get(user_google_email)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _labels_pending[user_google_email] = future
+    try:
+        response = await run_api_call(
+            service.users().labels().list(userId="me").execute
+        )
+        labels = response.get("labels", [])
+        _labels_cache.set(user_google_email, labels)
+        future.set_result(labels)
+        return labels
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so a failure nobody else awaited is not logged
+        future.exception()
+        raise
+    except BaseException:
+        future.cancel()
+        raise
+    finally:
+        del _labels_pending[user_google_email]
+
+
 @handle_errors
 @with_gmail_service
 async def list_gmail_labels(
@@ -240,11 +344,7 @@ async def list_gmail_labels(
     """
     logger.info(f"[list_gmail_labels] User: {user_google_email}")
 
-    response = await asyncio.to_thread(
-        service.users().labels().list(userId="me").execute
-    )
-
-    labels = response.get("labels", [])
+    labels = await _get_labels(service, user_google_email)
     if not labels:
         return "No labels found."
 
@@ -323,7 +423,7 @@ async def modify_gmail_labels(
     if not body:
         return "No labels to modify. Provide add_labels or remove_labels."
 
-    result = await asyncio.to_thread(
+    result = await run_api_call(
         service.users().messages().modify(userId="me", id=message_id, body=body).execute
     )
 
@@ -339,3 +439,69 @@ async def modify_gmail_labels(
     output.append(f"Current labels: {', '.join(current_labels)}")
 
     return "\n".join(output)
+
+
+@handle_errors
+@with_gmail_service
+async def modify_gmail_labels_bulk(
+    service,
+    user_google_email: str,
+    message_ids: List[str],
+    add_labels: Optional[List[str]] = None,
+    remove_labels: Optional[List[str]] = None,
+) -> str:
+    """
+    Apply the same label changes to many Gmail messages at once.
+
+    Uses users.messages.batchModify, which updates up to 1000 messages per
+    request, instead of one modify call per message.
+
+    Args:
+        user_google_email: The user's Google email address
+        message_ids: IDs of the messages to modify
+        add_labels: List of label IDs to add (e.g., ["STARRED", "IMPORTANT"])
+        remove_labels: List of label IDs to remove (e.g., ["UNREAD", "INBOX"])
+
+    Returns:
+        str: Confirmation with the applied label changes
+    """
+    logger.info(
+        f"[modify_gmail_labels_bulk] User: {user_google_email}, "
+        f"Messages: {len(message_ids)}"
+    )
+
+    if not message_ids:
+        return "No messages to modify. Provide message_ids."
+
+    body = {}
+    if add_labels:
+        body["addLabelIds"] = add_labels
+    if remove_labels:
+        body["removeLabelIds"] = remove_labels
+
+    if not body:
+        return "No labels to modify. Provide add_labels or remove_labels."
+
+    messages = service.users().messages()
+    await asyncio.gather(
+        *(
+            run_api_call(
+                messages.batchModify(
+                    userId="me",
+                    body={
+                        **body,
+                        "ids": message_ids[start : start + _BATCH_MODIFY_LIMIT],
+                    },
+                ).execute
+            )
+            for start in range(0, len(message_ids), _BATCH_MODIFY_LIMIT)
+        )
+    )
+
+    output = [f"Modified {len(message_ids)} messages"]
+    if add_labels:
+        output.append(f"Added: {', '.join(add_labels)}")
+    if remove_labels:
+        output.append(f"Removed: {', '.join(remove_labels)}")
+
+    return "\n".join(output)
@@ -6,6 +6,7 @@ instead of calling Gmail REST API directly. Works with clasp auth only,
 no GCP project needed.
 """
 
+import asyncio
 import logging
 from typing import Optional, List
 
@@ -160,3 +161,56 @@ async def modify_gmail_labels(
         output.append(f"Removed: {', '.join(result['removed'])}")
 
     return "\n".join(output)
+
+
+# Concurrent router calls per bulk label change
+_BULK_MODIFY_CONCURRENCY = 10
+
+
+@handle_errors
+async def modify_gmail_labels_bulk(
+    user_google_email: str,
+    message_ids: List[str],
+    add_labels: Optional[List[str]] = None,
+    remove_labels: Optional[List[str]] = None,
+) -> str:
+    logger.info(
+        f"[modify_gmail_labels_bulk] User: {user_google_email}, "
+        f"Messages: {len(message_ids)}"
+    )
+
+    if not message_ids:
+        return "No messages to modify. Provide message_ids."
+    if not add_labels and not remove_labels:
+        return "No labels to modify. Provide add_labels or remove_labels."
+
+    # The router has no bulk action, so fan out the per-message action
+    semaphore = asyncio.Semaphore(_BULK_MODIFY_CONCURRENCY)
+
+    async def modify(message_id: str):
+        async with semaphore:
+            return await call_router(user_google_email, "modify_gmail_labels", {
+                "message_id": message_id,
+                "add_labels": add_labels or [],
+                "remove_labels": remove_labels or [],
+            })
+
+    results = await asyncio.gather(
+        *map(modify, message_ids), return_exceptions=True
+    )
+    failed = [
+        f"  - {message_id}: {result}"
+        for message_id, result in zip(message_ids, results)
+        if isinstance(result, Exception)
+    ]
+
+    output = [f"Modified {len(message_ids) - len(failed)} messages"]
+    if add_labels:
+        output.append(f"Added: {', '.join(add_labels)}")
+    if remove_labels:
+        output.append(f"Removed: {', '.join(remove_labels)}")
+    if failed:
+        output.append(f"Failed ({len(failed)}):")
+        output.extend(failed)
+
+    return "\n".join(output)
@@ -9,15 +9,160 @@ Original: gsheets/sheets_tools.py
 Licensed under MIT License.
 """
 
+import abc
 import asyncio
 import logging
-from typing import Optional, List
+from typing import Any, Optional, List
 
 from ..auth.service_adapter import with_sheets_service, with_drive_service
+from ..core.batching import Coalescer, resolve_future
+from ..core.cache import TTLCache
+from ..core.executor import run_api_call
+from ..core.query import quote_literal
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Reads and writes on the same spreadsheet arriving within this many seconds
+# go out as one values.batchGet / values.batchUpdate call
+_COALESCE_DELAY = 0.025
+
+
+class _ValuesCoalescer(Coalescer):
+    """
+    Fuse per-range value calls on one spreadsheet into one batch call.
+
+    Items are keyed by (service, spreadsheet_id, option), since the render or
+    input option applies to the whole batch call. A lone item uses the
+    single-range method. If the fused call fails (one bad range fails all of
+    them), every item is retried alone so only its own caller sees the error.
+    """
+
+    @abc.abstractmethod
+    def _single(self, values, spreadsheet_id: str, option: str, item: Any):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _fused(self, values, spreadsheet_id: str, option: str, items: List[Any]):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _split(self, response: dict) -> List[dict]:
+        raise NotImplementedError
+
+    async def _send_single(self, values, spreadsheet_id, option, item, future):
+        try:
+            result = await run_api_call(
+                self._single(values, spreadsheet_id, option, item).execute
+            )
+        except Exception as e:
+            resolve_future(future, None, e)
+        else:
+            resolve_future(future, result, None)
+
+    async def _send(self, key, items) -> None:
+        service, spreadsheet_id, option = key
+        values = service.spreadsheets().values()
+        if len(items) > 1:
+            try:
+                response = await run_api_call(
+                    self._fused(
+                        values, spreadsheet_id, option, [item for item, _ in items]
+                    ).execute
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Fused call for {len(items)} ranges of {spreadsheet_id} "
+                    f"failed, retrying separately: {e}"
+                )
+            else:
+                results = self._split(response)
+                for index, (_, future) in enumerate(items):
+                    if index < len(results):
+                        resolve_future(future, results[index], None)
+                    else:
+                        resolve_future(
+                            future, None, RuntimeError("No response for range")
+                        )
+                return
+
+        await asyncio.gather(
+            *(
+                self._send_single(values, spreadsheet_id, option, item, future)
+                for item, future in items
+            )
+        )
+
+
+class _ValueReads(_ValuesCoalescer):
+    """Coalesce values.get calls into values.batchGet."""
+
+    async def read(self, service, spreadsheet_id: str, range: str, value_render: str):
+        return await self._submit((service, spreadsheet_id, value_render), range)
+
+    def _single(self, values, spreadsheet_id, option, item):
+        return values.get(
+            spreadsheetId=spreadsheet_id, range=item, valueRenderOption=option
+        )
+
+    def _fused(self, values, spreadsheet_id, option, items):
+        return values.batchGet(
+            spreadsheetId=spreadsheet_id, ranges=items, valueRenderOption=option
+        )
+
+    def _split(self, response):
+        return response.get("valueRanges", [])
+
+
+class _ValueWrites(_ValuesCoalescer):
+    """Coalesce values.update calls into values.batchUpdate."""
+
+    async def write(
+        self, service, spreadsheet_id: str, range: str, values, value_input: str
+    ):
+        return await self._submit(
+            (service, spreadsheet_id, value_input), (range, values)
+        )
+
+    def _single(self, values, spreadsheet_id, option, item):
+        range, rows = item
+        return values.update(
+            spreadsheetId=spreadsheet_id,
+            range=range,
+            valueInputOption=option,
+            body={"values": rows},
+        )
+
+    def _fused(self, values, spreadsheet_id, option, items):
+        return values.batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={
+                "valueInputOption": option,
+                "data": [{"range": range, "values": rows} for range, rows in items],
+            },
+        )
+
+    def _split(self, response):
+        return response.get("responses", [])
+
+
+_reads = _ValueReads(delay=_COALESCE_DELAY)
+_writes = _ValueWrites(delay=_COALESCE_DELAY)
+
+# Spreadsheet properties by (user, spreadsheet_id). Writes can grow the grid,
+# so the entry is dropped after this server writes to the spreadsheet
+_metadata_cache: TTLCache[dict] = TTLCache(maxsize=512, ttl=60)
+
+
+def _join_cells(row: list) -> str:
+    # FORMATTED_VALUE rows are all strings and join directly, which is several
+    # times faster than converting each cell; other render options can return
+    # numbers and booleans
+    try:
+        return " | ".join(row)
+    except TypeError:
+        return " | ".join(map(str, row))
+
 
 @handle_errors
 @with_drive_service
@@ -42,10 +187,9 @@ async def list_spreadsheets(
 
     base_query = "mimeType='application/vnd.google-apps.spreadsheet' and trashed=false"
     if query:
-        escaped_query = query.replace("'", "\\'")
-        base_query = f"{base_query} and name contains '{escaped_query}'"
+        base_query = f"{base_query} and name contains {quote_literal(query)}"
 
-    results = await asyncio.to_thread(
+    results = await run_api_call(
         service.files()
         .list(
             q=base_query,
@@ -103,16 +247,7 @@ async def get_sheet_values(
         f"[get_sheet_values] User: {user_google_email}, Sheet: {spreadsheet_id}, Range: {range}"
     )
 
-    result = await asyncio.to_thread(
-        service.spreadsheets()
-        .values()
-        .get(
-            spreadsheetId=spreadsheet_id,
-            range=range,
-            valueRenderOption=value_render,
-        )
-        .execute
-    )
+    result = await _reads.read(service, spreadsheet_id, range, value_render)
 
     values = result.get("values", [])
     if not values:
@@ -127,9 +262,8 @@ async def get_sheet_values(
     ]
 
     # Format as table
-    for i, row in enumerate(values):
-        row_str = " | ".join(str(cell) for cell in row)
-        output.append(f"Row {i + 1}: {row_str}")
+    for i, row in enumerate(values, 1):
+        output.append(f"Row {i}: {_join_cells(row)}")
 
     link = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit"
     output.append(f"\nLink: {link}")
@@ -167,19 +301,8 @@ async def update_sheet_values(
         f"[update_sheet_values] User: {user_google_email}, Sheet: {spreadsheet_id}, Range: {range}"
     )
 
-    body = {"values": values}
-
-    result = await asyncio.to_thread(
-        service.spreadsheets()
-        .values()
-        .update(
-            spreadsheetId=spreadsheet_id,
-            range=range,
-            valueInputOption=value_input,
-            body=body,
-        )
-        .execute
-    )
+    result = await _writes.write(service, spreadsheet_id, range, values, value_input)
+    _metadata_cache.pop((user_google_email, spreadsheet_id))
 
     updated_cells = result.get("updatedCells", 0)
     updated_rows = result.get("updatedRows", 0)
@@ -245,9 +368,7 @@ async def create_spreadsheet(
         "sheets": sheets,
     }
 
-    spreadsheet = await asyncio.to_thread(
-        service.spreadsheets().create(body=body).execute
-    )
+    spreadsheet = await run_api_call(service.spreadsheets().create(body=body).execute)
 
     spreadsheet_id = spreadsheet.get("spreadsheetId")
     created_sheets = [
@@ -299,7 +420,7 @@ async def append_sheet_values(
 
     body = {"values": values}
 
-    result = await asyncio.to_thread(
+    result = await run_api_call(
         service.spreadsheets()
         .values()
         .append(
@@ -311,6 +432,7 @@ async def append_sheet_values(
         )
         .execute
     )
+    _metadata_cache.pop((user_google_email, spreadsheet_id))
 
     updates = result.get("updates", {})
     updated_range = updates.get("updatedRange", range)
@@ -349,11 +471,15 @@ async def get_spreadsheet_metadata(
         f"[get_spreadsheet_metadata] User: {user_google_email}, Sheet: {spreadsheet_id}"
     )
 
-    result = await asyncio.to_thread(
-        service.spreadsheets()
-        .get(spreadsheetId=spreadsheet_id, fields="properties,sheets.properties")
-        .execute
-    )
+    cache_key = (user_google_email, spreadsheet_id)
+    result = _metadata_cache.get(cache_key)
+    if result is None:
+        result = await run_api_call(
+            service.spreadsheets()
+            .get(spreadsheetId=spreadsheet_id, fields="properties,sheets.properties")
+            .execute
+        )
+        _metadata_cache.set(cache_key, result)
 
     props = result.get("properties", {})
     title = props.get("title", "Untitled")
@@ -4,11 +4,11 @@ Google Tasks MCP Tools
 Provides tools for managing task lists and tasks.
 """
 
-import asyncio
 import logging
 from typing import Optional
 
 from ..auth.service_adapter import with_tasks_service
+from ..core.executor import run_api_call
 from .error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
@@ -33,7 +33,7 @@ async def list_task_lists(
     """
     logger.info(f"[list_task_lists] User: {user_google_email}")
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.tasklists().list(maxResults=max_results).execute
     )
 
@@ -77,7 +77,7 @@ async def get_tasks(
     """
     logger.info(f"[get_tasks] User: {user_google_email}, List: {tasklist_id}")
 
-    response = await asyncio.to_thread(
+    response = await run_api_call(
         service.tasks()
         .list(
             tasklist=tasklist_id,
@@ -142,7 +142,7 @@ async def create_task(
     if due:
         body["due"] = due
 
-    created = await asyncio.to_thread(
+    created = await run_api_call(
         service.tasks().insert(tasklist=tasklist_id, body=body).execute
     )
 
@@ -188,7 +188,7 @@ async def update_task(
     logger.info(f"[update_task] User: {user_google_email}, Task: {task_id}")
 
     # Fetch existing task first
-    existing = await asyncio.to_thread(
+    existing = await run_api_call(
         service.tasks().get(tasklist=tasklist_id, task=task_id).execute
     )
 
@@ -201,7 +201,7 @@ async def update_task(
     if status is not None:
         existing["status"] = status
 
-    updated = await asyncio.to_thread(
+    updated = await run_api_call(
         service.tasks()
         .update(tasklist=tasklist_id, task=task_id, body=existing)
         .execute
@@ -239,7 +239,7 @@ async def delete_task(
     """
     logger.info(f"[delete_task] User: {user_google_email}, Task: {task_id}")
 
-    await asyncio.to_thread(
+    await run_api_call(
         service.tasks().delete(tasklist=tasklist_id, task=task_id).execute
     )
 
@@ -267,12 +267,12 @@ async def complete_task(
     """
     logger.info(f"[complete_task] User: {user_google_email}, Task: {task_id}")
 
-    existing = await asyncio.to_thread(
+    existing = await run_api_call(
         service.tasks().get(tasklist=tasklist_id, task=task_id).execute
     )
     existing["status"] = "completed"
 
-    updated = await asyncio.to_thread(
+    updated = await run_api_call(
         service.tasks()
         .update(tasklist=tasklist_id, task=task_id, body=existing)
         .execute
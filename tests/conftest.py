@@ -0,0 +1,54 @@
+"""
+Shared fixtures and fakes for the test suite.
+"""
+
+import pytest
+
+
+class FakeBatch:
+    """Minimal BatchHttpRequest that executes queued requests in order."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response = request.execute()
+            except Exception as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep cached API responses from leaking between tests."""
+    from google_automation_mcp.appscript_tools import _project_cache
+    from google_automation_mcp.tools.calendar import _calendars_cache
+    from google_automation_mcp.tools.drive import (
+        _change_state,
+        _listings_cache,
+        _permissions_cache,
+    )
+    from google_automation_mcp.tools.gmail import _labels_cache
+    from google_automation_mcp.tools.sheets import _metadata_cache
+
+    caches = (
+        _project_cache,
+        _calendars_cache,
+        _change_state,
+        _listings_cache,
+        _permissions_cache,
+        _labels_cache,
+        _metadata_cache,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
@@ -8,6 +8,8 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 
 class TestCredentialStore:
     """Tests for SecureCredentialStore."""
@@ -100,6 +102,76 @@ class TestOAuthConfig:
             config = OAuthConfig()
             assert config.is_oauth21_enabled() is False
 
+    def test_redirect_uris_read_once_until_reload(self):
+        """Test custom redirect URIs are read at load time and on reload."""
+        from google_automation_mcp.auth.oauth_config import OAuthConfig
+
+        env = {
+            "GOOGLE_OAUTH_REDIRECT_URI": "http://localhost:8000/cb",
+            "OAUTH_CUSTOM_REDIRECT_URIS": "http://a/cb, http://localhost:8000/cb",
+        }
+        with patch.dict(os.environ, env):
+            config = OAuthConfig()
+        assert config.get_redirect_uris() == ["http://localhost:8000/cb", "http://a/cb"]
+
+        with patch.dict(os.environ, {"OAUTH_CUSTOM_REDIRECT_URIS": "http://b/cb"}):
+            assert "http://b/cb" not in config.get_redirect_uris()
+            config.reload()
+            assert "http://b/cb" in config.get_redirect_uris()
+
+    def test_configured_and_base_url(self):
+        """Test derived values reflect the environment at load time."""
+        from google_automation_mcp.auth.oauth_config import OAuthConfig
+
+        env = {
+            "GOOGLE_OAUTH_CLIENT_ID": "id",
+            "GOOGLE_OAUTH_CLIENT_SECRET": "secret",
+            "APPSCRIPT_MCP_EXTERNAL_URL": "https://mcp.example.com",
+        }
+        with patch.dict(os.environ, env):
+            config = OAuthConfig()
+
+        assert config.is_configured() is True
+        assert config.get_oauth_base_url() == "https://mcp.example.com"
+
+    def test_global_config_reload(self):
+        """Test the global config is shared until reloaded."""
+        from google_automation_mcp.auth.oauth_config import (
+            get_oauth_config,
+            reload_oauth_config,
+        )
+
+        config = get_oauth_config()
+        assert get_oauth_config() is config
+
+        reloaded = reload_oauth_config()
+        assert reloaded is not config
+        assert get_oauth_config() is reloaded
+
+    def test_redirect_path(self):
+        """Test the callback path is taken from full or bare redirect URIs."""
+        from google_automation_mcp.auth.oauth_config import OAuthConfig
+
+        assert OAuthConfig._get_redirect_path("https://x.io/auth/cb?a=1") == "/auth/cb"
+        assert OAuthConfig._get_redirect_path("https://x.io") == "/oauth2callback"
+        assert OAuthConfig._get_redirect_path("callback") == "/callback"
+
+    def test_server_metadata_copies(self):
+        """Test metadata calls return independent dicts with their scopes."""
+        from google_automation_mcp.auth.oauth_config import OAuthConfig
+
+        with patch.dict(os.environ, {"MCP_ENABLE_OAUTH21": "true"}):
+            config = OAuthConfig()
+
+        scoped = config.get_authorization_server_metadata(scopes=["openid"])
+        plain = config.get_authorization_server_metadata()
+
+        assert scoped["scopes_supported"] == ["openid"]
+        assert "scopes_supported" not in plain
+        assert plain["pkce_required"] is True
+        assert plain["response_types_supported"] == ["code"]
+        assert plain["token_endpoint"] == "http://localhost:8000/oauth2/token"
+
 
 class TestClaspIntegration:
     """Tests for clasp integration."""
@@ -156,6 +228,66 @@ class TestClaspIntegration:
         finally:
             os.unlink(temp_path)
 
+    def test_detect_clasp_environment_runs_clasp_once(self):
+        """Test one `clasp --version` run reports both install and version."""
+        from google_automation_mcp.auth import clasp
+
+        result = MagicMock(returncode=0, stdout="2.4.2\n")
+        with (
+            patch.object(clasp, "is_npx_installed", return_value=True),
+            patch.object(clasp, "get_clasp_tokens", return_value=None),
+            patch.object(clasp.subprocess, "run", return_value=result) as mock_run,
+        ):
+            env = clasp.detect_clasp_environment()
+
+        assert mock_run.call_count == 1
+        assert env["clasp_installed"] is True
+        assert env["clasp_version"] == "2.4.2"
+        assert env["clasp_authenticated"] is False
+        assert env["clasp_user_email"] is None
+
+    def test_clasp_user_email_from_id_token(self):
+        """Test the email is read from clasp's ID token without an API call."""
+        import jwt
+
+        from google_automation_mcp.auth import clasp
+
+        tokens = {
+            "access_token": "a",
+            "refresh_token": "r",
+            "id_token": jwt.encode(
+                {"email": "me@example.com"},
+                "test-signing-key-0123456789abcdef",
+                algorithm="HS256",
+            ),
+        }
+        with (
+            patch.object(clasp, "get_clasp_tokens", return_value=tokens),
+            patch("google_automation_mcp.auth.google_auth.build_service") as build,
+        ):
+            assert clasp.get_clasp_user_email() == "me@example.com"
+
+        build.assert_not_called()
+
+    def test_id_token_without_email_falls_back_to_userinfo(self):
+        """Test an ID token lacking the email claim still finds the user."""
+        import jwt
+        from google.oauth2.credentials import Credentials
+
+        from google_automation_mcp.auth import google_auth
+
+        creds = Credentials(
+            token="a",
+            id_token=jwt.encode(
+                {"sub": "1"}, "test-signing-key-0123456789abcdef", algorithm="HS256"
+            ),
+        )
+        with patch.object(google_auth, "build_service") as build:
+            build().userinfo().get().execute.return_value = {"email": "me@example.com"}
+            assert (
+                google_auth.get_user_email_from_credentials(creds) == "me@example.com"
+            )
+
 
 class TestScopes:
     """Tests for OAuth scopes."""
@@ -186,3 +318,362 @@ class TestScopes:
 
         scopes = get_scopes_for_tools(["appscript"])
         assert "https://www.googleapis.com/auth/script.projects" in scopes
+
+
+class TestBuildService:
+    """Tests for service object reuse."""
+
+    def test_reuses_service_for_same_token(self):
+        """Test a service is built once per access token."""
+        from google.oauth2.credentials import Credentials
+        from google_automation_mcp.auth import google_auth
+
+        google_auth._service_cache.clear()
+        with patch("googleapiclient.discovery.build_from_document") as mock_build:
+            mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+            first = google_auth.build_service("script", "v1", Credentials(token="t1"))
+            again = google_auth.build_service("script", "v1", Credentials(token="t1"))
+            refreshed = google_auth.build_service(
+                "script", "v1", Credentials(token="t2")
+            )
+
+        assert first is again
+        assert refreshed is not first
+        assert mock_build.call_count == 2
+        google_auth._service_cache.clear()
+
+    def test_reload_services_forces_rebuild(self):
+        """Test reload_services drops cached services."""
+        from google.oauth2.credentials import Credentials
+        from google_automation_mcp.auth import google_auth
+
+        google_auth._service_cache.clear()
+        with patch("googleapiclient.discovery.build_from_document") as mock_build:
+            mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+            first = google_auth.build_service("drive", "v3", Credentials(token="t"))
+            google_auth.reload_services()
+            second = google_auth.build_service("drive", "v3", Credentials(token="t"))
+
+        assert first is not second
+        google_auth._service_cache.clear()
+
+    def test_storing_credentials_clears_project_cache(self):
+        """Test project content read with old credentials is not reused."""
+        from google_automation_mcp import appscript_tools
+        from google_automation_mcp.auth import google_auth
+
+        appscript_tools._project_cache.set(("a@example.com", "s1"), MagicMock())
+        store = MagicMock()
+        store.store_credential.return_value = True
+        with patch.object(google_auth, "get_credential_store", return_value=store):
+            assert google_auth.store_credentials(MagicMock(), "b@example.com")
+
+        assert len(appscript_tools._project_cache) == 0
+
+    def test_services_for_same_token_share_one_entry(self):
+        """Test a user's services are bundled under one cache entry."""
+        from google.oauth2.credentials import Credentials
+        from google_automation_mcp.auth import google_auth
+
+        google_auth._service_cache.clear()
+        creds = Credentials(token="t")
+        with patch("googleapiclient.discovery.build_from_document") as mock_build:
+            mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+            gmail = google_auth.build_service("gmail", "v1", creds)
+            drive = google_auth.build_service("drive", "v3", creds)
+
+            assert google_auth.build_service("gmail", "v1", creds) is gmail
+            assert google_auth.build_service("drive", "v3", creds) is drive
+
+        assert mock_build.call_count == 2
+        assert len(google_auth._service_cache) == 1
+        google_auth._service_cache.clear()
+
+    def test_uses_static_discovery_with_dynamic_fallback(self):
+        """Test bundled discovery documents are used when available."""
+        from google.oauth2.credentials import Credentials
+        from google_automation_mcp.auth import google_auth
+
+        google_auth._service_cache.clear()
+        with (
+            patch("googleapiclient.discovery.build_from_document") as mock_static,
+            patch("googleapiclient.discovery.build") as mock_build,
+        ):
+            google_auth.build_service("drive", "v3", Credentials(token="t"))
+            google_auth.build_service("newapi", "v9", Credentials(token="t"))
+
+        # The bundled document is handed over already parsed
+        assert mock_static.call_count == 1
+        assert mock_static.call_args.args[0]["name"] == "drive"
+        assert mock_build.call_count == 1
+        assert mock_build.call_args.args[:2] == ("newapi", "v9")
+        assert mock_build.call_args.kwargs["static_discovery"] is False
+        assert mock_build.call_args.kwargs["cache_discovery"] is False
+        google_auth._service_cache.clear()
+
+
+class TestDefaultUser:
+    """Tests for the default user fallback in service injection."""
+
+    def test_default_user_cached_until_credentials_change(self):
+        """Test the store is listed once until credentials change."""
+        from google_automation_mcp.auth import credential_store, service_adapter
+
+        store = MagicMock()
+        store.list_users.return_value = ["a@example.com"]
+        previous = credential_store._credential_store
+        credential_store.set_credential_store(store)
+        try:
+            assert service_adapter._resolve_default_user() == "a@example.com"
+            assert service_adapter._resolve_default_user() == "a@example.com"
+            assert store.list_users.call_count == 1
+
+            store.list_users.return_value = ["b@example.com"]
+            credential_store.mark_credentials_changed()
+            assert service_adapter._resolve_default_user() == "b@example.com"
+        finally:
+            credential_store._credential_store = previous
+            credential_store.mark_credentials_changed()
+
+    @pytest.mark.asyncio
+    async def test_with_service_preserves_metadata_and_injects_service(self):
+        """Test the injector keeps the wrapped function's metadata."""
+        import inspect
+        from google_automation_mcp.auth.service_adapter import with_service
+
+        async def tool(service, user_google_email: str, value: int = 1):
+            """Tool docstring."""
+            return (service, user_google_email, value)
+
+        wrapped = with_service("gmail", "v1")(tool)
+        assert wrapped.__name__ == "tool"
+        assert wrapped.__doc__ == "Tool docstring."
+        assert wrapped.__module__ == __name__
+        assert wrapped.__wrapped__ is tool
+        assert not hasattr(wrapped, "__dict__")
+        assert "value" in inspect.signature(wrapped).parameters
+
+        service = MagicMock()
+        with patch(
+            "google_automation_mcp.auth.service_adapter.get_service_for_user",
+            return_value=service,
+        ):
+            result = await wrapped(user_google_email="u@example.com", value=2)
+        assert result == (service, "u@example.com", 2)
+
+    @pytest.mark.asyncio
+    async def test_with_service_resolves_off_event_loop(self):
+        """Test service and default user lookups run in worker threads."""
+        import threading
+        from google_automation_mcp.auth import service_adapter
+
+        threads = []
+
+        def fake_service(*args):
+            threads.append(threading.get_ident())
+            return MagicMock()
+
+        def fake_user():
+            threads.append(threading.get_ident())
+            return "u@example.com"
+
+        async def tool(service, user_google_email: str = ""):
+            return user_google_email
+
+        wrapped = service_adapter.with_service("gmail", "v1")(tool)
+        with (
+            patch.object(service_adapter, "get_service_for_user", fake_service),
+            patch.object(service_adapter, "_resolve_default_user", fake_user),
+        ):
+            result = await wrapped()
+
+        assert result == "u@example.com"
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_with_service_reports_auth_error(self):
+        """Test a failed lookup becomes an authentication error message."""
+        from google_automation_mcp.auth import service_adapter
+
+        async def tool(service, user_google_email: str):
+            return "called"
+
+        wrapped = service_adapter.with_service("gmail", "v1")(tool)
+        with patch.object(
+            service_adapter,
+            "get_service_for_user",
+            side_effect=ValueError("No credentials found for user: u@example.com"),
+        ):
+            result = await wrapped(user_google_email="u@example.com")
+
+        assert result.startswith("Authentication error:")
+
+
+class TestDetectEnvironment:
+    """Tests for setup environment detection caching."""
+
+    def test_detection_cached_until_cleared(self):
+        """Test clasp is probed once until the cache is cleared."""
+        from google_automation_mcp import setup
+
+        clasp_env = {
+            "node_installed": True,
+            "npm_installed": True,
+            "clasp_installed": False,
+            "clasp_authenticated": False,
+            "clasp_user_email": None,
+        }
+        setup.detect_environment.cache_clear()
+        try:
+            with patch.object(
+                setup, "detect_clasp_environment", return_value=clasp_env
+            ) as probe:
+                first = setup.detect_environment()
+                assert setup.detect_environment() is first
+                assert probe.call_count == 1
+
+                setup.detect_environment.cache_clear()
+                setup.detect_environment()
+                assert probe.call_count == 2
+        finally:
+            setup.detect_environment.cache_clear()
+
+    def test_print_detection_results(self, capsys):
+        """Test each check reports its state and optional lines are skipped."""
+        from google_automation_mcp import setup
+
+        env = {
+            "is_interactive": True,
+            "has_browser": False,
+            "node_installed": True,
+            "clasp_installed": False,
+            "clasp_authenticated": False,
+            "clasp_user": None,
+            "oauth_configured": True,
+            "has_credentials": False,
+            "existing_users": [],
+        }
+        setup.print_detection_results(env)
+
+        assert capsys.readouterr().out.splitlines()[2:-1] == [
+            "✓ Interactive terminal",
+            "✗ No browser (DISPLAY not set)",
+            "✓ Node.js installed",
+            "✗ clasp not installed",
+            "✓ GCP OAuth credentials configured",
+        ]
+
+    def test_import_clasp_credentials_reuses_known_email(self):
+        """Test a known clasp account skips the userinfo lookup."""
+        from google_automation_mcp import setup
+
+        with (
+            patch.object(setup, "get_clasp_tokens", return_value={"access_token": "a"}),
+            patch.object(
+                setup, "clasp_tokens_to_credentials", return_value=MagicMock()
+            ),
+            patch.object(setup, "get_user_email_from_credentials") as lookup,
+            patch.object(setup, "store_credentials") as store,
+        ):
+            assert setup._import_clasp_credentials("me@example.com") is True
+
+        lookup.assert_not_called()
+        assert store.call_args.args[1] == "me@example.com"
+
+
+class TestCredentialsCache:
+    """Tests for credential reuse in get_service_for_user."""
+
+    def _credentials(self, minutes):
+        from datetime import datetime, timedelta, timezone
+
+        creds = MagicMock()
+        creds.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            minutes=minutes
+        )
+        return creds
+
+    def test_fresh_credentials_reused(self):
+        """Test the store is read once while the token is fresh."""
+        from google_automation_mcp.auth import service_adapter
+
+        creds = self._credentials(30)
+        service_adapter.clear_credentials_cache()
+        try:
+            with (
+                patch.object(
+                    service_adapter, "get_credentials_for_user", return_value=creds
+                ) as load,
+                patch.object(service_adapter, "build_service") as build,
+            ):
+                service_adapter.get_service_for_user("gmail", "v1", "a@example.com")
+                service_adapter.get_service_for_user("drive", "v3", "a@example.com")
+            assert load.call_count == 1
+            build.assert_called_with("drive", "v3", creds)
+        finally:
+            service_adapter.clear_credentials_cache()
+
+    def test_expiring_credentials_not_cached(self):
+        """Test credentials close to expiry are loaded on every call."""
+        from google_automation_mcp.auth import service_adapter
+
+        creds = self._credentials(0.5)
+        service_adapter.clear_credentials_cache()
+        try:
+            with (
+                patch.object(
+                    service_adapter, "get_credentials_for_user", return_value=creds
+                ) as load,
+                patch.object(service_adapter, "build_service"),
+            ):
+                service_adapter.get_service_for_user("gmail", "v1", "a@example.com")
+                service_adapter.get_service_for_user("gmail", "v1", "a@example.com")
+            assert load.call_count == 2
+        finally:
+            service_adapter.clear_credentials_cache()
+
+    def test_cache_dropped_when_credentials_change(self):
+        """Test a credential store change forces a reload."""
+        from google_automation_mcp.auth import credential_store, service_adapter
+
+        creds = self._credentials(30)
+        service_adapter.clear_credentials_cache()
+        try:
+            with (
+                patch.object(
+                    service_adapter, "get_credentials_for_user", return_value=creds
+                ) as load,
+                patch.object(service_adapter, "build_service"),
+            ):
+                service_adapter.get_service_for_user("gmail", "v1", "a@example.com")
+                credential_store.mark_credentials_changed()
+                service_adapter.get_service_for_user("gmail", "v1", "a@example.com")
+            assert load.call_count == 2
+        finally:
+            service_adapter.clear_credentials_cache()
+
+
+class TestCompleteGoogleAuth:
+    """Tests for the complete_google_auth tool."""
+
+    @pytest.mark.asyncio
+    async def test_id_token_verified_over_pooled_transport(self):
+        """Test certificate fetches for ID token checks reuse the HTTP pool."""
+        from google_automation_mcp.core.http import auth_request
+        from google_automation_mcp.tools import auth_tools
+
+        creds = MagicMock(id_token="token", client_id="client")
+        with (
+            patch.object(auth_tools, "get_pending_flow", return_value=MagicMock()),
+            patch.object(auth_tools, "complete_auth_flow", return_value=creds),
+            patch.object(auth_tools, "clear_pending_flow"),
+            patch("google.oauth2.id_token.verify_oauth2_token") as verify,
+        ):
+            verify.return_value = {"email": "me@example.com"}
+            result = await auth_tools.complete_google_auth("http://localhost/?code=x")
+
+        assert "me@example.com" in result
+        assert verify.call_args.args[1] is auth_request()
@@ -0,0 +1,98 @@
+"""
+Unit tests for request coalescing into HTTP batches.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from google_automation_mcp.core.batching import BatchCoalescer, Coalescer
+
+from .conftest import FakeBatch
+
+
+def make_request(result=None, error=None):
+    request = MagicMock()
+    if error is not None:
+        request.execute.side_effect = error
+    else:
+        request.execute.return_value = result
+    return request
+
+
+@pytest.fixture
+def service():
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = FakeBatch
+    return service
+
+
+class TestBatchCoalescer:
+    """Tests for BatchCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_single_request_executes_directly(self, service):
+        """Test a lone request is not wrapped in a batch."""
+        coalescer = BatchCoalescer(delay=0.01)
+
+        result = await coalescer.submit(service, make_request({"id": "p1"}))
+
+        assert result == {"id": "p1"}
+        service.new_batch_http_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self, service):
+        """Test requests in the same window go out as one batch."""
+        coalescer = BatchCoalescer(delay=0.01)
+
+        results = await asyncio.gather(
+            coalescer.submit(service, make_request({"id": "a"})),
+            coalescer.submit(service, make_request({"id": "b"})),
+            coalescer.submit(service, make_request({"id": "c"})),
+        )
+
+        assert results == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        assert service.new_batch_http_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_only_their_caller(self, service):
+        """Test a failed sub-request fails only its own submit."""
+        coalescer = BatchCoalescer(delay=0.01)
+
+        results = await asyncio.gather(
+            coalescer.submit(service, make_request({"id": "a"})),
+            coalescer.submit(service, make_request(error=ValueError("denied"))),
+            return_exceptions=True,
+        )
+
+        assert results[0] == {"id": "a"}
+        assert isinstance(results[1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_full_batch_sent_without_waiting(self, service):
+        """Test reaching max_size sends the batch before the delay expires."""
+        coalescer = BatchCoalescer(delay=60, max_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                coalescer.submit(service, make_request(1)),
+                coalescer.submit(service, make_request(2)),
+            ),
+            timeout=5,
+        )
+
+        assert results == [1, 2]
+
+
+class TestCoalescer:
+    """Tests for the Coalescer base class."""
+
+    def test_subclass_without_send_cannot_be_created(self):
+        """Test a missing _send fails at construction, not on first flush."""
+
+        class Incomplete(Coalescer):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
@@ -0,0 +1,49 @@
+"""
+Unit tests for the in-process TTL cache.
+"""
+
+from unittest.mock import patch
+
+from google_automation_mcp.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test a value is dropped once its TTL has passed."""
+        cache = TTLCache(maxsize=4, ttl=60)
+
+        with patch("google_automation_mcp.core.cache.time.monotonic") as now:
+            now.return_value = 100.0
+            cache.set("a", 1)
+            assert cache.get("a") == 1
+
+            now.return_value = 161.0
+            assert cache.get("a") is None
+            assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop_where(self):
+        """Test only entries matching the predicate are dropped."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set(("u1", "a"), 1)
+        cache.set(("u1", "b"), 2)
+        cache.set(("u2", "a"), 3)
+
+        assert cache.pop_where(lambda key, value: key[0] == "u1" and value > 1) == 1
+
+        assert cache.get(("u1", "a")) == 1
+        assert cache.get(("u1", "b")) is None
+        assert cache.get(("u2", "a")) == 3
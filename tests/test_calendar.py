@@ -10,11 +10,29 @@ from unittest.mock import MagicMock, patch
 from google_automation_mcp.tools.calendar import (
     list_calendars,
     get_events,
+    get_events_multi,
     create_event,
     delete_event,
     update_event,
 )
 
+from .conftest import FakeBatch
+
+
+def events_by_calendar(responses):
+    """Build an events().list side effect answering per calendar ID."""
+
+    def list_events(**kwargs):
+        request = MagicMock()
+        response = responses[kwargs["calendarId"]]
+        if isinstance(response, Exception):
+            request.execute.side_effect = response
+        else:
+            request.execute.return_value = response
+        return request
+
+    return list_events
+
 
 @pytest.fixture
 def mock_calendar_service():
@@ -64,6 +82,20 @@ class TestCalendarTools:
         assert "Access: owner" in result
         assert "Access: reader" in result
 
+    @pytest.mark.asyncio
+    async def test_list_calendars_cached(self, mock_calendar_service, mock_get_service):
+        """Test a second listing for the same user is served from cache."""
+        list_request = mock_calendar_service.calendarList().list()
+        list_request.execute.return_value = {
+            "items": [{"id": "primary", "summary": "Me", "primary": True}]
+        }
+
+        first = await list_calendars(user_google_email="test@example.com")
+        second = await list_calendars(user_google_email="test@example.com")
+
+        assert first == second
+        assert list_request.execute.call_count == 1
+
     @pytest.mark.asyncio
     async def test_list_calendars_empty(self, mock_calendar_service, mock_get_service):
         """Test listing calendars when none are found."""
@@ -119,6 +151,47 @@ class TestCalendarTools:
         # Verify query parameter was passed to API
         args, kwargs = mock_calendar_service.events().list.call_args
         assert kwargs["q"] == "Lunch"
+        assert kwargs["fields"].startswith("items(")
+
+    @pytest.mark.asyncio
+    async def test_get_events_multi_one_batch(self, mock_calendar_service, mock_get_service):
+        """Test several calendars are read in a single batch request."""
+        mock_calendar_service.new_batch_http_request.side_effect = FakeBatch
+        mock_calendar_service.events().list.side_effect = events_by_calendar({
+            "primary": {"items": [{"id": "e1", "summary": "Standup",
+                                   "start": {"dateTime": "2024-01-15T09:00:00Z"}}]},
+            "work": {"items": []},
+            "team": Exception("Not Found"),
+        })
+
+        result = await get_events_multi(
+            user_google_email="test@example.com",
+            calendar_ids=["primary", "work", "team", "primary"],
+        )
+
+        assert mock_calendar_service.new_batch_http_request.call_count == 1
+        assert "Found 1 events in 'primary'" in result
+        assert "Standup" in result
+        assert "No events found in calendar 'work'" in result
+        assert "Could not read calendar 'team': Not Found" in result
+        assert result.count("'primary'") == 1
+
+    @pytest.mark.asyncio
+    async def test_get_events_multi_defaults_to_calendar_list(self, mock_calendar_service, mock_get_service):
+        """Test omitting calendar_ids reads every calendar in the user's list."""
+        mock_calendar_service.new_batch_http_request.side_effect = FakeBatch
+        mock_calendar_service.calendarList().list().execute.return_value = {
+            "items": [{"id": "primary"}, {"id": "work"}]
+        }
+        mock_calendar_service.events().list.side_effect = events_by_calendar({
+            "primary": {"items": []},
+            "work": {"items": []},
+        })
+
+        result = await get_events_multi(user_google_email="test@example.com")
+
+        assert "calendar 'primary'" in result
+        assert "calendar 'work'" in result
 
     @pytest.mark.asyncio
     async def test_create_event_timed(self, mock_calendar_service, mock_get_service):
@@ -152,6 +225,22 @@ class TestCalendarTools:
         assert len(body["attendees"]) == 2
         assert body["attendees"][0]["email"] == "user1@example.com"
 
+    @pytest.mark.asyncio
+    async def test_create_event_skips_blank_attendees(self, mock_calendar_service, mock_get_service):
+        """Test stray commas do not produce empty attendee entries."""
+        mock_calendar_service.events().insert().execute.return_value = {"id": "e1"}
+
+        await create_event(
+            user_google_email="test@example.com",
+            summary="Sync",
+            start_time="2024-01-15T09:00:00Z",
+            end_time="2024-01-15T10:00:00Z",
+            attendees=" a@example.com,, b@example.com , ",
+        )
+
+        body = mock_calendar_service.events().insert.call_args.kwargs["body"]
+        assert body["attendees"] == [{"email": "a@example.com"}, {"email": "b@example.com"}]
+
     @pytest.mark.asyncio
     async def test_create_event_all_day(self, mock_calendar_service, mock_get_service):
         """Test creating an all-day calendar event."""
@@ -223,3 +312,19 @@ class TestCalendarTools:
             user_google_email="test@example.com", event_id="evt_123"
         )
         assert "No fields to update" in result
+        mock_calendar_service.events().patch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_event_clears_with_empty_string(self, mock_calendar_service, mock_get_service):
+        """Test an empty string is sent to clear a field, not treated as omitted."""
+        mock_calendar_service.events().patch().execute.return_value = {
+            "id": "evt_123", "summary": "Meeting", "start": {"dateTime": "2024-01-15T10:00:00Z"}
+        }
+
+        result = await update_event(
+            user_google_email="test@example.com", event_id="evt_123", description=""
+        )
+
+        assert "Updated event" in result
+        args, kwargs = mock_calendar_service.events().patch.call_args
+        assert kwargs["body"] == {"description": ""}
@@ -7,6 +7,7 @@ import pytest
 from google_automation_mcp.tools.calendar_router import (
     list_calendars,
     get_events,
+    get_events_multi,
     create_event,
     update_event,
     delete_event,
@@ -92,3 +93,26 @@ class TestCalendarRouterTools:
         mock_call_router.return_value = {"deleted": True}
         result = await delete_event(user_google_email="t@t.com", event_id="e1")
         assert "Deleted event: e1" in result
+
+    async def test_get_events_multi(self, mock_call_router):
+        mock_call_router.side_effect = lambda email, action, params: (
+            [{"id": "e1", "summary": "Meeting", "start": "2026-04-17T10:00:00Z",
+              "end": "2026-04-17T11:00:00Z", "all_day": False}]
+            if params["calendar_id"] == "work" else []
+        )
+        result = await get_events_multi(
+            user_google_email="t@t.com", calendar_ids=["primary", "work"]
+        )
+        assert mock_call_router.await_count == 2
+        assert "No events found in calendar 'primary'" in result
+        assert "Found 1 events in 'work'" in result
+
+    async def test_get_events_multi_defaults_to_calendar_list(self, mock_call_router):
+        mock_call_router.side_effect = [
+            [{"id": "primary", "name": "Mine"}, {"id": "work", "name": "Work"}],
+            [],
+            [],
+        ]
+        result = await get_events_multi(user_google_email="t@t.com")
+        assert mock_call_router.await_args_list[0].args[1] == "list_calendars"
+        assert "calendar 'work'" in result
@@ -4,6 +4,8 @@ Unit tests for Google Docs MCP tools
 Tests all Docs tools with mocked API responses.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +17,8 @@ from google_automation_mcp.tools.docs import (
     append_doc_text,
 )
 
+from .conftest import FakeBatch
+
 
 @pytest.fixture
 def mock_service():
@@ -127,6 +131,39 @@ class TestGoogleDocsTools:
         assert "Table cell" in result
         mock_service.documents().get.assert_called_with(documentId=self.doc_id)
 
+    async def test_get_doc_content_keeps_document_order(
+        self, mock_service, mock_get_service
+    ):
+        def para(text):
+            return {"paragraph": {"elements": [{"textRun": {"content": text}}]}}
+
+        def table(*cells):
+            return {
+                "table": {
+                    "tableRows": [
+                        {"tableCells": [{"content": list(cell)} for cell in cells]}
+                    ]
+                }
+            }
+
+        mock_service.documents().get().execute.return_value = {
+            "title": "Nested",
+            "body": {
+                "content": [
+                    para("1 "),
+                    table([para("2 "), table([para("3 ")]), para("4 ")], [para("5 ")]),
+                    {"sectionBreak": {}},
+                    para("6"),
+                ]
+            },
+        }
+
+        result = await get_doc_content(
+            user_google_email=self.user_email, document_id=self.doc_id
+        )
+
+        assert result.endswith("--- CONTENT ---\n1 2 3 4 5 6")
+
     async def test_create_doc_with_content(self, mock_service, mock_get_service):
         mock_service.documents().create().execute.return_value = {
             "documentId": "new_id"
@@ -189,10 +226,8 @@ class TestGoogleDocsTools:
         assert req["containsText"]["text"] == "old"
 
     async def test_append_doc_text(self, mock_service, mock_get_service):
-        mock_service.documents().get().execute.return_value = {
-            "body": {"content": [{"endIndex": 100}]}
-        }
         mock_service.documents().batchUpdate().execute.return_value = {}
+        mock_service.documents().get.reset_mock()
 
         result = await append_doc_text(
             user_google_email=self.user_email,
@@ -201,10 +236,101 @@ class TestGoogleDocsTools:
         )
 
         assert "Appended text to document" in result
-        mock_service.documents().get.assert_called_with(documentId=self.doc_id)
-        mock_service.documents().batchUpdate.assert_called()
+        # The end is resolved by Docs; the document is not fetched first
+        mock_service.documents().get.assert_not_called()
         args, kwargs = mock_service.documents().batchUpdate.call_args
-        # endIndex 100 -> index 99
-        assert (
-            kwargs["body"]["requests"][0]["insertText"]["location"]["index"] == 99
+        assert kwargs["body"]["requests"] == [
+            {"insertText": {"endOfSegmentLocation": {}, "text": "Appending this"}}
+        ]
+
+    async def test_concurrent_edits_share_one_batch_update(
+        self, mock_service, mock_get_service
+    ):
+        batch_update = mock_service.documents().batchUpdate
+        batch_update().execute.return_value = {
+            "documentId": self.doc_id,
+            "replies": [{"replaceAllText": {"occurrencesChanged": 3}}, {}],
+        }
+        batch_update.reset_mock()
+
+        replaced, appended = await asyncio.gather(
+            modify_doc_text(
+                user_google_email=self.user_email,
+                document_id=self.doc_id,
+                text="new",
+                replace_text="old",
+            ),
+            append_doc_text(
+                user_google_email=self.user_email,
+                document_id=self.doc_id,
+                text="tail",
+            ),
+        )
+
+        assert "Replaced 3 occurrence(s) of 'old' with 'new'" in replaced
+        assert "Appended text to document" in appended
+        batch_update.assert_called_once()
+        requests = batch_update.call_args.kwargs["body"]["requests"]
+        assert [next(iter(r)) for r in requests] == ["replaceAllText", "insertText"]
+
+    async def test_failed_fused_edit_reports_only_its_caller(
+        self, mock_service, mock_get_service
+    ):
+        def batch_update(documentId, body):
+            request = MagicMock()
+            at_index = "location" in body["requests"][0].get("insertText", {})
+            if len(body["requests"]) > 1 or at_index:
+                request.execute.side_effect = Exception("Index 500 out of range")
+            else:
+                request.execute.return_value = {"replies": [{}]}
+            return request
+
+        mock_service.documents().batchUpdate.side_effect = batch_update
+
+        inserted, appended = await asyncio.gather(
+            modify_doc_text(
+                user_google_email=self.user_email,
+                document_id=self.doc_id,
+                text="x",
+                index=500,
+            ),
+            append_doc_text(
+                user_google_email=self.user_email,
+                document_id=self.doc_id,
+                text="tail",
+            ),
         )
+
+        assert "Index 500 out of range" in inserted
+        assert "Appended text to document" in appended
+
+    async def test_edits_to_different_documents_share_one_http_batch(
+        self, mock_service, mock_get_service
+    ):
+        def batch_update(documentId, body):
+            request = MagicMock()
+            if documentId == "missing":
+                request.execute.side_effect = Exception("Requested entity was not found")
+            else:
+                request.execute.return_value = {"documentId": documentId, "replies": [{}]}
+            return request
+
+        mock_service.new_batch_http_request.side_effect = FakeBatch
+        mock_service.documents().batchUpdate.side_effect = batch_update
+
+        first, second, missing = await asyncio.gather(
+            append_doc_text(
+                user_google_email=self.user_email, document_id="doc_a", text="a"
+            ),
+            append_doc_text(
+                user_google_email=self.user_email, document_id="doc_b", text="b"
+            ),
+            append_doc_text(
+                user_google_email=self.user_email, document_id="missing", text="c"
+            ),
+        )
+
+        assert "doc_a" in first
+        assert "doc_b" in second
+        assert "Requested entity was not found" in missing
+        mock_service.new_batch_http_request.assert_called_once()
@@ -4,7 +4,6 @@ Unit tests for Google Drive MCP tools
 Tests all Drive tools with mocked API responses.
 """
 
-import io
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -95,6 +94,82 @@ class TestDriveTools:
         assert "Found 2 items" in result
         assert "Folder A" in result
         assert "File B" in result
+        # Only the fields the listing prints are requested
+        assert (
+            mock_drive_service.files().list.call_args.kwargs["fields"]
+            == "files(id, name, mimeType, size)"
+        )
+
+    def _track_changes(self, service, *change_pages):
+        """Set up the changes feed to return change_pages in order."""
+        service.changes().getStartPageToken().execute.return_value = {
+            "startPageToken": "t1"
+        }
+        service.files().get().execute.return_value = {"id": "root-id"}
+        service.files().list().execute.return_value = {
+            "files": [{"id": "f1", "name": "Notes", "mimeType": "text/plain"}]
+        }
+        service.changes().list().execute.side_effect = list(change_pages)
+        service.files().list.reset_mock()
+        service.changes().list.reset_mock()
+
+    async def test_list_drive_items_cached_until_changed(
+        self, mock_drive_service, mock_get_service
+    ):
+        """Test a repeat listing only reads the changes feed."""
+        self._track_changes(
+            mock_drive_service,
+            {"newStartPageToken": "t2", "changes": []},
+            {"newStartPageToken": "t3", "changes": [{"fileId": "f1"}]},
+        )
+
+        first = await list_drive_items(user_google_email="test@example.com")
+        second = await list_drive_items(user_google_email="test@example.com")
+        assert first == second
+        assert mock_drive_service.files().list.call_count == 1
+        assert mock_drive_service.changes().list.call_args.kwargs["pageToken"] == "t1"
+
+        # f1 changed, so the folder holding it is listed again
+        await list_drive_items(user_google_email="test@example.com")
+        assert mock_drive_service.files().list.call_count == 2
+        assert mock_drive_service.changes().list.call_args.kwargs["pageToken"] == "t2"
+
+    async def test_list_drive_items_new_file_in_root(
+        self, mock_drive_service, mock_get_service
+    ):
+        """Test a file added under the root ID refreshes the 'root' listing."""
+        self._track_changes(
+            mock_drive_service,
+            {"nextPageToken": "t1b", "changes": []},
+            {
+                "newStartPageToken": "t2",
+                "changes": [{"fileId": "new", "file": {"parents": ["root-id"]}}],
+            },
+            {
+                "newStartPageToken": "t3",
+                "changes": [{"fileId": "other", "file": {"parents": ["elsewhere"]}}],
+            },
+        )
+
+        await list_drive_items(user_google_email="test@example.com")
+        await list_drive_items(user_google_email="test@example.com")
+        assert mock_drive_service.files().list.call_count == 2
+
+        # A change in some other folder leaves this listing cached
+        await list_drive_items(user_google_email="test@example.com")
+        assert mock_drive_service.files().list.call_count == 2
+
+    async def test_list_drive_items_sync_failure_relists(
+        self, mock_drive_service, mock_get_service
+    ):
+        """Test a failed changes sync falls back to a full listing."""
+        self._track_changes(mock_drive_service, Exception("Invalid page token"))
+
+        await list_drive_items(user_google_email="test@example.com")
+        result = await list_drive_items(user_google_email="test@example.com")
+
+        assert "Notes" in result
+        assert mock_drive_service.files().list.call_count == 2
 
     async def test_get_drive_file_content_doc(self, mock_drive_service, mock_get_service):
         """Test getting content of a Google Doc (export)."""
@@ -139,7 +214,7 @@ class TestDriveTools:
             "webViewLink": "https://link",
         }
 
-        with patch("google_automation_mcp.tools.drive.MediaIoBaseUpload"):
+        with patch("google_automation_mcp.tools.drive.MediaIoBaseUpload") as upload:
             result = await create_drive_file(
                 user_google_email="test@example.com",
                 file_name="test.txt",
@@ -149,6 +224,8 @@ class TestDriveTools:
         assert "Created file: test.txt" in result
         assert "ID: new123" in result
         mock_drive_service.files().create.assert_called()
+        # Small files upload in one multipart request
+        assert upload.call_args.kwargs["resumable"] is False
 
     async def test_create_drive_folder(self, mock_drive_service, mock_get_service):
         """Test creating a folder."""
@@ -191,6 +268,39 @@ class TestDriveTools:
             fileId="file123", body={"trashed": True}, supportsAllDrives=True
         )
 
+    async def test_concurrent_trash_calls_share_one_batch(
+        self, mock_drive_service, mock_get_service
+    ):
+        """Test trash calls issued together are sent as one batch."""
+        import asyncio
+
+        batches = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            batch.requests = []
+            batch.add.side_effect = lambda request, request_id: batch.requests.append(
+                request_id
+            )
+            batch.execute.side_effect = lambda: [
+                callback(request_id, {}, None) for request_id in batch.requests
+            ]
+            batches.append(batch)
+            return batch
+
+        mock_drive_service.new_batch_http_request.side_effect = new_batch
+
+        results = await asyncio.gather(
+            *(
+                trash_drive_file(user_google_email="test@example.com", file_id=f"f{i}")
+                for i in range(3)
+            )
+        )
+
+        assert results == [f"Moved to trash: f{i}" for i in range(3)]
+        assert len(batches) == 1
+        assert len(batches[0].requests) == 3
+
     async def test_share_drive_file(self, mock_drive_service, mock_get_service):
         """Test sharing a file."""
         mock_drive_service.permissions().create().execute.return_value = {
@@ -231,6 +341,26 @@ class TestDriveTools:
         assert "Owner Name (owner)" in result
         assert "Anyone with link (reader)" in result
 
+    async def test_share_refreshes_cached_permissions(
+        self, mock_drive_service, mock_get_service
+    ):
+        """Test permissions are cached until this server changes them."""
+        list_request = mock_drive_service.permissions().list()
+        list_request.execute.return_value = {
+            "permissions": [{"id": "p1", "type": "user", "role": "owner"}]
+        }
+        mock_drive_service.permissions().create().execute.return_value = {"id": "p2"}
+
+        await list_drive_permissions(user_google_email="test@example.com", file_id="f1")
+        await list_drive_permissions(user_google_email="test@example.com", file_id="f1")
+        assert list_request.execute.call_count == 1
+
+        await share_drive_file(
+            user_google_email="test@example.com", file_id="f1", email="a@b.com"
+        )
+        await list_drive_permissions(user_google_email="test@example.com", file_id="f1")
+        assert list_request.execute.call_count == 2
+
     async def test_remove_drive_permission(self, mock_drive_service, mock_get_service):
         """Test removing a permission."""
         mock_drive_service.permissions().delete().execute.return_value = {}
@@ -0,0 +1,64 @@
+"""
+Unit tests for the shared tool error handler.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from google_automation_mcp.tools.error_handler import handle_errors
+
+
+def make_tool(error):
+    @handle_errors
+    async def tool():
+        raise error
+
+    return tool
+
+
+def http_error(status, content=b"failed"):
+    return HttpError(MagicMock(status=status, reason="reason"), content)
+
+
+class TestHandleErrors:
+    """Tests for handle_errors."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status, prefix",
+        [
+            (401, "Authentication error:"),
+            (403, "Permission denied:"),
+            (404, "Not found:"),
+            (500, "API error:"),
+        ],
+    )
+    async def test_http_errors_by_status(self, status, prefix):
+        """Test each HTTP status maps to its message."""
+        result = await make_tool(http_error(status))()
+
+        assert result.startswith(prefix)
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated_mentions_auth_tool(self):
+        """Test a 401 tells the user how to authenticate."""
+        result = await make_tool(http_error(401))()
+
+        assert "start_google_auth" in result
+
+    @pytest.mark.asyncio
+    async def test_api_not_enabled(self):
+        """Test a 403 for a disabled API says so."""
+        result = await make_tool(http_error(403, b"accessNotConfigured"))()
+
+        assert result.startswith("API not enabled:")
+        assert "Google Cloud Console" in result
+
+    @pytest.mark.asyncio
+    async def test_other_exceptions(self):
+        """Test non-HTTP failures are reported as errors."""
+        result = await make_tool(ValueError("bad input"))()
+
+        assert result == "Error: bad input"
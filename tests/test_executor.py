@@ -0,0 +1,44 @@
+"""
+Unit tests for the Google API thread pool.
+"""
+
+import contextvars
+import os
+from unittest.mock import patch
+
+import pytest
+
+from google_automation_mcp.core.executor import get_pool_size, run_api_call
+
+_request_user = contextvars.ContextVar("request_user", default=None)
+
+
+class TestPoolSize:
+    """Tests for APPSCRIPT_MCP_POOL parsing."""
+
+    def test_default_and_override(self):
+        """Test the default size and an explicit override."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_pool_size() == 16
+        with patch.dict(os.environ, {"APPSCRIPT_MCP_POOL": "4"}):
+            assert get_pool_size() == 4
+
+    def test_invalid_values_fall_back(self):
+        """Test unparsable or non-positive sizes are not used as-is."""
+        with patch.dict(os.environ, {"APPSCRIPT_MCP_POOL": "lots"}):
+            assert get_pool_size() == 16
+        with patch.dict(os.environ, {"APPSCRIPT_MCP_POOL": "0"}):
+            assert get_pool_size() == 1
+
+
+class TestRunApiCall:
+    """Tests for run_api_call."""
+
+    @pytest.mark.asyncio
+    async def test_propagates_context(self):
+        """Test request-scoped context variables reach the worker thread."""
+        _request_user.set("user@example.com")
+
+        result = await run_api_call(_request_user.get)
+
+        assert result == "user@example.com"
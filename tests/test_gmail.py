@@ -6,6 +6,7 @@ Tests all Gmail tools with mocked API responses.
 
 import pytest
 import base64
+from email import message_from_bytes, policy
 from unittest.mock import MagicMock, patch
 
 from google_automation_mcp.tools.gmail import (
@@ -14,13 +15,17 @@ from google_automation_mcp.tools.gmail import (
     send_gmail_message,
     list_gmail_labels,
     modify_gmail_labels,
+    modify_gmail_labels_bulk,
 )
 
+from .conftest import FakeBatch
+
 
 @pytest.fixture
 def mock_gmail_service():
     """Create a mock Gmail API service."""
     service = MagicMock()
+    service.new_batch_http_request.side_effect = FakeBatch
     return service
 
 
@@ -67,6 +72,70 @@ class TestGmailTools:
         assert "Preview: Test snippet content" in result
         mock_gmail_service.users().messages().list.assert_called()
 
+    async def test_search_gmail_messages_batches_details(
+        self, mock_gmail_service, mock_get_service
+    ):
+        """Test message details are fetched in batches, in list order."""
+        ids = [f"msg{i}" for i in range(60)]
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": i} for i in ids]
+        }
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "snippet": "s",
+            "payload": {"headers": [{"name": "Subject", "value": "Hi"}]},
+        }
+
+        result = await search_gmail_messages(
+            user_google_email="test@example.com", max_results=60
+        )
+
+        assert mock_gmail_service.new_batch_http_request.call_count == 2
+        assert result.count("Subject: Hi") == 60
+        assert result.index("ID: msg9\n") < result.index("ID: msg10\n")
+
+    async def test_search_gmail_messages_runs_batches_concurrently(
+        self, mock_gmail_service, mock_get_service
+    ):
+        """Test multiple batches are in flight at the same time."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BlockingBatch(FakeBatch):
+            def execute(self):
+                barrier.wait()  # breaks unless both batches run together
+                super().execute()
+
+        mock_gmail_service.new_batch_http_request.side_effect = BlockingBatch
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": f"msg{i}"} for i in range(100)]
+        }
+        mock_gmail_service.users().messages().get().execute.return_value = {
+            "payload": {"headers": [{"name": "Subject", "value": "Hi"}]},
+        }
+
+        result = await search_gmail_messages(
+            user_google_email="test@example.com", max_results=100
+        )
+
+        assert result.count("Subject: Hi") == 100
+
+    async def test_search_gmail_messages_failed_detail(
+        self, mock_gmail_service, mock_get_service
+    ):
+        """Test a failed detail lookup does not fail the whole search."""
+        mock_gmail_service.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}]
+        }
+        mock_gmail_service.users().messages().get().execute.side_effect = Exception(
+            "boom"
+        )
+
+        result = await search_gmail_messages(user_google_email="test@example.com")
+
+        assert "ID: msg1" in result
+        assert "(details unavailable)" in result
+
     async def test_search_gmail_messages_no_results(self, mock_gmail_service, mock_get_service):
         """Test search when no messages are found."""
         mock_gmail_service.users().messages().list().execute.return_value = {}
@@ -167,6 +236,32 @@ class TestGmailTools:
         assert "Message sent successfully!" in result
         mock_gmail_service.users().messages().send.assert_called()
 
+    async def test_send_gmail_message_raw(self, mock_gmail_service, mock_get_service):
+        """Test the raw message carries headers and an 8bit UTF-8 body."""
+        send = mock_gmail_service.users().messages().send
+        send().execute.return_value = {"id": "raw123"}
+        send.reset_mock()
+
+        await send_gmail_message(
+            user_google_email="test@example.com",
+            to="recipient@example.com",
+            subject="Café",
+            body="<p>Grüße</p>",
+            cc="cc@example.com",
+            html=True,
+        )
+
+        raw = send.call_args.kwargs["body"]["raw"]
+        message = message_from_bytes(
+            base64.urlsafe_b64decode(raw), policy=policy.default
+        )
+        assert message["to"] == "recipient@example.com"
+        assert message["cc"] == "cc@example.com"
+        assert message["subject"] == "Café"
+        assert message.get_content_type() == "text/html"
+        assert message["Content-Transfer-Encoding"] == "8bit"
+        assert message.get_content().strip() == "<p>Grüße</p>"
+
     async def test_list_gmail_labels(self, mock_gmail_service, mock_get_service):
         """Test listing Gmail labels."""
         mock_gmail_service.users().labels().list().execute.return_value = {
@@ -185,6 +280,37 @@ class TestGmailTools:
         assert "User Labels:" in result
         assert "- Work" in result
 
+    async def test_list_gmail_labels_cached(self, mock_gmail_service, mock_get_service):
+        """Test labels are fetched once per user while cached."""
+        mock_gmail_service.users().labels().list().execute.return_value = {
+            "labels": [{"id": "INBOX", "name": "INBOX", "type": "system"}]
+        }
+        mock_gmail_service.users().labels().list.reset_mock()
+
+        first = await list_gmail_labels(user_google_email="test@example.com")
+        second = await list_gmail_labels(user_google_email="test@example.com")
+
+        assert first == second
+        assert mock_gmail_service.users().labels().list.call_count == 1
+
+    async def test_list_gmail_labels_coalesces_concurrent_calls(
+        self, mock_gmail_service, mock_get_service
+    ):
+        """Test concurrent cache misses share one upstream request."""
+        import asyncio
+
+        mock_gmail_service.users().labels().list().execute.return_value = {
+            "labels": [{"id": "Label_1", "name": "Work", "type": "user"}]
+        }
+        mock_gmail_service.users().labels().list.reset_mock()
+
+        results = await asyncio.gather(
+            *(list_gmail_labels(user_google_email="test@example.com") for _ in range(5))
+        )
+
+        assert all("Work" in r for r in results)
+        assert mock_gmail_service.users().labels().list.call_count == 1
+
     async def test_modify_gmail_labels_success(self, mock_gmail_service, mock_get_service):
         """Test adding and removing labels from a message."""
         mock_gmail_service.users().messages().modify().execute.return_value = {
@@ -210,6 +336,60 @@ class TestGmailTools:
             body={"addLabelIds": ["STARRED"], "removeLabelIds": ["UNREAD"]},
         )
 
+    async def test_modify_gmail_labels_single_request(
+        self, mock_gmail_service, mock_get_service
+    ):
+        """Test mark-read-and-archive is one modify request."""
+        modify = mock_gmail_service.users().messages().modify
+        modify.return_value.execute.return_value = {"id": "msg123", "labelIds": []}
+        modify.reset_mock()
+
+        await modify_gmail_labels(
+            user_google_email="test@example.com",
+            message_id="msg123",
+            remove_labels=["UNREAD", "INBOX"],
+        )
+
+        modify.assert_called_once_with(
+            userId="me",
+            id="msg123",
+            body={"removeLabelIds": ["UNREAD", "INBOX"]},
+        )
+        modify.return_value.execute.assert_called_once()
+
+    async def test_modify_gmail_labels_bulk_chunks(
+        self, mock_gmail_service, mock_get_service
+    ):
+        """Test bulk label changes use batchModify in 1000-ID chunks."""
+        batch_modify = mock_gmail_service.users().messages().batchModify
+        batch_modify.return_value.execute.return_value = {}
+        batch_modify.reset_mock()
+        ids = [f"msg{i}" for i in range(1500)]
+
+        result = await modify_gmail_labels_bulk(
+            user_google_email="test@example.com",
+            message_ids=ids,
+            add_labels=["STARRED"],
+            remove_labels=["UNREAD"],
+        )
+
+        assert "Modified 1500 messages" in result
+        bodies = [c.kwargs["body"] for c in batch_modify.call_args_list]
+        assert [len(b["ids"]) for b in bodies] == [1000, 500]
+        assert bodies[0]["addLabelIds"] == ["STARRED"]
+        assert bodies[1]["removeLabelIds"] == ["UNREAD"]
+
+    async def test_modify_gmail_labels_bulk_requires_changes(
+        self, mock_gmail_service, mock_get_service
+    ):
+        """Test bulk modify without labels makes no request."""
+        result = await modify_gmail_labels_bulk(
+            user_google_email="test@example.com", message_ids=["msg1"]
+        )
+
+        assert "No labels to modify" in result
+        mock_gmail_service.users().messages().batchModify().execute.assert_not_called()
+
     async def test_modify_gmail_labels_none(self, mock_gmail_service, mock_get_service):
         """Test calling modify labels without providing any labels."""
         result = await modify_gmail_labels(
@@ -217,3 +397,4 @@ class TestGmailTools:
         )
 
         assert "No labels to modify" in result
+        mock_gmail_service.users().messages().modify().execute.assert_not_called()
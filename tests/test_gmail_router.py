@@ -10,6 +10,7 @@ from google_automation_mcp.tools.gmail_router import (
     send_gmail_message,
     list_gmail_labels,
     modify_gmail_labels,
+    modify_gmail_labels_bulk,
 )
 
 
@@ -203,3 +204,19 @@ class TestGmailRouterTools:
 
         assert "No labels to modify" in result
         mock_call_router.assert_not_called()
+
+    async def test_modify_gmail_labels_bulk(self, mock_call_router):
+        mock_call_router.side_effect = [
+            {"message_id": "msg1", "added": [], "removed": ["UNREAD"]},
+            Exception("Message not found: msg2"),
+        ]
+
+        result = await modify_gmail_labels_bulk(
+            user_google_email="test@example.com",
+            message_ids=["msg1", "msg2"],
+            remove_labels=["UNREAD"],
+        )
+
+        assert "Modified 1 messages" in result
+        assert "msg2: Message not found" in result
+        assert mock_call_router.call_count == 2
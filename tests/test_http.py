@@ -0,0 +1,99 @@
+"""
+Unit tests for the pooled Google API HTTP transport.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+
+from google_automation_mcp.core.http import (
+    auth_request,
+    authorized_http,
+    get_thread_http,
+)
+
+
+class TestPooledHttp:
+    """Tests for per-thread connection reuse."""
+
+    def test_same_thread_reuses_http(self):
+        """Test every authorized wrapper on a thread shares one connection pool."""
+        first = authorized_http(Credentials(token="a"))
+        second = authorized_http(Credentials(token="b"))
+
+        assert first.connections is second.connections
+        assert get_thread_http() is get_thread_http()
+
+    def test_threads_get_separate_http(self):
+        """Test worker threads never share an httplib2.Http instance."""
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(get_thread_http()))
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not get_thread_http()
+
+    def test_auth_request_uses_thread_http(self):
+        """Test token refreshes go over the calling thread's pooled connection."""
+        http = MagicMock()
+        http.request.return_value = (httplib2.Response({"status": "200"}), b"{}")
+
+        with patch(
+            "google_automation_mcp.core.http.get_thread_http", return_value=http
+        ):
+            response = auth_request()(
+                "https://oauth2.googleapis.com/token", method="POST", body="x"
+            )
+
+        assert response.status == 200
+        assert http.request.call_args.args[0] == "https://oauth2.googleapis.com/token"
+
+
+class TestOrjsonModel:
+    """Tests for the orjson response model."""
+
+    def test_deserialize_matches_stdlib_model(self):
+        """Test orjson parsing returns what the default model would."""
+        pytest.importorskip("orjson")
+        from googleapiclient.model import JsonModel
+        from google_automation_mcp.core.json_model import OrjsonModel
+
+        for content in (b'{"files": [{"name": "Code"}]}', "[1, 2]", b"not json"):
+            assert OrjsonModel().deserialize(content) == JsonModel().deserialize(
+                content
+            )
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_bytes_and_loads_round_trip(self, use_orjson, monkeypatch):
+        """Test router JSON helpers agree with or without orjson."""
+        from google_automation_mcp.core import json_model
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(json_model, "orjson", None)
+
+        value = {"action": "search", "params": {"query": "Grüße", "limit": 5}}
+        encoded = json_model.dumps_bytes(value)
+
+        assert isinstance(encoded, bytes)
+        assert json_model.loads(encoded) == value
+        assert json_model.loads(encoded.decode("utf-8")) == value
+
+    def test_orjson_can_be_disabled(self, monkeypatch):
+        """Test APPSCRIPT_MCP_ORJSON=false falls back to googleapiclient's model."""
+        import importlib
+
+        from google_automation_mcp.core import json_model
+
+        monkeypatch.setenv("APPSCRIPT_MCP_ORJSON", "false")
+        try:
+            importlib.reload(json_model)
+            assert json_model.get_json_model() is None
+            assert json_model.loads(json_model.dumps_bytes([1, "a"])) == [1, "a"]
+        finally:
+            monkeypatch.delenv("APPSCRIPT_MCP_ORJSON")
+            importlib.reload(json_model)
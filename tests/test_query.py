@@ -0,0 +1,37 @@
+"""
+Unit tests for Drive query helpers.
+"""
+
+from google_automation_mcp.core.query import is_structured_query, quote_literal
+
+
+class TestQuoteLiteral:
+    """Tests for quote_literal."""
+
+    def test_plain_text(self):
+        """Test plain text is only wrapped in quotes."""
+        assert quote_literal("budget 2024") == "'budget 2024'"
+
+    def test_escapes_quotes_and_backslashes(self):
+        """Test backslashes are escaped before quotes."""
+        assert quote_literal("Bob's C:\\notes") == "'Bob\\'s C:\\\\notes'"
+
+
+class TestIsStructuredQuery:
+    """Tests for is_structured_query."""
+
+    def test_operators(self):
+        """Test Drive operators are detected case-insensitively."""
+        assert is_structured_query("name CONTAINS 'x'")
+        assert is_structured_query("'root' in parents")
+        assert is_structured_query("modifiedTime > '2024-01-01'")
+        assert is_structured_query("name contains'x'")
+
+    def test_plain_text(self):
+        """Test plain search terms are not treated as queries."""
+        assert not is_structured_query("quarterly report")
+
+    def test_operator_words_inside_other_words(self):
+        """Test operator names only count as whole words."""
+        assert not is_structured_query("HashMap containsKey notes")
+        assert not is_structured_query("shipping containers")
@@ -1,8 +1,10 @@
 """Tests for the router client and deployer."""
 
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, AsyncMock, MagicMock
-from urllib.error import URLError, HTTPError
+import httplib2
 import pytest
 
 from google_automation_mcp.router.client import call_router, RouterError
@@ -27,6 +29,43 @@ from google_automation_mcp.router.deployer import (
 # =============================================================================
 
 
+@pytest.fixture
+def redirecting_router():
+    """Local server that answers POSTs like Apps Script: 302 to the result."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            requests.append(("POST", self.path))
+            self.send_response(302)
+            self.send_header("Location", "/result")
+            self.send_header("Content-Type", "text/html")
+            body = b"<HTML>Moved Temporarily</HTML>"
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            requests.append(("GET", self.path))
+            body = json.dumps({"result": [{"id": "1"}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/exec", requests
+    server.shutdown()
+    server.server_close()
+
+
 class TestRouterClient:
     @pytest.mark.asyncio
     async def test_call_router_success(self):
@@ -41,17 +80,25 @@ class TestRouterClient:
             new_callable=AsyncMock,
             return_value=mock_state,
         ), patch(
-            "google_automation_mcp.router.client.urlopen",
-        ) as mock_urlopen:
-            mock_resp = MagicMock()
-            mock_resp.read.return_value = mock_response.encode()
-            mock_resp.__enter__ = MagicMock(return_value=mock_resp)
-            mock_resp.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_resp
+            "google_automation_mcp.router.client._get_http",
+        ) as mock_get_http:
+            mock_get_http.return_value.request.return_value = (
+                httplib2.Response({"status": "200"}),
+                mock_response.encode(),
+            )
 
             result = await call_router("t@t.com", "list_drive", {"folder_id": "root"})
             assert result == [{"id": "1", "name": "test"}]
 
+            args, kwargs = mock_get_http.return_value.request.call_args
+            assert args == ("https://script.google.com/macros/s/test/exec",)
+            assert kwargs["method"] == "POST"
+            assert json.loads(kwargs["body"]) == {
+                "secret": "test-secret",
+                "action": "list_drive",
+                "params": {"folder_id": "root"},
+            }
+
     @pytest.mark.asyncio
     async def test_call_router_error_response(self):
         mock_state = {
@@ -65,13 +112,12 @@ class TestRouterClient:
             new_callable=AsyncMock,
             return_value=mock_state,
         ), patch(
-            "google_automation_mcp.router.client.urlopen",
-        ) as mock_urlopen:
-            mock_resp = MagicMock()
-            mock_resp.read.return_value = mock_response.encode()
-            mock_resp.__enter__ = MagicMock(return_value=mock_resp)
-            mock_resp.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_resp
+            "google_automation_mcp.router.client._get_http",
+        ) as mock_get_http:
+            mock_get_http.return_value.request.return_value = (
+                httplib2.Response({"status": "200"}),
+                mock_response.encode(),
+            )
 
             with pytest.raises(RouterError, match="not found"):
                 await call_router("t@t.com", "bad_action", {})
@@ -88,12 +134,12 @@ class TestRouterClient:
             new_callable=AsyncMock,
             return_value=mock_state,
         ), patch(
-            "google_automation_mcp.router.client.urlopen",
-        ) as mock_urlopen:
-            err = HTTPError(
-                "https://...", 403, "Forbidden", {}, MagicMock(read=lambda: b"denied")
+            "google_automation_mcp.router.client._get_http",
+        ) as mock_get_http:
+            mock_get_http.return_value.request.return_value = (
+                httplib2.Response({"status": "403"}),
+                b"denied",
             )
-            mock_urlopen.side_effect = err
 
             with pytest.raises(RouterError, match="HTTP 403"):
                 await call_router("t@t.com", "test", {})
@@ -110,13 +156,38 @@ class TestRouterClient:
             new_callable=AsyncMock,
             return_value=mock_state,
         ), patch(
-            "google_automation_mcp.router.client.urlopen",
-        ) as mock_urlopen:
-            mock_urlopen.side_effect = URLError("timeout")
+            "google_automation_mcp.router.client._get_http",
+        ) as mock_get_http:
+            mock_get_http.return_value.request.side_effect = TimeoutError("timed out")
 
             with pytest.raises(RouterError, match="Connection error"):
                 await call_router("t@t.com", "test", {})
 
+    @pytest.mark.asyncio
+    async def test_call_router_follows_post_redirect(self, redirecting_router):
+        """Test the router's 302 after the POST is followed to the result."""
+        url, requests = redirecting_router
+        mock_state = {"web_app_url": url, "secret": "test-secret"}
+
+        with patch(
+            "google_automation_mcp.router.client.ensure_router_deployed",
+            new_callable=AsyncMock,
+            return_value=mock_state,
+        ):
+            result = await call_router("t@t.com", "list_drive", {"folder_id": "root"})
+
+        assert result == [{"id": "1"}]
+        assert requests == [("POST", "/exec"), ("GET", "/result")]
+
+    def test_connection_pool_per_thread(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from google_automation_mcp.router.client import _get_http
+
+        assert _get_http() is _get_http()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(_get_http).result()
+        assert other is not _get_http()
+
 
 # =============================================================================
 # Router Deployer Tests
@@ -167,6 +238,23 @@ class TestDeployerApiCalls:
         result = await _create_script_project("Test")
         assert result == "new-script-id"
 
+    @pytest.mark.asyncio
+    async def test_service_resolved_off_event_loop(self):
+        threads = []
+
+        def fake_service():
+            threads.append(threading.get_ident())
+            service = MagicMock()
+            service.projects().create().execute.return_value = {"scriptId": "s1"}
+            return service
+
+        with patch(
+            "google_automation_mcp.router.deployer.get_script_service", fake_service
+        ):
+            assert await _create_script_project("Test") == "s1"
+
+        assert threads and threading.get_ident() not in threads
+
     @pytest.mark.asyncio
     async def test_create_script_project_api_disabled(self, mock_script_service):
         from googleapiclient.errors import HttpError
@@ -184,6 +272,21 @@ class TestDeployerApiCalls:
         await _upload_script_content("script-id", "secret-token")
         mock_script_service.projects().updateContent.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_upload_script_content_evicts_cached_project(
+        self, mock_script_service
+    ):
+        from google_automation_mcp.appscript_tools import _project_cache
+
+        _project_cache.set(("t@t.com", "script-id"), MagicMock())
+        _project_cache.set(("t@t.com", "other-id"), MagicMock())
+        mock_script_service.projects().updateContent().execute.return_value = {}
+
+        await _upload_script_content("script-id", "secret-token")
+
+        assert ("t@t.com", "script-id") not in _project_cache
+        assert ("t@t.com", "other-id") in _project_cache
+
     @pytest.mark.asyncio
     async def test_create_version(self, mock_script_service):
         mock_script_service.projects().versions().create().execute.return_value = {
@@ -0,0 +1,94 @@
+"""
+Unit tests for MCP tool registration.
+"""
+
+import inspect
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from google_automation_mcp import appscript_tools, tools
+from google_automation_mcp.server import mcp
+
+# Placeholder values for a tool's required parameters, by annotation
+_REQUIRED_ARGS = {str: "x", int: 1, list: ["x"]}
+
+
+class TestToolResults:
+    """Tests that tool text reaches MCP clients as-is."""
+
+    @pytest.mark.asyncio
+    async def test_tools_have_no_output_schema(self):
+        """Test no tool asks MCP to wrap its text in structured content."""
+        tools = await mcp.list_tools()
+
+        assert tools
+        assert [tool.name for tool in tools if tool.output_schema is not None] == []
+
+    @pytest.mark.asyncio
+    async def test_text_returned_as_single_content_block(self):
+        """Test a tool's string becomes one text block with nothing re-encoded."""
+        text = "Found 1 labels:\n- INBOX"
+        with patch(
+            "google_automation_mcp.tools.list_gmail_labels",
+            AsyncMock(return_value=text),
+        ):
+            result = await mcp.call_tool(
+                "list_gmail_labels_tool", {"user_google_email": "user@gmail.com"}
+            )
+
+        assert [block.text for block in result.content] == [text]
+        assert result.structured_content is None
+
+    @pytest.mark.asyncio
+    async def test_omitted_optional_fields_reach_tools_as_none(self):
+        """Test empty optional strings mean "leave unchanged", not "clear"."""
+        update_event = AsyncMock(return_value="Updated")
+        with patch("google_automation_mcp.tools.update_event", update_event):
+            await mcp.call_tool(
+                "update_event_tool",
+                {
+                    "user_google_email": "user@gmail.com",
+                    "event_id": "evt1",
+                    "summary": "Standup",
+                },
+            )
+
+        kwargs = update_event.call_args.kwargs
+        assert kwargs["summary"] == "Standup"
+        assert kwargs["description"] is None
+        assert kwargs["location"] is None
+        assert kwargs["attendees"] is None
+
+
+class TestToolWrappers:
+    """Tests that every registered wrapper reaches its implementation."""
+
+    @pytest.mark.asyncio
+    async def test_every_wrapper_calls_its_tool(self):
+        """Test each wrapper's deferred import resolves and its result is returned."""
+        implementations = {
+            name: AsyncMock(return_value=f"{name} result") for name in tools.__all__
+        }
+        generate_trigger_code = AsyncMock(return_value="trigger code")
+
+        with (
+            patch.multiple(tools, **implementations),
+            patch.object(
+                appscript_tools, "generate_trigger_code", generate_trigger_code
+            ),
+        ):
+            for listed in await mcp.list_tools():
+                fn = (await mcp.get_tool(listed.name)).fn
+                kwargs = {
+                    name: _REQUIRED_ARGS[param.annotation]
+                    for name, param in inspect.signature(fn).parameters.items()
+                    if param.default is inspect.Parameter.empty
+                }
+
+                result = await fn(**kwargs)
+
+                assert result in {
+                    "trigger code",
+                    *(f"{name} result" for name in implementations),
+                }, listed.name
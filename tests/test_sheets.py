@@ -4,6 +4,8 @@ Unit tests for Google Sheets MCP tools
 Tests all Sheets tools with mocked API responses.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -94,6 +96,90 @@ class TestGetSheetValues:
         assert "Row 2: Alice | Admin" in result
         assert "Row 3: Bob | User" in result
 
+    @pytest.mark.asyncio
+    async def test_get_values_unformatted(self, mock_service, mock_get_service):
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            "values": [["Total", 42, 1.5, True]]
+        }
+
+        result = await get_sheet_values(
+            user_google_email="user@gmail.com",
+            spreadsheet_id="id123",
+            range="A1:D1",
+            value_render="UNFORMATTED_VALUE",
+        )
+
+        assert "Row 1: Total | 42 | 1.5 | True" in result
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_use_one_batch_get(
+        self, mock_service, mock_get_service
+    ):
+        values_api = mock_service.spreadsheets().values()
+        values_api.batchGet().execute.return_value = {
+            "valueRanges": [
+                {"range": "Sheet1!A1:A2", "values": [["a1"], ["a2"]]},
+                {"range": "Sheet2!B1", "values": [["b1"]]},
+            ]
+        }
+        values_api.batchGet.reset_mock()
+
+        first, second = await asyncio.gather(
+            get_sheet_values(
+                user_google_email="user@gmail.com",
+                spreadsheet_id="id123",
+                range="Sheet1!A1:A2",
+            ),
+            get_sheet_values(
+                user_google_email="user@gmail.com",
+                spreadsheet_id="id123",
+                range="Sheet2!B1",
+            ),
+        )
+
+        assert "Row 2: a2" in first
+        assert "Range: Sheet2!B1" in second
+        assert "Row 1: b1" in second
+        values_api.batchGet.assert_called_once_with(
+            spreadsheetId="id123",
+            ranges=["Sheet1!A1:A2", "Sheet2!B1"],
+            valueRenderOption="FORMATTED_VALUE",
+        )
+        values_api.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_get_retries_ranges_separately(
+        self, mock_service, mock_get_service
+    ):
+        values_api = mock_service.spreadsheets().values()
+        values_api.batchGet().execute.side_effect = Exception("Unable to parse range")
+
+        def get(spreadsheetId, range, valueRenderOption):
+            request = MagicMock()
+            if range == "Bad!":
+                request.execute.side_effect = Exception("Unable to parse range")
+            else:
+                request.execute.return_value = {"values": [["ok"]]}
+            return request
+
+        values_api.get.side_effect = get
+
+        good, bad = await asyncio.gather(
+            get_sheet_values(
+                user_google_email="user@gmail.com",
+                spreadsheet_id="id123",
+                range="Sheet1!A1",
+            ),
+            get_sheet_values(
+                user_google_email="user@gmail.com",
+                spreadsheet_id="id123",
+                range="Bad!",
+            ),
+        )
+
+        assert "Row 1: ok" in good
+        assert "Unable to parse range" in bad
+
 
 class TestUpdateSheetValues:
     """Tests for update_sheet_values tool."""
@@ -121,6 +207,48 @@ class TestUpdateSheetValues:
         assert "Rows updated: 2" in result
         assert "Range: Sheet1!A1:B2" in result
 
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_use_one_batch_update(
+        self, mock_service, mock_get_service
+    ):
+        values_api = mock_service.spreadsheets().values()
+        values_api.batchUpdate().execute.return_value = {
+            "responses": [
+                {"updatedRange": "Sheet1!A1", "updatedCells": 1, "updatedRows": 1},
+                {"updatedRange": "Sheet1!C3:D3", "updatedCells": 2, "updatedRows": 1},
+            ]
+        }
+        values_api.batchUpdate.reset_mock()
+
+        first, second = await asyncio.gather(
+            update_sheet_values(
+                user_google_email="user@gmail.com",
+                spreadsheet_id="id123",
+                range="Sheet1!A1",
+                values=[["x"]],
+            ),
+            update_sheet_values(
+                user_google_email="user@gmail.com",
+                spreadsheet_id="id123",
+                range="Sheet1!C3:D3",
+                values=[["y", "z"]],
+            ),
+        )
+
+        assert "Range: Sheet1!A1\n" in first
+        assert "Cells updated: 2" in second
+        values_api.batchUpdate.assert_called_once_with(
+            spreadsheetId="id123",
+            body={
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {"range": "Sheet1!A1", "values": [["x"]]},
+                    {"range": "Sheet1!C3:D3", "values": [["y", "z"]]},
+                ],
+            },
+        )
+        values_api.update.assert_not_called()
+
 
 class TestCreateSpreadsheet:
     """Tests for create_spreadsheet tool."""
@@ -202,3 +330,30 @@ class TestGetSpreadsheetMetadata:
         assert "Spreadsheet: Company Metrics" in result
         assert "Sheets (1):" in result
         assert "Q1 (ID: 0, Rows: 100, Cols: 10)" in result
+
+    @pytest.mark.asyncio
+    async def test_metadata_refreshed_after_append(
+        self, mock_service, mock_get_service
+    ):
+        get_request = mock_service.spreadsheets().get()
+        get_request.execute.return_value = {"properties": {"title": "Log"}}
+        mock_service.spreadsheets().values().append().execute.return_value = {}
+
+        await get_spreadsheet_metadata(
+            user_google_email="user@gmail.com", spreadsheet_id="id123"
+        )
+        await get_spreadsheet_metadata(
+            user_google_email="user@gmail.com", spreadsheet_id="id123"
+        )
+        assert get_request.execute.call_count == 1
+
+        await append_sheet_values(
+            user_google_email="user@gmail.com",
+            spreadsheet_id="id123",
+            range="Sheet1",
+            values=[["x"]],
+        )
+        await get_spreadsheet_metadata(
+            user_google_email="user@gmail.com", spreadsheet_id="id123"
+        )
+        assert get_request.execute.call_count == 2
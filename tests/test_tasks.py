@@ -1,5 +1,4 @@
 import pytest
-import asyncio
 from unittest.mock import MagicMock, patch
 from google_automation_mcp.tools.tasks import (
     list_task_lists,
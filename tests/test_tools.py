@@ -4,8 +4,13 @@ Unit tests for Apps Script MCP tools
 Tests all tools with mocked API responses.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch
+from googleapiclient.errors import HttpError
+
+from .conftest import FakeBatch
 
 
 @pytest.fixture
@@ -66,6 +71,60 @@ class TestListScriptProjects:
             assert "No Apps Script projects found" in result
 
 
+class TestListScriptProjectsWithDetails:
+    """Tests for list_script_projects_with_details."""
+
+    @pytest.mark.asyncio
+    async def test_list_with_details_batches_project_lookups(
+        self, mock_drive_service, mock_script_service
+    ):
+        """Test project details are fetched in one batch."""
+        mock_drive_service.files().list().execute.return_value = {
+            "files": [
+                {"id": "a1", "name": "Alpha", "modifiedTime": "2026-01-12"},
+                {"id": "b2", "name": "Beta", "modifiedTime": "2026-01-13"},
+            ]
+        }
+        mock_script_service.projects().getContent().execute.return_value = {
+            "files": [{"name": "Code", "type": "SERVER_JS"}]
+        }
+        batches = []
+
+        def new_batch(callback):
+            batch = FakeBatch(callback)
+            batches.append(batch)
+            return batch
+
+        mock_script_service.new_batch_http_request.side_effect = new_batch
+
+        with (
+            patch(
+                "google_automation_mcp.appscript_tools.get_drive_service",
+                return_value=mock_drive_service,
+            ),
+            patch(
+                "google_automation_mcp.appscript_tools.get_script_service",
+                return_value=mock_script_service,
+            ),
+        ):
+            from google_automation_mcp.appscript_tools import (
+                list_script_projects_with_details,
+            )
+
+            result = await list_script_projects_with_details()
+
+            assert len(batches) == 1
+            assert len(batches[0].requests) == 2
+            assert "Alpha (ID: a1)" in result
+            assert "Beta (ID: b2)" in result
+            assert "Code (SERVER_JS)" in result
+            # Project resources carry no files; they come from getContent
+            mock_script_service.projects().get.assert_not_called()
+            mock_script_service.projects().getContent.assert_called_with(
+                scriptId="b2", fields="files(name,type)"
+            )
+
+
 class TestGetScriptProject:
     """Tests for get_script_project."""
 
@@ -78,15 +137,11 @@ class TestGetScriptProject:
             "creator": {"email": "creator@example.com"},
             "createTime": "2025-01-10T10:00:00Z",
             "updateTime": "2026-01-12T15:30:00Z",
-            "files": [
-                {
-                    "name": "Code",
-                    "type": "SERVER_JS",
-                    "source": "function test() { return 'hello'; }",
-                }
-            ],
         }
         mock_script_service.projects().get().execute.return_value = mock_response
+        mock_script_service.projects().getContent().execute.return_value = {
+            "files": [{"name": "Code", "type": "SERVER_JS"}]
+        }
 
         with patch(
             "google_automation_mcp.appscript_tools.get_script_service",
@@ -100,6 +155,180 @@ class TestGetScriptProject:
             assert "creator@example.com" in result
             assert "Code" in result
 
+    @pytest.mark.asyncio
+    async def test_get_project_omits_sources(self, mock_script_service):
+        """Test the summary view requests only file names and types."""
+        mock_script_service.projects().get().execute.return_value = {
+            "title": "Test Project"
+        }
+        mock_script_service.projects().getContent().execute.return_value = {
+            "files": [{"name": "Code", "type": "SERVER_JS"}]
+        }
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import get_script_project
+
+            result = await get_script_project("test123")
+
+            _, kwargs = mock_script_service.projects().get.call_args
+            assert "files" not in kwargs["fields"]
+            _, kwargs = mock_script_service.projects().getContent.call_args
+            assert kwargs["fields"] == "files(name,type)"
+            assert "1. Code (SERVER_JS)" in result
+            assert "get_script_content" in result
+
+
+class TestProjectCache:
+    """Tests for the cached project fetch shared by project tools."""
+
+    @pytest.mark.asyncio
+    async def test_content_reuses_cached_project(self, mock_script_service):
+        """Test repeated reads of one project fetch it once."""
+        mock_script_service.projects().getContent().execute.return_value = {
+            "files": [
+                {"name": "Code", "type": "SERVER_JS", "source": "function a() {}"},
+                {"name": "Util", "type": "SERVER_JS", "source": "function b() {}"},
+            ]
+        }
+        mock_script_service.projects().getContent().execute.reset_mock()
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import get_script_content
+
+            code = await get_script_content("test123", "Code")
+            util = await get_script_content("test123", "Util")
+
+            assert "function a() {}" in code
+            assert "function b() {}" in util
+            assert mock_script_service.projects().getContent().execute.call_count == 1
+            # Sources live in the Content resource, not the Project one
+            mock_script_service.projects().get.assert_not_called()
+            mock_script_service.projects().getContent.assert_any_call(
+                scriptId="test123", fields="files(name,type,source)"
+            )
+
+    @pytest.mark.asyncio
+    async def test_project_reuses_cached_file_list(self, mock_script_service):
+        """Test get_script_project takes files from a cached content fetch."""
+        mock_script_service.projects().get().execute.return_value = {
+            "title": "Test Project"
+        }
+        mock_script_service.projects().getContent().execute.return_value = {
+            "files": [
+                {"name": "Code", "type": "SERVER_JS", "source": "function a() {}"},
+                {"name": "Util", "type": "SERVER_JS", "source": "function b() {}"},
+            ]
+        }
+        mock_script_service.projects().getContent().execute.reset_mock()
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import (
+                get_script_content,
+                get_script_project,
+            )
+
+            await get_script_content("test123", "Code")
+            project = await get_script_project("test123")
+
+            assert "Project: Test Project" in project
+            assert "2. Util (SERVER_JS)" in project
+            assert mock_script_service.projects().getContent().execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_content_is_per_user(self, mock_script_service):
+        """Test a change of default user does not serve the old user's files."""
+        content = mock_script_service.projects().getContent().execute
+        content.side_effect = [
+            {"files": [{"name": "Code", "type": "SERVER_JS", "source": "mine"}]},
+            {"files": [{"name": "Code", "type": "SERVER_JS", "source": "theirs"}]},
+        ]
+
+        with (
+            patch(
+                "google_automation_mcp.appscript_tools.get_script_service",
+                return_value=mock_script_service,
+            ),
+            patch(
+                "google_automation_mcp.appscript_tools._resolve_default_user",
+                side_effect=["a@example.com", "b@example.com"],
+            ),
+        ):
+            from google_automation_mcp.appscript_tools import get_script_content
+
+            assert "mine" in await get_script_content("test123", "Code")
+            assert "theirs" in await get_script_content("test123", "Code")
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_cached_project(self, mock_script_service):
+        """Test updating content forces the next read to refetch."""
+        mock_script_service.projects().getContent().execute.return_value = {
+            "files": [{"name": "Code", "type": "SERVER_JS", "source": "old"}]
+        }
+        mock_script_service.projects().updateContent().execute.return_value = {
+            "files": [{"name": "Code", "type": "SERVER_JS"}]
+        }
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import (
+                get_script_content,
+                update_script_content,
+            )
+
+            assert "old" in await get_script_content("test123", "Code")
+
+            mock_script_service.projects().getContent().execute.return_value = {
+                "files": [{"name": "Code", "type": "SERVER_JS", "source": "new"}]
+            }
+            await update_script_content(
+                "test123", [{"name": "Code", "type": "SERVER_JS", "source": "new"}]
+            )
+
+            assert "new" in await get_script_content("test123", "Code")
+
+
+class TestBulkGetScriptContents:
+    """Tests for bulk_get_script_contents."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_reads_files_from_one_fetch(self, mock_script_service):
+        """Test several files come from a single project fetch."""
+        mock_script_service.projects().getContent().execute.return_value = {
+            "files": [
+                {"name": "Code", "type": "SERVER_JS", "source": "function a() {}"},
+                {"name": "Page", "type": "HTML", "source": "<p>hi</p>"},
+            ]
+        }
+        mock_script_service.projects().getContent().execute.reset_mock()
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import (
+                bulk_get_script_contents,
+            )
+
+            result = await bulk_get_script_contents(
+                "test123", ["Page", "Code", "Missing"]
+            )
+
+            assert result.index("File: Page (HTML)") < result.index("File: Code")
+            assert "function a() {}" in result
+            assert "Not found in project test123: Missing" in result
+            assert mock_script_service.projects().getContent().execute.call_count == 1
+
 
 class TestCreateScriptProject:
     """Tests for create_script_project."""
@@ -147,6 +376,77 @@ class TestUpdateScriptContent:
             assert "Updated script project: test123" in result
             assert "Code" in result
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("flush_immediately", [True, False])
+    async def test_update_content_permission_denied(
+        self, mock_script_service, flush_immediately
+    ):
+        """Test a 403 is reported as such on both the direct and queued paths."""
+        mock_script_service.projects().updateContent().execute.side_effect = HttpError(
+            Mock(status=403, reason="Forbidden"), b"forbidden"
+        )
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import update_script_content
+
+            result = await update_script_content(
+                "test123",
+                [{"name": "Code", "type": "SERVER_JS", "source": "v1"}],
+                flush_immediately=flush_immediately,
+            )
+
+            assert result.startswith("Permission denied:")
+
+
+class TestCoalescedUpdates:
+    """Tests for update_script_content(flush_immediately=False)."""
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_share_one_request(self, mock_script_service):
+        """Test concurrent queued updates merge into one updateContent call."""
+        update = mock_script_service.projects().updateContent
+        update.return_value.execute.return_value = {
+            "files": [
+                {"name": "Code", "type": "SERVER_JS"},
+                {"name": "Util", "type": "SERVER_JS"},
+            ]
+        }
+        update.reset_mock()
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import update_script_content
+
+            first, second = await asyncio.gather(
+                update_script_content(
+                    "test123",
+                    [{"name": "Code", "type": "SERVER_JS", "source": "v1"}],
+                    flush_immediately=False,
+                ),
+                update_script_content(
+                    "test123",
+                    [
+                        {"name": "Code", "type": "SERVER_JS", "source": "v2"},
+                        {"name": "Util", "type": "SERVER_JS", "source": "u"},
+                    ],
+                    flush_immediately=False,
+                ),
+            )
+
+            assert first == second
+            assert "- Util (SERVER_JS)" in first
+            update.assert_called_once()
+            sent = update.call_args.kwargs["body"]["files"]
+            assert [(f["name"], f["source"]) for f in sent] == [
+                ("Code", "v2"),
+                ("Util", "u"),
+            ]
+
 
 class TestRunScriptFunction:
     """Tests for run_script_function."""
@@ -168,6 +468,24 @@ class TestRunScriptFunction:
             assert "Execution successful" in result
             assert "myFunction" in result
 
+    @pytest.mark.asyncio
+    async def test_run_function_script_error(self, mock_script_service):
+        """Test a script-side error is reported as a failed execution."""
+        mock_script_service.scripts().run().execute.return_value = {
+            "error": {"message": "ReferenceError: x is not defined"}
+        }
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import run_script_function
+
+            result = await run_script_function("test123", "myFunction")
+
+            assert result.startswith("Execution failed")
+            assert "ReferenceError: x is not defined" in result
+
 
 class TestCreateDeployment:
     """Tests for create_deployment."""
@@ -202,6 +520,82 @@ class TestCreateDeployment:
             assert "Test deployment" in result
             assert "Version: 1" in result
 
+    @pytest.mark.asyncio
+    async def test_create_deployment_existing_version(self, mock_script_service):
+        """Test deploying an existing version skips version creation."""
+        mock_script_service.projects().deployments().create().execute.return_value = {
+            "deploymentId": "deploy456",
+        }
+        mock_script_service.projects().versions().create.reset_mock()
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import create_deployment
+
+            result = await create_deployment("test123", "Redeploy", version_number=3)
+
+            assert "Deployment ID: deploy456" in result
+            assert "Version: 3" in result
+            mock_script_service.projects().versions().create.assert_not_called()
+
+
+class TestCreateDeploymentsBulk:
+    """Tests for create_deployments_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_deploys_every_script(self, mock_script_service):
+        """Test each script gets a deployment, reported in input order."""
+        mock_script_service.projects().versions().create().execute.return_value = {
+            "versionNumber": 2
+        }
+        mock_script_service.projects().deployments().create().execute.return_value = {
+            "deploymentId": "deploy123"
+        }
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import create_deployments_bulk
+
+            result = await create_deployments_bulk(["s1", "s2", "s3"], "Release")
+
+            assert "Deployment results for 3 scripts" in result
+            assert result.index("[s1]") < result.index("[s2]") < result.index("[s3]")
+            assert result.count("Deployment ID: deploy123") == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_reports_individual_failures(self, mock_script_service):
+        """Test one failing script does not abort the others."""
+
+        def create_deployment(scriptId, body):
+            request = Mock()
+            if scriptId == "bad":
+                request.execute.side_effect = Exception("quota exceeded")
+            else:
+                request.execute.return_value = {"deploymentId": f"d-{scriptId}"}
+            return request
+
+        mock_script_service.projects().versions().create().execute.return_value = {
+            "versionNumber": 1
+        }
+        mock_script_service.projects().deployments().create.side_effect = (
+            create_deployment
+        )
+
+        with patch(
+            "google_automation_mcp.appscript_tools.get_script_service",
+            return_value=mock_script_service,
+        ):
+            from google_automation_mcp.appscript_tools import create_deployments_bulk
+
+            result = await create_deployments_bulk(["good", "bad"], "Release")
+
+            assert "Deployment ID: d-good" in result
+            assert "Error: quota exceeded" in result
+
 
 class TestListDeployments:
     """Tests for list_deployments."""
@@ -213,7 +607,7 @@ class TestListDeployments:
             "deployments": [
                 {
                     "deploymentId": "deploy123",
-                    "description": "Production",
+                    "deploymentConfig": {"description": "Production"},
                     "updateTime": "2026-01-12T15:30:00Z",
                 }
             ]
@@ -281,3 +675,29 @@ class TestListScriptProcesses:
 
             assert "myFunction" in result
             assert "COMPLETED" in result
+
+
+class TestGenerateTriggerCode:
+    """Tests for generate_trigger_code."""
+
+    @pytest.mark.asyncio
+    async def test_time_weekly_normalizes_day(self):
+        """Test weekly schedules accept any case and emit the enum name."""
+        from google_automation_mcp.appscript_tools import generate_trigger_code
+
+        result = await generate_trigger_code("TIME_WEEKLY", "report", "friday")
+
+        assert "function setupTrigger_report()" in result
+        assert ".onWeekDay(ScriptApp.WeekDay.FRIDAY)" in result
+
+    @pytest.mark.asyncio
+    async def test_invalid_schedule_and_type(self):
+        """Test invalid schedules and unknown trigger types return errors."""
+        from google_automation_mcp.appscript_tools import generate_trigger_code
+
+        minutes = await generate_trigger_code("time_minutes", "tick", "7")
+        unknown = await generate_trigger_code("hourly", "tick")
+
+        assert minutes.startswith("Error: time_minutes schedule must be one of")
+        assert unknown.startswith("Error: Unknown trigger_type 'hourly'")
+        assert "on_change" in unknown
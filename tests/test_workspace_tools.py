@@ -4,9 +4,15 @@ Unit tests for Google Workspace MCP tools
 Tests Gmail, Drive, Sheets, Calendar, and Docs tools with mocked API responses.
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import Mock, patch
 
+from .conftest import FakeBatch
+
 
 # Patch target for all service injections
 SERVICE_PATCH = "google_automation_mcp.auth.service_adapter.get_service_for_user"
@@ -38,6 +44,7 @@ class TestSearchGmailMessages:
             },
             "snippet": "This is a test message preview",
         }
+        mock_service.new_batch_http_request.side_effect = FakeBatch
 
         with patch(SERVICE_PATCH, return_value=mock_service):
             from google_automation_mcp.tools.gmail import search_gmail_messages
@@ -661,3 +668,34 @@ class TestAppendDocText:
 
             assert "Appended text to document" in result
             assert "doc123" in result
+
+
+class TestToolsPackage:
+    """Tests for tool lookup through the tools package."""
+
+    def test_families_load_on_first_use(self):
+        """Test importing the package loads no tool family until one is used."""
+        code = (
+            "import sys\n"
+            "import google_automation_mcp.tools as tools\n"
+            "print('google_automation_mcp.tools.calendar' in sys.modules)\n"
+            "tools.get_events\n"
+            "print('google_automation_mcp.tools.calendar' in sys.modules)\n"
+            "print('google_automation_mcp.tools.gmail' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, MCP_USE_ROUTER="false"),
+            check=True,
+        )
+
+        assert result.stdout.split() == ["False", "True", "False"]
+
+    def test_every_exported_tool_resolves(self):
+        """Test each name in __all__ can be looked up."""
+        from google_automation_mcp import tools
+
+        for name in tools.__all__:
+            assert callable(getattr(tools, name))